@@ -1,5 +1,6 @@
 from django.contrib import admin
 
+from epic_app.admin_models.data_version_admin import DataVersionAdmin
 from epic_app.admin_models.generate_entity_admin import EpicOrganizationAdmin, LnkAdmin
 from epic_app.admin_models.import_entity_admin import (
     AgencyAdmin,
@@ -21,18 +22,20 @@ from epic_app.models.epic_questions import (
 )
 from epic_app.models.epic_user import EpicOrganization, EpicUser
 from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.models.report_job import ReportJob
 
 # Models exposed to the admin page .
-admin.site.register(EpicUser)
+admin.site.register(EpicUser, DataVersionAdmin)
 admin.site.register(EpicOrganization, EpicOrganizationAdmin)
 admin.site.register(Area, AreaAdmin)
 admin.site.register(Agency, AgencyAdmin)
-admin.site.register(Group)
-admin.site.register(Program)
+admin.site.register(Group, DataVersionAdmin)
+admin.site.register(Program, DataVersionAdmin)
 admin.site.register(NationalFrameworkQuestion, NfqAdmin)
 admin.site.register(KeyAgencyActionsQuestion, KaaAdmin)
 admin.site.register(EvolutionQuestion, EvoAdmin)
 admin.site.register(LinkagesQuestion, LnkAdmin)
-admin.site.register(AgreementAnswer)
-admin.site.register(EvolutionAnswer)
-admin.site.register(MultipleChoiceAnswer)
+admin.site.register(AgreementAnswer, DataVersionAdmin)
+admin.site.register(EvolutionAnswer, DataVersionAdmin)
+admin.site.register(MultipleChoiceAnswer, DataVersionAdmin)
+admin.site.register(ReportJob)
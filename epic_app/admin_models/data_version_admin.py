@@ -0,0 +1,15 @@
+from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
+
+from epic_app.signals import renew_deleted_data_version
+
+
+class DataVersionAdmin(admin.ModelAdmin):
+    """
+    Model admin renewing the data version of its model after deleting a selection, which is not renewed row by row.
+    """
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet):
+        super().delete_queryset(request, queryset)
+        renew_deleted_data_version(queryset.model)
@@ -10,11 +10,13 @@ from django.http import HttpRequest
 from django.shortcuts import redirect, render
 from django.urls import path
 
+from epic_app.admin_models.data_version_admin import DataVersionAdmin
 from epic_app.models.epic_questions import LinkagesQuestion
 from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.signals import renew_deleted_data_version
 
 
-class GenerateEntityAdmin(admin.ModelAdmin):
+class GenerateEntityAdmin(DataVersionAdmin):
     # Admin pages.
     change_list_template = "generate_changelist.html"
 
@@ -36,15 +38,19 @@ class GenerateEntityAdmin(admin.ModelAdmin):
         raise NotImplementedError("Implement in concrete classes.")
 
 
-class LnkAdmin(admin.ModelAdmin):
+class LnkAdmin(DataVersionAdmin):
     actions = ["generate_entities"]
 
-    @admin.action(description="Regenerate all Linkages Questions")
+    @admin.action(
+        description="Regenerate all Linkages Questions",
+        permissions=["add", "delete"],
+    )
     def generate_entities(
         self, request: HttpRequest, queryset: Union[QuerySet, List[LinkagesQuestion]]
     ):
         queryset.all().delete()
         LinkagesQuestion.generate_linkages()
+        renew_deleted_data_version(LinkagesQuestion)
         self.message_user(
             request,
             f"Generated one linkage question per existent program, total: {len(LinkagesQuestion.objects.all())}",
@@ -52,10 +58,12 @@ class LnkAdmin(admin.ModelAdmin):
 
     def changelist_view(self, request: HttpRequest, extra_context=None):
         if "action" in request.POST and request.POST["action"] == "generate_entities":
-            # We will automatically select all the entries for deletion.
+            # The action always applies to all the entries, no need to select them.
             post = request.POST.copy()
-            for u in LinkagesQuestion.objects.all():
-                post.update({ACTION_CHECKBOX_NAME: str(u.id)})
+            post.update(dict(select_across="1", index="0"))
+            if not post.getlist(ACTION_CHECKBOX_NAME):
+                # Any selection (even with no entries yet), `select_across` replaces it.
+                post[ACTION_CHECKBOX_NAME] = "0"
             request._set_post(post)
         return super(LnkAdmin, self).changelist_view(request, extra_context)
 
@@ -1,10 +1,10 @@
 import abc
 
 from django import forms
-from django.contrib import admin
 from django.shortcuts import redirect, render
 from django.urls import path
 
+from epic_app.admin_models.data_version_admin import DataVersionAdmin
 from epic_app.importers.xlsx import (
     BaseEpicImporter,
     EpicAgencyImporter,
@@ -13,20 +13,23 @@ from epic_app.importers.xlsx import (
     KeyAgencyActionsQuestionImporter,
     NationalFrameworkQuestionImporter,
 )
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
 
 
 class XlsxImportForm(forms.Form):
     """
-    Simple form to allow importing a 'xlsx' file.
+    Simple form to allow importing a 'xlsx' (or 'csv') file.
 
     Args:
         forms (forms.Form): Default Django form.
     """
 
-    xlsx_file = forms.FileField()
+    xlsx_file = forms.FileField(
+        help_text="Either a '.xlsx', '.csv' or gzip compressed '.csv.gz' file."
+    )
 
 
-class ImportEntityAdmin(admin.ModelAdmin):
+class ImportEntityAdmin(DataVersionAdmin):
     """
     Overriding of the Area list in the admin page so that we can add our custom import for all the data.
     """
@@ -60,6 +63,7 @@ class ImportEntityAdmin(admin.ModelAdmin):
         if request.method == "POST":
             try:
                 self.get_importer().import_file(request.FILES["xlsx_file"])
+                EpicDataVersion.renew(EpicDataVersionName.DOMAIN)
                 self.message_user(request, "Your xlsx file has been imported")
             except:
                 self.message_user(
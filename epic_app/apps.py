@@ -7,3 +7,10 @@ class EpicAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "epic_app"
     verbose_name = "An Epic App"
+
+    def ready(self):
+        # Connect the receivers renewing the data versions.
+        from epic_app import signals  # noqa: F401
+
+        # Only imported by the views otherwise, register it for the (non migrated) test databases.
+        from epic_app.models import report_cache_counter  # noqa: F401
@@ -0,0 +1,67 @@
+import logging
+from typing import Any, Callable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
+
+logger = logging.getLogger(__name__)
+
+
+class DomainCache:
+    """
+    Cache of the serialized domain entities (areas, groups, agencies and programs) keyed by the current domain version.
+    The domain only changes through the importers (and the admin), which renew its version, so entries never need to be explicitly invalidated.
+    """
+
+    def __init__(self) -> None:
+        self._cache = caches[settings.EPIC_DOMAIN_CACHE]
+        self._version: Optional[str] = None
+
+    def get_version(self) -> str:
+        """
+        Gets the current domain version, only queried once per `DomainCache` instance.
+
+        Returns:
+            str: Domain version.
+        """
+        if self._version is None:
+            self._version = EpicDataVersion.get_versions(EpicDataVersionName.DOMAIN)[
+                EpicDataVersionName.DOMAIN
+            ]
+        return self._version
+
+    def get_key(self, *key_parts: Any) -> str:
+        """
+        Gets the cache key of a serialized domain entity for the current domain version.
+
+        Args:
+            key_parts (Any): Values the serialized data depends on (view, url, ...).
+
+        Returns:
+            str: Domain cache key.
+        """
+        return ":".join(map(str, ["epic_domain", self.get_version(), *key_parts]))
+
+    def get_or_set(
+        self, domain_key: str, serialize_domain: Callable[[], Any]
+    ) -> Tuple[Any, bool]:
+        """
+        Gets the cached serialized data, serializing (and caching) it when not found.
+
+        Args:
+            domain_key (str): Key as given by `get_key`.
+            serialize_domain (Callable[[], Any]): Method to serialize the data on a cache miss.
+
+        Returns:
+            Tuple[Any, bool]: The (cached) serialized data and whether it was found in the cache.
+        """
+        domain_data = self._cache.get(domain_key, None)
+        if domain_data is not None:
+            logger.debug("Domain cache hit: %s", domain_key)
+            return domain_data, True
+        logger.debug("Domain cache miss: %s", domain_key)
+        domain_data = serialize_domain()
+        self._cache.set(domain_key, domain_data)
+        return domain_data, False
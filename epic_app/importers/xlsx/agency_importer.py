@@ -1,9 +1,6 @@
-import csv
-from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Set, Tuple
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.forms import ValidationError
+from django.db import transaction
 
 from epic_app.importers.xlsx.base_importer import BaseEpicImporter
 from epic_app.models.models import Agency, Program
@@ -23,39 +20,71 @@ class EpicAgencyImporter(BaseEpicImporter):
 
     def _validate(
         self,
-        xlsx_line_objects: List[XlsxLineObject],
+        numbered_lines: List[Tuple[int, XlsxLineObject]],
+        programs_index: Dict[str, Program],
     ) -> List[str]:
         errors_found = []
-        n_line_addition = 2  # Excluded header + start enumerate is 0.
-        for n_line, xlsx_line in enumerate(xlsx_line_objects):
-            if not Program.objects.filter(name__iexact=xlsx_line.program).exists():
-                error_line = n_line + n_line_addition
+        for n_line, xlsx_line in numbered_lines:
+            if xlsx_line.program.lower() not in programs_index:
                 errors_found.append(
-                    f"  - Line {error_line}. Program: '{xlsx_line.program}' does not exist."
+                    f"  - Line {n_line}. Program: '{xlsx_line.program}' does not exist."
                 )
         return errors_found
 
-    def _import_agencies(self, agencies_dictionary: Dict[str, List[XlsxLineObject]]):
-        # Remove all previous agency objects.
-        Agency.objects.all().delete()
-        for agency_name, agency_csvobj in agencies_dictionary.items():
-            c_agency = Agency(name=agency_name)
-            c_agency.save()
-            for csvobj in agency_csvobj:
-                existing_program: Program = Program.get_program_by_name(csvobj.program)
-                existing_program.agencies.add(c_agency)
-
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
+    def _import_agencies(
+        self,
+        xlsx_line_objects: List[XlsxLineObject],
+        programs_index: Dict[str, Program],
+        c_agencies: Dict[str, Agency],
+        program_agencies: Set[Tuple[int, int]],
+    ):
+        """
+        Creates the new `Agency` entities of the given lines and their relationships to the `Program` entities in bulk.
+
+        Args:
+            xlsx_line_objects (List[XlsxLineObject]): Validated lines to import.
+            programs_index (Dict[str, Program]): Existing programs per lowercase name.
+            c_agencies (Dict[str, Agency]): Already created agencies, extended with the new ones.
+            program_agencies (Set[Tuple[int, int]]): Already created (program, agency) relationships, extended with the new ones.
+        """
+        new_agencies: Dict[str, Agency] = {}
+        for xlsx_line in xlsx_line_objects:
+            if xlsx_line.agency not in c_agencies:
+                new_agencies.setdefault(xlsx_line.agency, Agency(name=xlsx_line.agency))
+        Agency.objects.bulk_create(new_agencies.values())
+        c_agencies.update(new_agencies)
+
+        new_program_agencies = {
+            (
+                programs_index[xlsx_line.program.lower()].pk,
+                c_agencies[xlsx_line.agency].pk,
+            )
+            for xlsx_line in xlsx_line_objects
+        } - program_agencies
+        program_agency_type = Program.agencies.through
+        program_agency_type.objects.bulk_create(
+            program_agency_type(program_id=program_id, agency_id=agency_id)
+            for program_id, agency_id in new_program_agencies
+        )
+        program_agencies.update(new_program_agencies)
+
+    @transaction.atomic
+    def import_lines(self, lines_chunks: Iterable[List[Tuple[int, XlsxLineObject]]]):
         """
-        Imports saved Agencies into the database and adds the relationships to existent Programs.
+        Imports saved Agencies into the database and adds the relationships to existent Programs. Nothing is changed when the import fails.
 
         Args:
-            input_file (Union[InMemoryUploadedFile, Path]): File containing EPIC Agencies.
+            lines_chunks (Iterable[List[Tuple[int, XlsxLineObject]]]): Chunks of numbered lines with EPIC Agencies.
         """
+        # Remove all previous agency objects.
         Agency.objects.all().delete()
-        line_objects = self._get_xlsx_line_objects(input_file)
-        _headers = line_objects.pop(0)
-        errors_found = self._validate(line_objects)
-        if any(errors_found):
-            raise ValidationError(errors_found)
-        self._import_agencies(self.group_entity("agency", line_objects))
+        programs_index = self._get_programs_index()
+        c_agencies: Dict[str, Agency] = {}
+        program_agencies: Set[Tuple[int, int]] = set()
+        self._import_line_chunks(
+            lines_chunks,
+            lambda lines_chunk: self._validate(lines_chunk, programs_index),
+            lambda lines_chunk: self._import_agencies(
+                lines_chunk, programs_index, c_agencies, program_agencies
+            ),
+        )
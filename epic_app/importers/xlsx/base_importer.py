@@ -1,9 +1,24 @@
+import csv
+import gzip
 import io
+import itertools
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Protocol, Tuple, Union, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Protocol,
+    Tuple,
+    Union,
+    runtime_checkable,
+)
 
 import openpyxl
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.forms import ValidationError
 from openpyxl.cell import Cell
 
 from epic_app.models.models import Program
@@ -19,11 +34,21 @@ class ProtocolEpicImporter(Protocol):
 
 
 class BaseEpicImporter:
+    # Number of lines validated and inserted at once.
+    import_chunk_size: int = 1000
+    # Supported file extensions besides the default ".xlsx".
+    csv_suffixes = (".csv",)
+    gzip_csv_suffixes = (".csv.gz",)
+
     class XlsxLineObject:
         @staticmethod
-        def get_valid_cell(xlsx_row: List[Cell], cell_pos: int) -> str:
+        def get_valid_cell(
+            xlsx_row: Union[List[Cell], Tuple[Any, ...]], cell_pos: int
+        ) -> str:
             try:
-                return xlsx_row[cell_pos].value.strip()
+                # Rows can be given as cells or (when streaming) as values.
+                cell_value = xlsx_row[cell_pos]
+                return getattr(cell_value, "value", cell_value).strip()
             except:
                 return ""
 
@@ -31,6 +56,84 @@ class BaseEpicImporter:
         def from_xlsx_row(cls, xlsx_row: Any):
             raise NotImplementedError("Implement in concrete class.")
 
+    def _iter_xlsx_line_objects(
+        self, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Iterator[XlsxLineObject]:
+        """
+        Lazily parses the Xlsx lines into our custom `XlsxLineObject`. The workbook is streamed in read-only mode, so the memory used does not depend on the number of rows.
+
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File to parse.
+
+        Yields:
+            Iterator[XlsxLineObject]: Parsed objects, one per row with a value in its first cell.
+        """
+        loaded_workbook: openpyxl.Workbook = openpyxl.load_workbook(
+            input_file, read_only=True, data_only=True
+        )
+        try:
+            for row in loaded_workbook.active.iter_rows(values_only=True):
+                if row and row[0]:
+                    yield self.XlsxLineObject.from_xlsx_row(row)
+        finally:
+            loaded_workbook.close()
+
+    @staticmethod
+    def _open_csv(input_file: Union[InMemoryUploadedFile, Path], gzipped: bool):
+        """
+        Opens the (gzip compressed) file as text with universal newlines, removing the BOM marker if present.
+        """
+        if isinstance(input_file, Path):
+            open_file = gzip.open if gzipped else open
+            return open_file(input_file, "rt", encoding="utf-8-sig", newline="")
+        input_file.seek(0)
+        binary_file = gzip.GzipFile(fileobj=input_file) if gzipped else input_file
+        return io.TextIOWrapper(binary_file, encoding="utf-8-sig", newline="")
+
+    def _iter_csv_line_objects(
+        self, input_file: Union[InMemoryUploadedFile, Path], gzipped: bool = False
+    ) -> Iterator[XlsxLineObject]:
+        """
+        Lazily parses the CSV lines into our custom `XlsxLineObject`, so that the same mapping as for the Xlsx files applies.
+
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File to parse.
+            gzipped (bool, optional): Whether the file is gzip compressed. Defaults to False.
+
+        Yields:
+            Iterator[XlsxLineObject]: Parsed objects, one per row with a value in its first cell.
+        """
+        csv_file = self._open_csv(input_file, gzipped)
+        try:
+            for row in csv.reader(csv_file):
+                if row and row[0]:
+                    yield self.XlsxLineObject.from_xlsx_row(row)
+        finally:
+            if isinstance(input_file, Path):
+                csv_file.close()
+            else:
+                # Uploaded files are closed by django.
+                csv_file.detach()
+
+    def _iter_line_objects(
+        self, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Iterator[XlsxLineObject]:
+        """
+        Lazily parses the lines of a Xlsx, CSV or gzip compressed CSV file, selected by its extension.
+
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File to parse.
+
+        Yields:
+            Iterator[XlsxLineObject]: Parsed objects, one per row with a value in its first cell.
+        """
+        file_name = str(input_file.name).lower()
+        if file_name.endswith(self.gzip_csv_suffixes):
+            return self._iter_csv_line_objects(input_file, gzipped=True)
+        if file_name.endswith(self.csv_suffixes):
+            return self._iter_csv_line_objects(input_file)
+        return self._iter_xlsx_line_objects(input_file)
+
     def _get_xlsx_line_objects(
         self, input_file: Union[InMemoryUploadedFile, Path]
     ) -> List[XlsxLineObject]:
@@ -43,24 +146,97 @@ class BaseEpicImporter:
         Returns:
             List[XlsxLineObject]: Resulting list of parsed objects.
         """
-        loaded_workbook: openpyxl.Workbook = openpyxl.load_workbook(input_file)
-        loaded_sheet = loaded_workbook.active
+        return list(self._iter_xlsx_line_objects(input_file))
+
+    def _iter_xlsx_line_chunks(
+        self, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Iterator[List[Tuple[int, XlsxLineObject]]]:
+        """
+        Lazily parses the Xlsx (or CSV) lines (skipping the headers) in chunks of `import_chunk_size` lines.
 
-        def _get_valid_rows():
-            for row in loaded_sheet.rows:
-                if row[0].value:
-                    yield row
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File to parse.
+
+        Yields:
+            Iterator[List[Tuple[int, XlsxLineObject]]]: Chunks of line number and parsed object.
+        """
+        line_objects = self._iter_line_objects(input_file)
+        _headers = next(line_objects, None)
+        # Excluded header + line numbers start at 1.
+        numbered_lines = enumerate(line_objects, start=2)
+        while True:
+            lines_chunk = list(itertools.islice(numbered_lines, self.import_chunk_size))
+            if not lines_chunk:
+                return
+            yield lines_chunk
+
+    def _import_line_chunks(
+        self,
+        lines_chunks: Iterable[List[Tuple[int, XlsxLineObject]]],
+        validate_chunk: Callable[[List[Tuple[int, XlsxLineObject]]], List[str]],
+        import_chunk: Callable[[List[XlsxLineObject]], None],
+    ):
+        """
+        Validates and imports the lines chunk by chunk so that, when streaming a file, only one chunk of lines is kept in memory.
+        Once an error is found the remaining chunks are only validated. As all the errors are raised at the end, it should be invoked within a transaction.
+
+        Args:
+            lines_chunks (Iterable[List[Tuple[int, XlsxLineObject]]]): Chunks of numbered lines to import.
+            validate_chunk (Callable[[List[Tuple[int, XlsxLineObject]]], List[str]]): Gets the errors of a chunk of numbered lines.
+            import_chunk (Callable[[List[XlsxLineObject]], None]): Imports a chunk of valid lines.
+
+        Raises:
+            ValidationError: When any of the lines is not valid.
+        """
+        errors_found = []
+        for lines_chunk in lines_chunks:
+            errors_found.extend(validate_chunk(lines_chunk))
+            if not errors_found:
+                import_chunk([xlsx_line for _, xlsx_line in lines_chunk])
+        if any(errors_found):
+            raise ValidationError(errors_found)
+
+    @staticmethod
+    def _get_programs_index() -> Dict[str, Program]:
+        """
+        Gets all the existing `Program` (with their `Group`) indexed by their lowercase name, so that imported lines can be validated and related with a single query.
+
+        Returns:
+            Dict[str, Program]: Programs per lowercase name.
+        """
+        return {p.name.lower(): p for p in Program.objects.select_related("group")}
 
-        return list(map(self.XlsxLineObject.from_xlsx_row, _get_valid_rows()))
+    def parse_file(
+        self, input_file: Union[InMemoryUploadedFile, Path]
+    ) -> Iterator[List[Tuple[int, XlsxLineObject]]]:
+        """
+        Lazily parses the file without importing it, so that it can be done apart (e.g. in another process) of `import_lines`.
+
+        Args:
+            input_file (Union[InMemoryUploadedFile, Path]): File to parse.
+
+        Returns:
+            Iterator[List[Tuple[int, XlsxLineObject]]]: Chunks of line number and parsed object.
+        """
+        return self._iter_xlsx_line_chunks(input_file)
+
+    def import_lines(self, lines_chunks: Iterable[List[Tuple[int, XlsxLineObject]]]):
+        """
+        Imports the parsed lines into the EPIC domain data.
+
+        Args:
+            lines_chunks (Iterable[List[Tuple[int, XlsxLineObject]]]): Chunks of numbered lines, as given by `parse_file`.
+        """
+        raise NotImplementedError("Implement in concrete class.")
 
     def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
         """
-        Imports an xlsx file saved in memory or as a path into the EPIC domain data.
+        Imports an xlsx (or csv) file saved in memory or as a path into the EPIC domain data.
 
         Args:
             input_file (Union[InMemoryUploadedFile, Path]): File containing EPIC data.
         """
-        raise NotImplementedError("Implement in concrete class.")
+        self.import_lines(self._iter_xlsx_line_chunks(input_file))
 
     def tuple_to_dict(
         self, tup_lines: List[Tuple[str, List[Any]]]
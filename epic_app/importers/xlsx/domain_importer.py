@@ -1,9 +1,6 @@
-import csv
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from openpyxl import Workbook
+from django.db import transaction
 
 from epic_app.importers.xlsx.base_importer import BaseEpicImporter
 from epic_app.models.models import Area, Group, Program
@@ -37,11 +34,7 @@ class EpicDomainImporter(BaseEpicImporter):
             new_obj.reference_link = cls.get_valid_cell(xlsx_row, 5)
             return new_obj
 
-        def to_epic_program(self) -> Program:
-            epic_area, _ = Area.objects.get_or_create(name=self.area.strip())
-            epic_group, _ = Group.objects.get_or_create(
-                name=self.group.strip(), area=epic_area
-            )
+        def to_epic_program(self, epic_group: Group) -> Program:
             return Program(
                 name=self.program.strip(),
                 description=self.description.strip(),
@@ -58,10 +51,78 @@ class EpicDomainImporter(BaseEpicImporter):
         Group.objects.all().delete()
         Program.objects.all().delete()
 
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
+    def _validate(
+        self,
+        numbered_lines: List[Tuple[int, XlsxLineObject]],
+        program_lines: Dict[str, int],
+    ) -> List[str]:
+        errors_found = []
+        for n_line, xlsx_line in numbered_lines:
+            program_name = xlsx_line.program.strip().lower()
+            if program_name in program_lines:
+                errors_found.append(
+                    f"  - Line {n_line}. Program: '{xlsx_line.program}' already defined at line {program_lines[program_name]}."
+                )
+                continue
+            program_lines[program_name] = n_line
+        return errors_found
+
+    def _import_programs(
+        self,
+        xlsx_line_objects: List[XlsxLineObject],
+        epic_areas: Dict[str, Area],
+        epic_groups: Dict[Tuple[str, str], Group],
+    ):
+        """
+        Creates the `Area`, `Group` and `Program` entities of the given lines in bulk (at most one insert per entity type).
+
+        Args:
+            xlsx_line_objects (List[XlsxLineObject]): Validated lines to import.
+            epic_areas (Dict[str, Area]): Already created areas, extended with the new ones.
+            epic_groups (Dict[Tuple[str, str], Group]): Already created groups, extended with the new ones.
+        """
+        new_areas: Dict[str, Area] = {}
+        for xlsx_line in xlsx_line_objects:
+            area_name = xlsx_line.area.strip()
+            if area_name not in epic_areas:
+                new_areas.setdefault(area_name, Area(name=area_name))
+        Area.objects.bulk_create(new_areas.values())
+        epic_areas.update(new_areas)
+
+        new_groups: Dict[Tuple[str, str], Group] = {}
+        for xlsx_line in xlsx_line_objects:
+            area_name, group_name = xlsx_line.area.strip(), xlsx_line.group.strip()
+            if (area_name, group_name) not in epic_groups:
+                new_groups.setdefault(
+                    (area_name, group_name),
+                    Group(name=group_name, area=epic_areas[area_name]),
+                )
+        Group.objects.bulk_create(new_groups.values())
+        epic_groups.update(new_groups)
+
+        Program.objects.bulk_create(
+            xlsx_line.to_epic_program(
+                epic_groups[(xlsx_line.area.strip(), xlsx_line.group.strip())]
+            )
+            for xlsx_line in xlsx_line_objects
+        )
+
+    @transaction.atomic
+    def import_lines(self, lines_chunks: Iterable[List[Tuple[int, XlsxLineObject]]]):
+        """
+        Imports the EPIC domain (areas, groups and programs) replacing the existing one. Nothing is changed when the import fails.
+
+        Args:
+            lines_chunks (Iterable[List[Tuple[int, XlsxLineObject]]]): Chunks of numbered lines with the EPIC domain.
+        """
         self._cleanup_epic_domain()
-        line_objects: List[self.XlsxLineObject] = self._get_xlsx_line_objects(
-            input_file
+        program_lines: Dict[str, int] = {}
+        epic_areas: Dict[str, Area] = {}
+        epic_groups: Dict[Tuple[str, str], Group] = {}
+        self._import_line_chunks(
+            lines_chunks,
+            lambda lines_chunk: self._validate(lines_chunk, program_lines),
+            lambda lines_chunk: self._import_programs(
+                lines_chunk, epic_areas, epic_groups
+            ),
         )
-        _headers = line_objects.pop(0)
-        list(map(lambda x: x.to_epic_program().save(), line_objects))
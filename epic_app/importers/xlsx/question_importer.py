@@ -1,9 +1,6 @@
-import csv
-from pathlib import Path
-from typing import List, Type, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.forms import ValidationError
+from django.db import transaction
 from openpyxl.cell import Cell
 
 from epic_app.importers.xlsx.base_importer import BaseEpicImporter
@@ -14,6 +11,7 @@ from epic_app.models.epic_questions import (
     Question,
 )
 from epic_app.models.models import Program
+from epic_app.utils import bulk_create_submodel_instances
 
 
 class _YesNoJustifyQuestionImporter(BaseEpicImporter):
@@ -32,22 +30,22 @@ class _YesNoJustifyQuestionImporter(BaseEpicImporter):
             new_obj.title = cls.get_valid_cell(xlsx_row, 3)
             return new_obj
 
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
+    @transaction.atomic
+    def import_lines(self, lines_chunks: Iterable[List[Tuple[int, XlsxLineObject]]]):
         """
-        Imports a 'XLSX file', because we only support one importer we can embed it here.
+        Imports the parsed lines, because we only support one importer we can embed it here.
+        Nothing is changed when the import fails.
 
         Args:
-            input_file (Union[InMemoryUploadedFile, Path]): File to be imported as a YNJustify question.
+            lines_chunks (Iterable[List[Tuple[int, XlsxLineObject]]]): Chunks of numbered lines to be imported as YNJustify questions.
         """
-        line_objects = self._get_xlsx_line_objects(input_file)
-        # Skip the first line as it's the columns names
-        _headers = line_objects.pop(0)
         self._cleanup_questions()
-        errors_found = self._validate(line_objects)
-        if any(errors_found):
-            raise ValidationError(errors_found)
-
-        self._import_questions(line_objects)
+        programs_index = self._get_programs_index()
+        self._import_line_chunks(
+            lines_chunks,
+            lambda lines_chunk: self._validate(lines_chunk, programs_index),
+            lambda lines_chunk: self._import_questions(lines_chunk, programs_index),
+        )
 
     def _get_type(self) -> Type[Question]:
         pass
@@ -55,34 +53,45 @@ class _YesNoJustifyQuestionImporter(BaseEpicImporter):
     def _cleanup_questions(self):
         self._get_type().objects.all().delete()
 
+    @staticmethod
+    def _get_line_program(
+        xlsx_line: XlsxLineObject, programs_index: Dict[str, Program]
+    ) -> Optional[Program]:
+        l_program = programs_index.get(xlsx_line.program.lower(), None)
+        if l_program and l_program.group.name.lower() == xlsx_line.group.lower():
+            return l_program
+        return None
+
     def _validate(
         self,
-        xlsx_line_objects: List[XlsxLineObject],
+        numbered_lines: List[Tuple[int, XlsxLineObject]],
+        programs_index: Dict[str, Program],
     ) -> List[str]:
         errors_found = []
-        n_line_addition = 2  # Excluded header + start enumerate is 0.
-        for n_line, xlsx_line in enumerate(xlsx_line_objects):
-            if not Program.objects.filter(
-                name__iexact=xlsx_line.program, group__name__iexact=xlsx_line.group
-            ).exists():
-                error_line = n_line + n_line_addition
+        for n_line, xlsx_line in numbered_lines:
+            if not self._get_line_program(xlsx_line, programs_index):
                 errors_found.append(
-                    f"  - Line {error_line}. Program: '{xlsx_line.program}', Group: '{xlsx_line.group}' does not exist."
+                    f"  - Line {n_line}. Program: '{xlsx_line.program}', Group: '{xlsx_line.group}' does not exist."
                 )
         return errors_found
 
-    def _import_questions(self, imported_questions: List[XlsxLineObject]):
-        for q_question in imported_questions:
-            # Create new question
-            f_program_query = Program.objects.get(
-                name__iexact=q_question.program, group__name__iexact=q_question.group
-            )
-            c_question: Question = self._get_type()(
-                title=q_question.title,
-                description=q_question.description,
-                program=f_program_query,
-            )
-            c_question.save()
+    def _import_questions(
+        self,
+        imported_questions: List[XlsxLineObject],
+        programs_index: Dict[str, Program],
+    ):
+        q_type = self._get_type()
+        bulk_create_submodel_instances(
+            q_type,
+            [
+                q_type(
+                    title=q_question.title,
+                    description=q_question.description,
+                    program=self._get_line_program(q_question, programs_index),
+                )
+                for q_question in imported_questions
+            ],
+        )
 
 
 class NationalFrameworkQuestionImporter(_YesNoJustifyQuestionImporter):
@@ -120,41 +129,52 @@ class EvolutionQuestionImporter(BaseEpicImporter):
 
     def _validate(
         self,
-        xlsx_line_objects: List[XlsxLineObject],
+        numbered_lines: List[Tuple[int, XlsxLineObject]],
+        programs_index: Dict[str, Program],
     ) -> List[str]:
         errors_found = []
-        n_line_addition = 2  # Excluded header + start enumerate is 0.
-        for n_line, xlsx_line in enumerate(xlsx_line_objects):
-            if not Program.objects.filter(name__iexact=xlsx_line.program).exists():
-                error_line = n_line + n_line_addition
+        for n_line, xlsx_line in numbered_lines:
+            if xlsx_line.program.lower() not in programs_index:
                 errors_found.append(
-                    f"  - Line {error_line}. Program: '{xlsx_line.program}' does not exist."
+                    f"  - Line {n_line}. Program: '{xlsx_line.program}' does not exist."
                 )
         return errors_found
 
-    def import_file(self, input_file: Union[InMemoryUploadedFile, Path]):
-        line_objects = self._get_xlsx_line_objects(input_file)
-        self._cleanup_questions()
-        _headers = line_objects.pop(0)
-        errors_found = self._validate(line_objects)
-        if any(errors_found):
-            raise ValidationError(errors_found)
+    @transaction.atomic
+    def import_lines(self, lines_chunks: Iterable[List[Tuple[int, XlsxLineObject]]]):
+        """
+        Imports the `EvolutionQuestion` entities replacing the existing ones. Nothing is changed when the import fails.
 
-        self._import_questions(line_objects)
+        Args:
+            lines_chunks (Iterable[List[Tuple[int, XlsxLineObject]]]): Chunks of numbered lines with EPIC evolution questions.
+        """
+        self._cleanup_questions()
+        programs_index = self._get_programs_index()
+        self._import_line_chunks(
+            lines_chunks,
+            lambda lines_chunk: self._validate(lines_chunk, programs_index),
+            lambda lines_chunk: self._import_questions(lines_chunk, programs_index),
+        )
 
     def _cleanup_questions(self):
         EvolutionQuestion.objects.all().delete()
 
-    def _import_questions(self, imported_questions: List[XlsxLineObject]):
-        for q_question in imported_questions:
-            # Create new question
-            p_found = Program.objects.get(name__iexact=q_question.program)
-            c_question = EvolutionQuestion(
-                title=q_question.dimension,
-                nascent_description=q_question.nascent_description,
-                engaged_description=q_question.engaged_description,
-                capable_description=q_question.capable_description,
-                effective_description=q_question.effective_description,
-                program=p_found,
-            )
-            c_question.save()
+    def _import_questions(
+        self,
+        imported_questions: List[XlsxLineObject],
+        programs_index: Dict[str, Program],
+    ):
+        bulk_create_submodel_instances(
+            EvolutionQuestion,
+            [
+                EvolutionQuestion(
+                    title=q_question.dimension,
+                    nascent_description=q_question.nascent_description,
+                    engaged_description=q_question.engaged_description,
+                    capable_description=q_question.capable_description,
+                    effective_description=q_question.effective_description,
+                    program=programs_index[q_question.program.lower()],
+                )
+                for q_question in imported_questions
+            ],
+        )
@@ -0,0 +1,259 @@
+import random
+from typing import Dict, Iterator, List, Optional, Type
+
+from django.contrib.auth.hashers import make_password
+from django.db import models, transaction
+from rest_framework.authtoken.models import Token
+
+from epic_app.models.answer_tally import AnswerTallyChanges
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    Answer,
+    EvolutionAnswer,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.models.models import Program
+from epic_app.utils import bulk_create_submodel_instances
+
+_justify_answer_list = [
+    "Duis esse excepteur elit ad fugiat id quis enim dolore non aliquip et nulla dolor.",
+    "Exercitation aute duis enim exercitation cillum.",
+    "Sint est id qui proident et minim pariatur dolore.",
+    "Velit in anim sit deserunt.",
+    "",
+]
+
+
+class LoadDataset:
+    """
+    Synthetic (load testing) organizations, users and answers for the questions already in the database, created in bulk.
+    The same arguments over the same domain always generate the same dataset.
+    """
+
+    def __init__(
+        self,
+        n_organizations: int,
+        n_users_per_organization: int,
+        answered_ratio: float = 1.0,
+        agreement_weights: Optional[Dict[str, float]] = None,
+        evolution_weights: Optional[Dict[str, float]] = None,
+        n_selected_programs: int = 3,
+        prefix: str = "load",
+        password: str = "load",
+        seed: int = 42,
+        batch_size: int = 10000,
+    ) -> None:
+        """
+        Args:
+            n_organizations (int): Number of `EpicOrganization` to create.
+            n_users_per_organization (int): Number of `EpicUser` to create in each organization.
+            answered_ratio (float, optional): Probability (0 to 1) of each user answering each question. Defaults to 1.0 (full coverage).
+            agreement_weights (Optional[Dict[str, float]], optional): Relative weight of each `AgreementAnswerType` value. Defaults to None (uniform).
+            evolution_weights (Optional[Dict[str, float]], optional): Relative weight of each `EvolutionChoiceType` value. Defaults to None (uniform).
+            n_selected_programs (int, optional): Number of programs selected in each linkages answer. Defaults to 3.
+            prefix (str, optional): Prefix of the organization names and usernames. Defaults to "load".
+            password (str, optional): Password shared by all the created users. Defaults to "load".
+            seed (int, optional): Seed of the random choices. Defaults to 42.
+            batch_size (int, optional): Number of answers kept in memory before inserting them. Defaults to 10000.
+        """
+        self.n_organizations = n_organizations
+        self.n_users_per_organization = n_users_per_organization
+        self.answered_ratio = answered_ratio
+        self.agreement_weights = self._get_weights(
+            AgreementAnswerType, agreement_weights
+        )
+        self.evolution_weights = self._get_weights(
+            EvolutionChoiceType, evolution_weights
+        )
+        self.n_selected_programs = n_selected_programs
+        self.prefix = prefix
+        self.password = password
+        self.seed = seed
+        self.batch_size = batch_size
+        self._rng = random.Random(seed)
+
+    @staticmethod
+    def _get_weights(
+        choices_type: Type[models.TextChoices], weights: Optional[Dict[str, float]]
+    ) -> Dict[str, float]:
+        if weights is None:
+            return {choice.value: 1.0 for choice in choices_type}
+        unknown_choices = set(weights) - set(choices_type.values)
+        if unknown_choices:
+            raise ValueError(
+                f"Unknown {choices_type.__name__} values: {', '.join(sorted(unknown_choices))}."
+            )
+        if not any(weight > 0 for weight in weights.values()):
+            raise ValueError(
+                f"At least one {choices_type.__name__} value needs a positive weight."
+            )
+        return {
+            choice.value: float(weights.get(choice.value, 0)) for choice in choices_type
+        }
+
+    def _choose(self, weights: Dict[str, float]) -> str:
+        return self._rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def generate_users(self, n_org: int) -> List[EpicUser]:
+        """
+        Creates the n-th organization and its users (and their tokens) in bulk.
+        All users share the same password, hashed only once, as hashing is deliberately slow.
+
+        Args:
+            n_org (int): Number of the organization to create.
+
+        Returns:
+            List[EpicUser]: The created users.
+        """
+        epic_org = EpicOrganization.objects.create(
+            name=f"{self.prefix} organization {n_org}"
+        )
+        hashed_password = make_password(self.password)
+        epic_users = bulk_create_submodel_instances(
+            EpicUser,
+            [
+                EpicUser(
+                    username=f"{self.prefix}_{n_org}_{n_user}",
+                    password=hashed_password,
+                    organization=epic_org,
+                )
+                for n_user in range(self.n_users_per_organization)
+            ],
+        )
+        Token.objects.bulk_create(
+            Token(key=Token.generate_key(), user_id=epic_user.pk)
+            for epic_user in epic_users
+        )
+        return epic_users
+
+    def _iter_answers(
+        self, epic_users: List[EpicUser], question_ids: Dict[Type[Answer], List[int]]
+    ) -> Iterator[Answer]:
+        for epic_user in epic_users:
+            for answer_type, q_ids in question_ids.items():
+                for question_id in q_ids:
+                    if self._rng.random() >= self.answered_ratio:
+                        continue
+                    answer = answer_type(user_id=epic_user.pk, question_id=question_id)
+                    if answer_type is AgreementAnswer:
+                        answer.selected_choice = self._choose(self.agreement_weights)
+                    elif answer_type is EvolutionAnswer:
+                        answer.selected_choice = self._choose(self.evolution_weights)
+                    if answer_type is not MultipleChoiceAnswer:
+                        answer.justify_answer = self._rng.choice(_justify_answer_list)
+                    yield answer
+
+    def _create_answers(
+        self,
+        answers: List[Answer],
+        program_ids: List[int],
+        organization_id: Optional[int],
+    ) -> Dict[str, int]:
+        answers_by_type: Dict[Type[Answer], List[Answer]] = {}
+        for answer in answers:
+            answers_by_type.setdefault(type(answer), []).append(answer)
+        for answer_type, typed_answers in answers_by_type.items():
+            bulk_create_submodel_instances(answer_type, typed_answers)
+        answers_programs = {
+            mc_answer.pk: self._rng.sample(
+                program_ids, k=min(self.n_selected_programs, len(program_ids))
+            )
+            for mc_answer in answers_by_type.get(MultipleChoiceAnswer, [])
+        }
+        selected_programs = [
+            MultipleChoiceAnswer.selected_programs.through(
+                multiplechoiceanswer_id=answer_id, program_id=program_id
+            )
+            for answer_id, a_program_ids in answers_programs.items()
+            for program_id in a_program_ids
+        ]
+        MultipleChoiceAnswer.selected_programs.through.objects.bulk_create(
+            selected_programs, batch_size=self.batch_size
+        )
+        # Bulk inserts do not send the `post_save` nor `m2m_changed` signals.
+        tally_changes = AnswerTallyChanges()
+        for answer in answers:
+            tally_changes.add_answer(
+                answer, organization_id, answers_programs.get(answer.pk, ())
+            )
+        tally_changes.apply()
+        return dict(answers=len(answers), selected_programs=len(selected_programs))
+
+    def generate_answers(self, epic_users: List[EpicUser]) -> Dict[str, int]:
+        """
+        Answers the questions in the database for the given users, inserting them (and updating their tallies) in batches.
+
+        Args:
+            epic_users (List[EpicUser]): Users of the same organization answering the questions.
+
+        Returns:
+            Dict[str, int]: Number of created `answers` and `selected_programs` (linkages).
+        """
+        question_ids: Dict[Type[Answer], List[int]] = {
+            AgreementAnswer: list(
+                NationalFrameworkQuestion.objects.order_by("pk").values_list(
+                    "pk", flat=True
+                )
+            )
+            + list(
+                KeyAgencyActionsQuestion.objects.order_by("pk").values_list(
+                    "pk", flat=True
+                )
+            ),
+            EvolutionAnswer: list(
+                EvolutionQuestion.objects.order_by("pk").values_list("pk", flat=True)
+            ),
+            MultipleChoiceAnswer: list(
+                LinkagesQuestion.objects.order_by("pk").values_list("pk", flat=True)
+            ),
+        }
+        program_ids = list(Program.objects.order_by("pk").values_list("pk", flat=True))
+        counts = dict(answers=0, selected_programs=0)
+        batch: List[Answer] = []
+
+        organization_id = epic_users[0].organization_id if epic_users else None
+
+        def create_batch():
+            for count_key, count in self._create_answers(
+                batch, program_ids, organization_id
+            ).items():
+                counts[count_key] += count
+            batch.clear()
+
+        for answer in self._iter_answers(epic_users, question_ids):
+            batch.append(answer)
+            if len(batch) >= self.batch_size:
+                create_batch()
+        create_batch()
+        return counts
+
+    def generate(self) -> Dict[str, int]:
+        """
+        Generates the whole dataset, one transaction per organization.
+
+        Returns:
+            Dict[str, int]: Number of created `organizations`, `users`, `answers` and `selected_programs` (linkages).
+        """
+        self._rng.seed(self.seed)
+        counts = dict(organizations=0, users=0, answers=0, selected_programs=0)
+        for n_org in range(self.n_organizations):
+            with transaction.atomic():
+                epic_users = self.generate_users(n_org)
+                answer_counts = self.generate_answers(epic_users)
+            counts["organizations"] += 1
+            counts["users"] += len(epic_users)
+            for count_key, count in answer_counts.items():
+                counts[count_key] += count
+        # Bulk inserts do not send the `post_save` signal.
+        EpicDataVersion.renew(EpicDataVersionName.ANSWERS)
+        return counts
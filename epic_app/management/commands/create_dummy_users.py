@@ -19,7 +19,7 @@ from epic_app.models.epic_questions import (
 )
 from epic_app.models.epic_user import EpicOrganization, EpicUser
 from epic_app.models.models import Program
-from epic_app.utils import get_instance_as_submodel_type
+from epic_app.utils import get_instances_as_submodel_type
 
 
 class Command(BaseCommand):
@@ -123,8 +123,7 @@ class Command(BaseCommand):
 
         def complete_programs(user_list: List[EpicUser], program_list: List[Program]):
             for p in program_list:
-                for p_question in p.questions.all():
-                    q_instance = get_instance_as_submodel_type(p_question)
+                for q_instance in get_instances_as_submodel_type(p.questions.all()):
                     if isinstance(q_instance, AgreementAnswer):
                         [answer_yes_no(sel_user, q_instance) for sel_user in user_list]
                     if isinstance(q_instance, EvolutionQuestion):
@@ -0,0 +1,19 @@
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand
+
+from epic_app.models.epic_questions import LinkagesQuestion
+
+
+class Command(BaseCommand):
+    help = "Fills the program mirror of the linkages questions stored before it existed. Run it after migrating an existing database."
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        n_filled, duplicated_linkages = LinkagesQuestion.fill_linkages_programs()
+        for l_question in duplicated_linkages:
+            self.stderr.write(
+                self.style.WARNING(
+                    f"Linkages question {l_question.pk} left unfilled, its program {l_question.program_id} already has one."
+                )
+            )
+        self.stdout.write(self.style.SUCCESS(f"Filled {n_filled} linkages questions."))
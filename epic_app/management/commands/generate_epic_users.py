@@ -0,0 +1,59 @@
+import csv
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+
+from epic_app.models.epic_user import EpicOrganization
+
+
+class Command(BaseCommand):
+    help = "Generates EpicUsers in bulk for an organization and writes their credentials (the password matches the lowercase username) as CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "organization", type=str, help="Name of the (existing) organization."
+        )
+        parser.add_argument("n_users", type=int, help="Number of users to generate.")
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=None,
+            help="CSV file where to write the credentials, defaults to the standard output.",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of processes hashing the passwords. Use 1 to hash them sequentially.",
+        )
+
+    def _write_credentials(self, csv_file, epic_org: EpicOrganization, epic_users):
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(["organization", "username", "password"])
+        csv_writer.writerows(
+            [epic_org.name, e_user.username, e_user.username.lower()]
+            for e_user in epic_users
+        )
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        epic_org = EpicOrganization.objects.filter(name=options["organization"]).first()
+        if not epic_org:
+            raise CommandError(f"Organization {options['organization']} not found.")
+        if options["n_users"] < 1:
+            raise CommandError("At least one user should be generated.")
+
+        epic_users = epic_org.generate_users(
+            options["n_users"], hash_jobs=options["jobs"] or 1
+        )
+        if not options["output"]:
+            self._write_credentials(self.stdout, epic_org, epic_users)
+            return
+        with options["output"].open("w", newline="") as csv_file:
+            self._write_credentials(csv_file, epic_org, epic_users)
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"Generated {len(epic_users)} users for {epic_org.name}, credentials written at {options['output']}."
+            )
+        )
@@ -0,0 +1,125 @@
+import time
+from typing import Any, Dict, Optional
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from epic_app.load_dataset import LoadDataset
+from epic_app.models.epic_questions import Question
+
+
+def _parse_weights(weights_arg: str) -> Dict[str, float]:
+    """
+    Parses weights given as `CHOICE=weight` pairs separated by commas, e.g. `AGREE=3,DISAGREE=1`.
+    """
+    weights = {}
+    for choice_weight in weights_arg.split(","):
+        choice, _, weight = choice_weight.partition("=")
+        try:
+            weights[choice.strip().upper()] = float(weight)
+        except ValueError:
+            raise CommandError(
+                f"Invalid weight '{choice_weight}', expected CHOICE=weight."
+            )
+    return weights
+
+
+class Command(BaseCommand):
+    help = "Generates a (reproducible) load testing dataset of organizations, users and answers to the questions in the database, all of them sharing the same password."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "n_organizations", type=int, help="Number of organizations to generate."
+        )
+        parser.add_argument(
+            "n_users", type=int, help="Number of users to generate per organization."
+        )
+        parser.add_argument(
+            "--answered-ratio",
+            type=float,
+            default=1.0,
+            help="Probability (0 to 1) of each user answering each question, full coverage by default.",
+        )
+        parser.add_argument(
+            "--agreement-weights",
+            type=_parse_weights,
+            default=None,
+            help="Relative weights of the agreement answers, e.g. AGREE=3,DISAGREE=1 (uniform by default).",
+        )
+        parser.add_argument(
+            "--evolution-weights",
+            type=_parse_weights,
+            default=None,
+            help="Relative weights of the evolution answers, e.g. NASCENT=2,CAPABLE=1 (uniform by default).",
+        )
+        parser.add_argument(
+            "--selected-programs",
+            type=int,
+            default=3,
+            help="Number of programs selected in each linkages answer.",
+        )
+        parser.add_argument(
+            "--prefix",
+            type=str,
+            default="load",
+            help="Prefix of the generated organization names and usernames.",
+        )
+        parser.add_argument(
+            "--password",
+            type=str,
+            default="load",
+            help="Password of all the generated users.",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=42, help="Seed of the random answers."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Number of answers inserted at once.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        if options["n_organizations"] < 1 or options["n_users"] < 1:
+            raise CommandError(
+                "At least one organization and user should be generated."
+            )
+        if not 0 <= options["answered_ratio"] <= 1:
+            raise CommandError("The answered ratio should be between 0 and 1.")
+        if User.objects.filter(username__startswith=f"{options['prefix']}_").exists():
+            raise CommandError(
+                f"There are already users with prefix '{options['prefix']}', use a different --prefix."
+            )
+        if not Question.objects.exists():
+            self.stderr.write(
+                self.style.WARNING(
+                    "There are no questions to answer, import the EPIC domain first."
+                )
+            )
+        try:
+            load_dataset = LoadDataset(
+                n_organizations=options["n_organizations"],
+                n_users_per_organization=options["n_users"],
+                answered_ratio=options["answered_ratio"],
+                agreement_weights=options["agreement_weights"],
+                evolution_weights=options["evolution_weights"],
+                n_selected_programs=options["selected_programs"],
+                prefix=options["prefix"],
+                password=options["password"],
+                seed=options["seed"],
+                batch_size=options["batch_size"],
+            )
+        except ValueError as e_info:
+            raise CommandError(str(e_info))
+
+        start_time = time.perf_counter()
+        counts = load_dataset.generate()
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Generated {organizations} organizations, {users} users, {answers} answers and {selected_programs} selected programs".format(
+                    **counts
+                )
+                + f" in {time.perf_counter() - start_time:.1f}s."
+            )
+        )
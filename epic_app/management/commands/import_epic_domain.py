@@ -1,8 +1,19 @@
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import Manager
 from pathlib import Path
-from typing import Any, Optional, Type
+from queue import Queue
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
+import django
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
+from django.db import connection
 
 from epic_app.importers.xlsx import (
     BaseEpicImporter,
@@ -12,59 +23,222 @@ from epic_app.importers.xlsx import (
     KeyAgencyActionsQuestionImporter,
     NationalFrameworkQuestionImporter,
 )
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
 from epic_app.models.epic_questions import LinkagesQuestion
 
 
+def _stream_file(
+    epic_importer: Type[BaseEpicImporter], import_file: Path, lines_queue: Queue
+):
+    """
+    Parses a file in a worker process, sending each chunk of lines to the main one as soon as it is parsed.
+    The queue is bounded, so the worker waits for the import instead of parsing the whole file into memory.
+    The end of the file is sent as `None`, a parsing error as the exception itself.
+    """
+    try:
+        for lines_chunk in epic_importer().parse_file(import_file):
+            lines_queue.put(lines_chunk)
+    except Exception as err_info:
+        lines_queue.put(err_info)
+        return
+    lines_queue.put(None)
+
+
+class _QueuedChunks:
+    """
+    Iterates the chunks of lines sent by `_stream_file`, raising its parsing error if any.
+    """
+
+    def __init__(self, lines_queue: Queue) -> None:
+        self._lines_queue = lines_queue
+        self._file_ended = False
+
+    def __iter__(self) -> _QueuedChunks:
+        return self
+
+    def __next__(self) -> List[Tuple[int, BaseEpicImporter.XlsxLineObject]]:
+        if self._file_ended:
+            raise StopIteration
+        lines_chunk = self._lines_queue.get()
+        if lines_chunk is None or isinstance(lines_chunk, Exception):
+            self._file_ended = True
+            if lines_chunk is None:
+                raise StopIteration
+            raise lines_chunk
+        return lines_chunk
+
+    def close(self):
+        """
+        Discards the chunks not imported (e.g. after an error), so that the worker is not left waiting.
+        """
+        while not self._file_ended:
+            try:
+                next(self)
+            except Exception:
+                pass
+
+
 class Command(BaseCommand):
     help = "Imports all the available Epic files within the provided directory, replacing the previous related tables for the Epic domain."
 
+    # Import stages, each of them only depends on the previous ones.
+    import_stages: List[List[Tuple[str, Type[BaseEpicImporter]]]] = [
+        [("initial_epic_data", EpicDomainImporter)],
+        [
+            ("agency_data", EpicAgencyImporter),
+            ("nationalframeworkquestions", NationalFrameworkQuestionImporter),
+            ("keyagencyactionsquestions", KeyAgencyActionsQuestionImporter),
+            ("evolutionquestions", EvolutionQuestionImporter),
+        ],
+    ]
+
+    # Number of parsed chunks of lines (per file) waiting to be imported, bounding the memory used.
+    queued_chunks: int = 2
+
     def add_arguments(self, parser):
         parser.add_argument("domain_files", type=Path, nargs="?")
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of processes parsing the files (and threads importing the independent ones). Use 1 to import sequentially.",
+        )
+
+    def _get_import_file(self, import_files_dir: Path, file_stem: str) -> Path:
+        # The first found of the supported formats, xlsx by default.
+        import_files = (
+            import_files_dir / f"{file_stem}{suffix}"
+            for suffix in (".xlsx", ".csv", ".csv.gz")
+        )
+        return next(
+            (i_file for i_file in import_files if i_file.is_file()),
+            import_files_dir / f"{file_stem}.xlsx",
+        )
+
+    def _log_stage(self, stage_name: str, start_time: float):
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"{stage_name} in {time.perf_counter() - start_time:.2f}s."
+            )
+        )
 
-    def _import_files(self, import_files_dir: Path):
+    def _import_lines(
+        self,
+        import_file: Path,
+        epic_importer: Type[BaseEpicImporter],
+        lines_chunks: Iterator[List[Tuple[int, BaseEpicImporter.XlsxLineObject]]],
+    ) -> List[str]:
         """
-        Imports all the available files to create a reliable test environment.
+        Imports the (streamed) chunks of lines of a file within its own transaction.
+
+        Returns:
+            List[str]: Log messages, to prevent interleaving the output of concurrent imports.
+        """
+        try:
+            epic_importer().import_lines(lines_chunks)
+            return [self.style.SUCCESS(f"Imported {import_file.name}.")]
+        except Exception as err_info:
+            return [
+                self.style.ERROR(f"Failed to import {import_file.name}."),
+                self.style.ERROR_OUTPUT(
+                    "\n".join(getattr(err_info, "messages", [str(err_info)]))
+                ),
+            ]
+        finally:
+            lines_chunks.close()
+            if threading.current_thread() is not threading.main_thread():
+                # Each thread opens its own database connection.
+                connection.close()
+
+    def _import_stage(
+        self, stage_files: List[Tuple[Path, Type[BaseEpicImporter]]], jobs: int
+    ) -> List[List[str]]:
+        """
+        Imports the (independent) files of a stage, streaming each of them so that only a few chunks of lines are kept in memory.
+        With several jobs, the files are parsed in a process pool and imported in parallel transactions as their chunks arrive.
 
         Args:
-            import_files_dir (Path): Path to the test directory.
+            stage_files (List[Tuple[Path, Type[BaseEpicImporter]]]): File and importer of each file in the stage.
+            jobs (int): Maximum number of worker processes (and import threads).
+
+        Returns:
+            List[List[str]]: Log messages per file.
         """
+        if jobs <= 1 or len(stage_files) <= 1:
+            return [
+                self._import_lines(
+                    import_file, epic_importer, epic_importer().parse_file(import_file)
+                )
+                for import_file, epic_importer in stage_files
+            ]
 
-        def import_and_log(filepath: Path, epic_importer: Type[BaseEpicImporter]):
-            import_file = import_files_dir / filepath
-            if import_file.is_file():
-                self.stdout.write(
-                    self.style.MIGRATE_HEADING(
-                        f"Importing main data from {import_file}."
-                    )
+        # SQLite serializes writers, concurrent transactions would only lock each other.
+        import_jobs = 1 if connection.vendor == "sqlite" else jobs
+        n_workers = min(jobs, len(stage_files))
+        with Manager() as queue_manager, ProcessPoolExecutor(
+            max_workers=n_workers, initializer=django.setup
+        ) as parse_executor:
+            streamed_files = []
+            for import_file, epic_importer in stage_files:
+                lines_queue = queue_manager.Queue(maxsize=self.queued_chunks)
+                parse_executor.submit(
+                    _stream_file, epic_importer, import_file, lines_queue
                 )
-                try:
-                    epic_importer().import_file(import_file)
-                    self.stdout.write(self.style.SUCCESS("Import successful."))
-                except Exception as err_info:
-                    self.stdout.write(self.style.ERROR(f"Failed to import {filepath}."))
-                    self.stdout.write(
-                        self.style.ERROR_OUTPUT("\n".join(err_info.messages))
+                streamed_files.append(
+                    (import_file, epic_importer, _QueuedChunks(lines_queue))
+                )
+            # Files are consumed in the same order the workers start parsing them.
+            if import_jobs <= 1:
+                return [self._import_lines(*s_file) for s_file in streamed_files]
+            with ThreadPoolExecutor(max_workers=import_jobs) as import_executor:
+                return list(
+                    import_executor.map(
+                        lambda s_file: self._import_lines(*s_file), streamed_files
                     )
+                )
+
+    def _import_files(self, import_files_dir: Path, jobs: int = 1):
+        """
+        Imports all the available files to create a reliable test environment.
+        The files are imported stage by stage, the files within each stage are parsed and imported in parallel.
+
+        Args:
+            import_files_dir (Path): Path to the test directory.
+            jobs (int, optional): Maximum number of concurrent processes and threads. Defaults to 1.
+        """
+        import_files: Dict[str, Tuple[Path, Type[BaseEpicImporter]]] = {}
+        for file_stem, epic_importer in itertools.chain(*self.import_stages):
+            import_file = self._get_import_file(import_files_dir, file_stem)
+            if import_file.is_file():
+                import_files[file_stem] = (import_file, epic_importer)
             else:
                 self.stdout.write(
-                    self.style.ERROR(f"File to import not found at {filepath}")
+                    self.style.ERROR(f"File to import not found at {import_file.name}")
                 )
 
-        import_and_log("initial_epic_data.xlsx", EpicDomainImporter)
-        import_and_log("agency_data.xlsx", EpicAgencyImporter)
-        import_and_log(
-            "nationalframeworkquestions.xlsx", NationalFrameworkQuestionImporter
-        )
-        import_and_log(
-            "keyagencyactionsquestions.xlsx", KeyAgencyActionsQuestionImporter
-        )
-        import_and_log("evolutionquestions.xlsx", EvolutionQuestionImporter)
+        for n_stage, stage in enumerate(self.import_stages, start=1):
+            start_time = time.perf_counter()
+            stage_logs = self._import_stage(
+                [
+                    import_files[file_stem]
+                    for file_stem, _ in stage
+                    if file_stem in import_files
+                ],
+                jobs,
+            )
+            for log_line in itertools.chain(*stage_logs):
+                self.stdout.write(log_line)
+            self._log_stage(f"Import stage {n_stage} done", start_time)
+
+        start_time = time.perf_counter()
         LinkagesQuestion.generate_linkages()
         self.stdout.write(
             self.style.SUCCESS("Generated one linkage question per loaded program.")
         )
+        self._log_stage("Generated linkages", start_time)
+        EpicDataVersion.renew(EpicDataVersionName.DOMAIN)
 
-    def _import_epic_db(self, data_dir: Path):
+    def _import_epic_db(self, data_dir: Path, jobs: int):
         if not data_dir.is_dir():
             self.stdout.write(
                 self.style.ERROR(
@@ -72,7 +246,7 @@ class Command(BaseCommand):
                 )
             )
         try:
-            self._import_files(data_dir)
+            self._import_files(data_dir, jobs)
         except Exception as e_info:
             call_command("flush", "--no-input")
             self.stdout.write(
@@ -83,7 +257,7 @@ class Command(BaseCommand):
 
     def handle(self, *args: Any, **options: Any) -> Optional[str]:
         try:
-            self._import_epic_db(options["domain_files"])
+            self._import_epic_db(options["domain_files"], options["jobs"])
         except Exception as e_info:
             self.stdout.write(
                 self.style.ERROR(
@@ -0,0 +1,90 @@
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from epic_app.models.report_job import ReportJob
+from epic_app.serializers.report_pdf import generate_job_report
+
+
+class Command(BaseCommand):
+    help = "Worker rendering the queued PDF reports (`ReportJob`) into files on disk."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the pending jobs and exit instead of polling for new ones.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait before checking again for pending jobs.",
+        )
+        parser.add_argument(
+            "--reports-dir",
+            type=Path,
+            default=None,
+            help="Directory where to store the reports, defaults to `settings.EPIC_REPORTS_DIR`.",
+        )
+        parser.add_argument(
+            "--stale-timeout",
+            type=float,
+            default=3600.0,
+            help="Seconds after which a running job is considered abandoned by its worker and re-queued.",
+        )
+        parser.add_argument(
+            "--retention",
+            type=float,
+            default=None,
+            help="Seconds the finished jobs and their reports are kept, defaults to `settings.EPIC_REPORTS_RETENTION`.",
+        )
+
+    def _clean_up(self, stale_timeout: timedelta, retention: timedelta):
+        n_stale = ReportJob.recover_stale(stale_timeout)
+        if n_stale:
+            self.stdout.write(
+                self.style.WARNING(f"Recovered {n_stale} stale report jobs.")
+            )
+        n_expired = ReportJob.delete_expired(retention)
+        if n_expired:
+            self.stdout.write(f"Deleted {n_expired} expired report jobs.")
+
+    def _process_job(self, report_job: ReportJob, reports_dir: Path):
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(f"Rendering report job {report_job.pk}.")
+        )
+        try:
+            report_path = generate_job_report(report_job, reports_dir)
+        except Exception as e_info:
+            report_job.set_failed(str(e_info))
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Failed to render report job {report_job.pk}. Detailed info: {str(e_info)}"
+                )
+            )
+            return
+        report_job.set_done(report_path)
+        self.stdout.write(self.style.SUCCESS(f"Report rendered at {report_path}."))
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        reports_dir = options["reports_dir"] or Path(settings.EPIC_REPORTS_DIR)
+        stale_timeout = timedelta(seconds=options["stale_timeout"])
+        retention = timedelta(
+            seconds=settings.EPIC_REPORTS_RETENTION
+            if options["retention"] is None
+            else options["retention"]
+        )
+        while True:
+            self._clean_up(stale_timeout, retention)
+            report_job = ReportJob.claim_next()
+            if report_job:
+                self._process_job(report_job, reports_dir)
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["poll_interval"])
@@ -0,0 +1,13 @@
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand
+
+from epic_app.models.answer_tally import AnswerTally
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the answer tallies (report summaries) from the stored answers. Run it after migrating an existing database or bulk loading answers with SQL."
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        n_tallies = AnswerTally.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {n_tallies} answer tallies."))
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import models, transaction
+from django.db.models import Count, F, Q
+
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicOrganization
+from epic_app.utils import get_submodel_type_list
+
+
+def _add_count(counts: Dict[str, int], key: str, n_answers: int):
+    key_count = counts.get(key, 0) + n_answers
+    if key_count:
+        counts[key] = key_count
+    else:
+        counts.pop(key, None)
+
+
+class AnswerTally(models.Model):
+    """
+    Denormalized number of answers given to a `Question` by the users of an `EpicOrganization` (`None` for users without one).
+    Answers with a `selected_choice` are counted per choice (`choice_counts`), linkages answers per selected program (`program_counts`, keyed by the program `pk`).
+    Tallies are kept up to date with every answer change (see `epic_app.signals`), and can be rebuilt from scratch with the `rebuild_answer_tallies` command.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    question = models.ForeignKey(
+        to=Question, on_delete=models.CASCADE, related_name="answer_tallies"
+    )
+    organization = models.ForeignKey(
+        to=EpicOrganization,
+        on_delete=models.CASCADE,
+        related_name="answer_tallies",
+        blank=True,
+        null=True,
+    )
+    n_answers: int = models.IntegerField(default=0)
+    n_invalid: int = models.IntegerField(default=0)
+    choice_counts: Dict[str, int] = models.JSONField(default=dict, blank=True)
+    program_counts: Dict[str, int] = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["question", "organization"],
+                name="unique_answer_tally",
+            ),
+            # Null organizations are not unique to the constraint above.
+            models.UniqueConstraint(
+                fields=["question"],
+                condition=Q(organization__isnull=True),
+                name="unique_answer_tally_without_organization",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.organization}] {self.question}: {self.n_answers} answers"
+
+    def add_answers(
+        self,
+        n_answers: int,
+        n_invalid: int = 0,
+        choice_counts: Optional[Dict[str, int]] = None,
+        program_counts: Optional[Dict[int, int]] = None,
+    ):
+        """
+        Adds (or discounts, when negative) answers to this tally in memory, choices and programs without answers are dropped.
+
+        Args:
+            n_answers (int): Number of answers.
+            n_invalid (int, optional): Number of those answers which are not valid. Defaults to 0.
+            choice_counts (Optional[Dict[str, int]], optional): Number of answers per `selected_choice`. Defaults to None.
+            program_counts (Optional[Dict[int, int]], optional): Number of answers per selected program `pk`. Defaults to None.
+        """
+        self.n_answers += n_answers
+        self.n_invalid += n_invalid
+        for choice, n_choice in (choice_counts or {}).items():
+            _add_count(self.choice_counts, choice, n_choice)
+        for program_id, n_program in (program_counts or {}).items():
+            _add_count(self.program_counts, str(program_id), n_program)
+
+    def add_tally(self, other: AnswerTally):
+        """
+        Adds the counts of another tally (e.g. of another organization) to this one in memory.
+        """
+        self.add_answers(
+            other.n_answers, other.n_invalid, other.choice_counts, other.program_counts
+        )
+
+    @staticmethod
+    def get_answers_program_ids(answer_ids: Iterable[int]) -> Dict[int, Set[int]]:
+        """
+        Gets the programs selected by each of the given linkages answers with a single query.
+
+        Args:
+            answer_ids (Iterable[int]): Primary keys of `MultipleChoiceAnswer`.
+
+        Returns:
+            Dict[int, Set[int]]: Selected program ids per answer, empty for answers without programs.
+        """
+        answers_programs = {answer_id: set() for answer_id in answer_ids}
+        for (
+            answer_id,
+            program_id,
+        ) in MultipleChoiceAnswer.selected_programs.through.objects.filter(
+            multiplechoiceanswer_id__in=answers_programs
+        ).values_list(
+            "multiplechoiceanswer_id", "program_id"
+        ):
+            answers_programs[answer_id].add(program_id)
+        return answers_programs
+
+    @classmethod
+    def _get_rebuilt_tallies(cls) -> List[AnswerTally]:
+        tallies: Dict[Tuple[int, Optional[int]], AnswerTally] = {}
+
+        def get_tally(question_id: int, organization_id: Optional[int]) -> AnswerTally:
+            return tallies.setdefault(
+                (question_id, organization_id),
+                cls(question_id=question_id, organization_id=organization_id),
+            )
+
+        for a_type in get_submodel_type_list(Answer):
+            if a_type is MultipleChoiceAnswer:
+                continue
+            for choice_row in (
+                a_type.objects.order_by()
+                .values("question_id", "selected_choice")
+                .annotate(organization_id=F("user__organization_id"), n=Count("pk"))
+            ):
+                selected_choice = choice_row["selected_choice"]
+                get_tally(
+                    choice_row["question_id"], choice_row["organization_id"]
+                ).add_answers(
+                    choice_row["n"],
+                    0
+                    if a_type(selected_choice=selected_choice).is_valid_answer()
+                    else choice_row["n"],
+                    {selected_choice: choice_row["n"]},
+                )
+        for answers_row in (
+            MultipleChoiceAnswer.objects.order_by()
+            .values("question_id")
+            .annotate(
+                organization_id=F("user__organization_id"),
+                n=Count("pk", distinct=True),
+                n_invalid=Count("pk", filter=Q(selected_programs__isnull=True)),
+            )
+        ):
+            get_tally(
+                answers_row["question_id"], answers_row["organization_id"]
+            ).add_answers(answers_row["n"], answers_row["n_invalid"])
+        for program_row in (
+            MultipleChoiceAnswer.selected_programs.through.objects.order_by()
+            .values("program_id")
+            .annotate(
+                question_id=F("multiplechoiceanswer__question_id"),
+                organization_id=F("multiplechoiceanswer__user__organization_id"),
+                n=Count("pk"),
+            )
+        ):
+            get_tally(
+                program_row["question_id"], program_row["organization_id"]
+            ).add_answers(
+                0, program_counts={program_row["program_id"]: program_row["n"]}
+            )
+        return list(tallies.values())
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """
+        Replaces all tallies with the counts aggregated (in the database) from the stored answers, within a single transaction.
+
+        Returns:
+            int: Number of created tallies.
+        """
+        with transaction.atomic():
+            cls.objects.all().delete()
+            return len(cls.objects.bulk_create(cls._get_rebuilt_tallies()))
+
+
+class AnswerTallyChanges:
+    """
+    Accumulates the changes of many answers in memory, so that each affected `AnswerTally` is only locked and saved once.
+    """
+
+    def __init__(self) -> None:
+        self._tallies: Dict[Tuple[int, Optional[int]], AnswerTally] = {}
+
+    def add_answer(
+        self,
+        answer: Answer,
+        organization_id: Optional[int],
+        program_ids: Iterable[int] = (),
+        sign: int = 1,
+    ):
+        """
+        Adds (or with a negative `sign`, discounts) an answer to the tally of its question and the given organization.
+
+        Args:
+            answer (Answer): Answer as its subtype, its state is read at this moment.
+            organization_id (Optional[int]): Organization of the user of the answer.
+            program_ids (Iterable[int], optional): Programs selected by a linkages answer. Defaults to ().
+            sign (int, optional): 1 to add the answer, -1 to discount it. Defaults to 1.
+        """
+        tally = self._tallies.setdefault(
+            (answer.question_id, organization_id),
+            AnswerTally(
+                question_id=answer.question_id, organization_id=organization_id
+            ),
+        )
+        if isinstance(answer, MultipleChoiceAnswer):
+            program_ids = set(program_ids)
+            tally.add_answers(
+                sign,
+                0 if program_ids else sign,
+                program_counts={program_id: sign for program_id in program_ids},
+            )
+            return
+        tally.add_answers(
+            sign,
+            0 if answer.is_valid_answer() else sign,
+            {answer.selected_choice: sign},
+        )
+
+    def _lock_tallies(
+        self, tally_keys: Set[Tuple[int, Optional[int]]]
+    ) -> Dict[Tuple[int, Optional[int]], AnswerTally]:
+        question_ids = {question_id for question_id, _ in tally_keys}
+        organization_ids = {organization_id for _, organization_id in tally_keys}
+        organization_filter = Q(organization_id__in=organization_ids - {None})
+        if None in organization_ids:
+            organization_filter |= Q(organization__isnull=True)
+        return {
+            (tally.question_id, tally.organization_id): tally
+            for tally in AnswerTally.objects.select_for_update()
+            .filter(organization_filter, question_id__in=question_ids)
+            .order_by("pk")
+            if (tally.question_id, tally.organization_id) in tally_keys
+        }
+
+    def apply(self):
+        """
+        Adds the accumulated changes to the stored tallies (creating the missing ones) within a single transaction.
+        It takes three queries, regardless of the number of changed answers and tallies.
+        """
+        tally_changes = {
+            tally_key: tally
+            for tally_key, tally in self._tallies.items()
+            if tally.n_answers
+            or tally.n_invalid
+            or tally.choice_counts
+            or tally.program_counts
+        }
+        self._tallies = {}
+        if not tally_changes:
+            return
+        with transaction.atomic():
+            # Existing (or concurrently created) tallies are ignored, so the number of queries is always the same.
+            AnswerTally.objects.bulk_create(
+                [
+                    AnswerTally(
+                        question_id=question_id, organization_id=organization_id
+                    )
+                    for question_id, organization_id in tally_changes
+                ],
+                ignore_conflicts=True,
+            )
+            stored_tallies = self._lock_tallies(set(tally_changes))
+            for tally_key, tally in tally_changes.items():
+                stored_tallies[tally_key].add_tally(tally)
+            AnswerTally.objects.bulk_update(
+                stored_tallies.values(),
+                ["n_answers", "n_invalid", "choice_counts", "program_counts"],
+            )
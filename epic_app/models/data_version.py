@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import uuid
+from typing import Dict, Iterable, Optional
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+def _new_version() -> str:
+    return uuid.uuid4().hex
+
+
+class EpicDataVersionName(models.TextChoices):
+    ANSWERS = "ANSWERS", _("Answers")
+    DOMAIN = "DOMAIN", _("Domain")
+
+
+class EpicDataVersion(models.Model):
+    """
+    Version of a set of EPIC data, renewed every time any of its entities changes.
+    Versions are random tokens rather than counters so that they never repeat, not even after flushing the database.
+    The answers are also versioned per organization, so that a change only invalidates what was derived from its own organization.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    name: str = models.CharField(max_length=50, choices=EpicDataVersionName.choices)
+    organization = models.ForeignKey(
+        to="epic_app.EpicOrganization",
+        on_delete=models.CASCADE,
+        related_name="data_versions",
+        blank=True,
+        null=True,
+    )
+    version: str = models.CharField(max_length=32, default=_new_version)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["name"],
+                condition=models.Q(organization__isnull=True),
+                name="unique_data_version",
+            ),
+            models.UniqueConstraint(
+                fields=["name", "organization"],
+                name="unique_organization_data_version",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        if self.organization_id:
+            return f"{self.name} ({self.organization_id}): {self.version}"
+        return f"{self.name}: {self.version}"
+
+    @classmethod
+    def get_versions(
+        cls, *names: EpicDataVersionName, organization_id: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Gets the current version of each of the requested data sets with a single query (unless they still need to be created).
+
+        Args:
+            organization_id (Optional[int], optional): Organization whose answers version is requested. Defaults to None (all the answers).
+
+        Returns:
+            Dict[str, str]: Version per data set name.
+        """
+        scopes = {
+            name: organization_id if name == EpicDataVersionName.ANSWERS else None
+            for name in names
+        }
+        scopes_filter = models.Q()
+        for name, scope_id in scopes.items():
+            scopes_filter |= models.Q(name=name, organization_id=scope_id)
+        versions = dict(
+            cls.objects.filter(scopes_filter).values_list("name", "version")
+        )
+        for missing_name in scopes.keys() - versions.keys():
+            versions[missing_name] = cls.objects.get_or_create(
+                name=missing_name, organization_id=scopes[missing_name]
+            )[0].version
+        return versions
+
+    @classmethod
+    def renew(
+        cls,
+        name: EpicDataVersionName,
+        organization_ids: Optional[Iterable[Optional[int]]] = None,
+    ):
+        """
+        Renews the version of a data set, invalidating everything derived from its previous version.
+
+        Args:
+            name (EpicDataVersionName): Data set whose entities changed.
+            organization_ids (Optional[Iterable[Optional[int]]], optional): Organizations whose answers changed. Defaults to None (all of them).
+        """
+        data_versions = cls.objects.filter(name=name)
+        if organization_ids is not None:
+            data_versions = data_versions.filter(
+                models.Q(organization=None)
+                | models.Q(organization_id__in=set(organization_ids) - {None})
+            )
+        if not data_versions.update(version=_new_version()):
+            cls.objects.get_or_create(name=name, organization=None)
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-import itertools
 from collections import Counter
-from typing import Any, Dict, List, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 from django.db import IntegrityError, models
+from django.db.models import Case, Count, F, Value, When
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from epic_app.models import models as base_models
@@ -17,6 +28,10 @@ from epic_app.models.epic_questions import (
     Question,
 )
 from epic_app.models.epic_user import EpicUser
+from epic_app.utils import get_submodel_type_list, get_submodel_types
+
+if TYPE_CHECKING:
+    from epic_app.models.answer_tally import AnswerTally
 
 
 class AgreementAnswerType(models.TextChoices):
@@ -27,6 +42,72 @@ class AgreementAnswerType(models.TextChoices):
     SAGR = "STRONGLYAGREE", _("Strongly agree")
 
 
+def _get_choices_summary(
+    answers_list: Union[models.QuerySet, List[Answer]],
+    summary_choices: List[models.TextChoices],
+    get_label: Callable[[models.TextChoices], str],
+) -> Dict[str, Any]:
+    """
+    Gets the summary of a list of answers with a `selected_choice` and a `justify_answer` field.
+    A `QuerySet` is aggregated in the database (one query for the counts, one for the justifications), any other iterable is summarized in a single pass.
+
+    Args:
+        answers_list (Union[models.QuerySet, List[Answer]]): Answers to summarize.
+        summary_choices (List[models.TextChoices]): All the valid choices, in the order they should be reported.
+        get_label (Callable[[models.TextChoices], str]): Method to get the summary label of a choice.
+
+    Returns:
+        Dict[str, Any]: Summary with the count and justifications per choice and the number of invalid answers.
+    """
+    choice_counts = Counter()
+    choice_justify: Dict[str, List[str]] = {}
+    if isinstance(answers_list, models.QuerySet):
+        for choice_row in (
+            answers_list.order_by()
+            .values("selected_choice")
+            .annotate(n_answers=Count("pk"))
+        ):
+            choice_counts[choice_row["selected_choice"]] += choice_row["n_answers"]
+        for selected_choice, justify_answer in answers_list.exclude(
+            justify_answer=""
+        ).values_list("selected_choice", "justify_answer"):
+            choice_justify.setdefault(selected_choice, []).append(justify_answer)
+    else:
+        for answer in answers_list:
+            selected_choice = str(answer.selected_choice)
+            choice_counts[selected_choice] += 1
+            if answer.justify_answer:
+                choice_justify.setdefault(selected_choice, []).append(
+                    answer.justify_answer
+                )
+
+    summary = {}
+    for s_choice in summary_choices:
+        label = get_label(s_choice)
+        summary[label] = choice_counts[s_choice.value]
+        summary[f"{label}_justify"] = choice_justify.get(s_choice.value, [])
+    summary["no_valid_response"] = sum(choice_counts.values()) - sum(
+        choice_counts[s_choice.value] for s_choice in summary_choices
+    )
+    return summary
+
+
+def _get_choice_counts_summary(
+    tally: AnswerTally,
+    summary_choices: List[models.TextChoices],
+    get_label: Callable[[models.TextChoices], str],
+) -> Dict[str, Any]:
+    """
+    Gets the summary counts of a tally of answers with a `selected_choice` field, as `_get_choices_summary` without justifications.
+    """
+    summary = {
+        get_label(s_choice): tally.choice_counts.get(s_choice.value, 0)
+        for s_choice in summary_choices
+    }
+    summary["no_valid_response"] = tally.n_invalid
+    return summary
+
+
 class Answer(models.Model):
     """
     Cross reference table to define the bounding relationship between a User and the answers they give to each question.
@@ -39,15 +120,28 @@ class Answer(models.Model):
         to=EpicUser, on_delete=models.CASCADE, related_name="user_answers"
     )
     question = models.ForeignKey(
-        to=Question, on_delete=models.CASCADE, related_name="question_answers"
+        to=Question,
+        on_delete=models.CASCADE,
+        related_name="question_answers",
+        # Indexed as the prefix of the (`question`, `user`) index below.
+        db_index=False,
     )
 
     class Meta:
         unique_together = ["user", "question"]
+        # Answers are looked up per user (`unique_together`) and per question of (a subset of) users.
+        indexes = [models.Index(fields=["question", "user"])]
 
     def __str__(self) -> str:
         return f"[{self.user}] {self.question}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        answer = super(Answer, cls).from_db(db, field_names, values)
+        # Stored values, so that the answer tallies can discount them when it changes.
+        answer._loaded_values = dict(zip(field_names, values))
+        return answer
+
     def _check_question_integrity(self) -> bool:
         """
         Auxiliar method to be defined in concrete classes which verify the assigned `question` is suitable for this `answer`.
@@ -97,12 +191,66 @@ class Answer(models.Model):
             "Validation only supported on inherited Answer classes."
         )
 
+    @staticmethod
+    def get_question_answer_types(
+        question_ids: Iterable[int],
+    ) -> Dict[int, Optional[Type[Answer]]]:
+        """
+        Gets the `Answer` subtype of each of the given (existing) questions with a single query.
+
+        Args:
+            question_ids (Iterable[int]): Primary keys of the questions.
+
+        Returns:
+            Dict[int, Optional[Type[Answer]]]: Answer subtype per found question.
+        """
+        answer_types = {
+            q_type: a_type
+            for a_type in get_submodel_type_list(Answer)
+            for q_type in a_type._get_supported_questions()
+        }
+        return {
+            q_pk: answer_types.get(q_type)
+            for q_pk, q_type in get_submodel_types(Question, question_ids).items()
+        }
+
     @staticmethod
     def get_detailed_summary(answers_list: List[Answer]) -> Dict[str, Any]:
         raise NotImplementedError(
             "Detailed summary only supported on inherited Answer classes."
         )
 
+    @staticmethod
+    def get_tally_summary(
+        tally: AnswerTally, program_names: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Gets the summary counts (without justifications) of the answers counted in a tally.
+
+        Args:
+            tally (AnswerTally): Tally of the answers to summarize.
+            program_names (Dict[str, str]): Name of the programs by (string) `pk`.
+
+        Returns:
+            Dict[str, Any]: Summary with the count per choice and the number of invalid answers.
+        """
+        raise NotImplementedError(
+            "Tally summary only supported on inherited Answer classes."
+        )
+
+
+_agreement_summary_choices = [
+    AgreementAnswerType.SDIS,
+    AgreementAnswerType.DIS,
+    AgreementAnswerType.NAND,
+    AgreementAnswerType.AGR,
+    AgreementAnswerType.SAGR,
+]
+
+
+def _get_agreement_label(ag_type: AgreementAnswerType) -> str:
+    return str(ag_type.label).strip().replace(" ", "_")
+
 
 class AgreementAnswer(Answer):
     selected_choice: str = models.CharField(
@@ -118,29 +266,32 @@ class AgreementAnswer(Answer):
         return self.selected_choice in AgreementAnswerType
 
     @staticmethod
-    def get_detailed_summary(answers_list: List[AgreementAnswer]) -> Dict[str, Any]:
-        def _agreement_type_summary(filter_type: AgreementAnswerType) -> Dict[str, Any]:
-            filter_query = answers_list.filter(selected_choice=filter_type)
-            label = str(filter_type.label).strip().replace(" ", "_")
-            return {
-                label: len(filter_query),
-                f"{label}_justify": [
-                    fq.justify_answer for fq in filter_query.all() if fq.justify_answer
-                ],
-            }
+    def get_detailed_summary(
+        answers_list: Union[models.QuerySet, List[AgreementAnswer]]
+    ) -> Dict[str, Any]:
+        return _get_choices_summary(
+            answers_list, _agreement_summary_choices, _get_agreement_label
+        )
+
+    @staticmethod
+    def get_tally_summary(
+        tally: AnswerTally, program_names: Dict[str, str]
+    ) -> Dict[str, Any]:
+        return _get_choice_counts_summary(
+            tally, _agreement_summary_choices, _get_agreement_label
+        )
+
+
+_evolution_summary_choices = [
+    EvolutionChoiceType.CAPABLE,
+    EvolutionChoiceType.EFFECTIVE,
+    EvolutionChoiceType.ENGAGED,
+    EvolutionChoiceType.NASCENT,
+]
 
-        return {
-            **_agreement_type_summary(AgreementAnswerType.SDIS),
-            **_agreement_type_summary(AgreementAnswerType.DIS),
-            **_agreement_type_summary(AgreementAnswerType.NAND),
-            **_agreement_type_summary(AgreementAnswerType.AGR),
-            **_agreement_type_summary(AgreementAnswerType.SAGR),
-            **dict(
-                no_valid_response=len(
-                    [al for al in answers_list.all() if not al.is_valid_answer()]
-                )
-            ),
-        }
+
+def _get_evolution_label(ev_type: EvolutionChoiceType) -> str:
+    return str(ev_type.label)
 
 
 class EvolutionAnswer(Answer):
@@ -149,11 +300,57 @@ class EvolutionAnswer(Answer):
     )
     justify_answer: str = models.TextField(blank=True)
 
+    # `EvolutionQuestion` description field (`attname`) of each choice, matched once by their verbose name.
+    selected_choice_fields: Dict[str, str] = {
+        c_field.verbose_name.upper(): c_field.attname
+        for c_field in EvolutionQuestion._meta.concrete_fields
+        if c_field.verbose_name.upper() in EvolutionChoiceType.values
+    }
+
     def get_selected_choice_text(self) -> str:
-        return next(
-            c_field
-            for c_field in self._meta.get_fields()
-            if c_field.verbose_name.lower() == self.selected_choice.lower()
+        """
+        Gets the description the question gives to the selected choice.
+
+        Returns:
+            str: Description of the selected choice, empty when there is none.
+        """
+        choice_field = self.selected_choice_fields.get(self.selected_choice)
+        if not choice_field:
+            return ""
+        evolution_question = self.question
+        if not isinstance(evolution_question, EvolutionQuestion):
+            evolution_question = evolution_question.evolutionquestion
+        return getattr(evolution_question, choice_field) or ""
+
+    @classmethod
+    def get_selected_choice_texts(cls, answers: models.QuerySet) -> Dict[int, str]:
+        """
+        Gets the description of the selected choice of many answers with a single query, joining the question's description in the database.
+
+        Args:
+            answers (models.QuerySet): Evolution answers.
+
+        Returns:
+            Dict[int, str]: Description of the selected choice (empty when there is none) by answer `pk`.
+        """
+        selected_choice_text = Case(
+            *[
+                When(
+                    selected_choice=choice,
+                    then=F(f"question__evolutionquestion__{choice_field}"),
+                )
+                for choice, choice_field in cls.selected_choice_fields.items()
+            ],
+            output_field=models.TextField(),
+        )
+        return dict(
+            answers.order_by()
+            .annotate(
+                selected_choice_text=Coalesce(
+                    selected_choice_text, Value(""), output_field=models.TextField()
+                )
+            )
+            .values_list("pk", "selected_choice_text")
         )
 
     @staticmethod
@@ -167,27 +364,17 @@ class EvolutionAnswer(Answer):
     def get_detailed_summary(
         answers_list: Union[models.QuerySet, List[EvolutionAnswer]]
     ) -> Dict[str, Any]:
-        def _single_choice_summary(filter_type: EvolutionChoiceType) -> Dict[str, Any]:
-            filter_query = answers_list.filter(selected_choice=filter_type)
-            label = str(filter_type.label)
-            return {
-                label: len(filter_query),
-                f"{label}_justify": [
-                    fq.justify_answer for fq in filter_query.all() if fq.justify_answer
-                ],
-            }
+        return _get_choices_summary(
+            answers_list, _evolution_summary_choices, _get_evolution_label
+        )
 
-        return {
-            **_single_choice_summary(EvolutionChoiceType.CAPABLE),
-            **_single_choice_summary(EvolutionChoiceType.EFFECTIVE),
-            **_single_choice_summary(EvolutionChoiceType.ENGAGED),
-            **_single_choice_summary(EvolutionChoiceType.NASCENT),
-            **dict(
-                no_valid_response=len(
-                    [al for al in answers_list.all() if not al.is_valid_answer()]
-                )
-            ),
-        }
+    @staticmethod
+    def get_tally_summary(
+        tally: AnswerTally, program_names: Dict[str, str]
+    ) -> Dict[str, Any]:
+        return _get_choice_counts_summary(
+            tally, _evolution_summary_choices, _get_evolution_label
+        )
 
 
 class MultipleChoiceAnswer(Answer):
@@ -200,25 +387,39 @@ class MultipleChoiceAnswer(Answer):
         return [LinkagesQuestion]
 
     def is_valid_answer(self) -> bool:
+        # Querysets can annotate the count to avoid one query per answer.
+        selected_programs_count = getattr(self, "selected_programs_count", None)
+        if selected_programs_count is not None:
+            return selected_programs_count > 0
         return any(self.selected_programs.all())
 
     @staticmethod
-    def get_detailed_summary(answers_list: List[AgreementAnswer]) -> Dict[str, Any]:
-        all_sp = {
-            p.name: p_count
-            for p, p_count in dict(
-                Counter(
-                    itertools.chain.from_iterable(
-                        [a.selected_programs.all() for a in answers_list]
-                    )
-                )
-            ).items()
+    def get_detailed_summary(
+        answers_list: Union[models.QuerySet, List[MultipleChoiceAnswer]]
+    ) -> Dict[str, Any]:
+        if isinstance(answers_list, models.QuerySet):
+            answers_list = answers_list.prefetch_related("selected_programs")
+        programs_count = Counter()
+        no_valid_response = 0
+        for answer in answers_list:
+            selected_programs = answer.selected_programs.all()
+            programs_count.update(selected_programs)
+            if not selected_programs:
+                no_valid_response += 1
+        return {
+            **{p.name: p_count for p, p_count in programs_count.items()},
+            **dict(no_valid_response=no_valid_response),
         }
+
+    @staticmethod
+    def get_tally_summary(
+        tally: AnswerTally, program_names: Dict[str, str]
+    ) -> Dict[str, Any]:
         return {
-            **all_sp,
-            **dict(
-                no_valid_response=len(
-                    [al for al in answers_list.all() if not al.is_valid_answer()]
-                )
-            ),
+            **{
+                program_names[program_id]: p_count
+                for program_id, p_count in tally.program_counts.items()
+                if program_id in program_names
+            },
+            **dict(no_valid_response=tally.n_invalid),
         }
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from django.db import IntegrityError, models
+from typing import List, Tuple
+
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 from epic_app.models import models as base_models
+from epic_app.utils import bulk_create_submodel_instances
 
 
 class Question(models.Model):
@@ -79,29 +82,78 @@ class LinkagesQuestion(Question):
 
     _linkages_title = "Please select three programs that will help you deliver better results in your program if you could have better collaboration? "
 
+    # Mirror of the inherited `program` field, as a constraint can only refer to the fields of its own table.
+    # Nullable so it can be added to existing databases (where it is filled by `fill_linkages_programs`), unique values are still enforced.
+    linkages_program: base_models.Program = models.OneToOneField(
+        to=base_models.Program,
+        on_delete=models.CASCADE,
+        related_name="linkages_question",
+        editable=False,
+        null=True,
+    )
+
     def __str__(self) -> str:
         return f"Linkages for: {self.program}"
 
     def save(self, *args, **kwargs) -> None:
         """
-        Overriding the default save method to inject a 'fake' OneToOne constraint on the 'program' field.
+        Overriding the default save method to keep the (database) one to one constraint on the 'program' field.
 
         Raises:
             IntegrityError: When there's already a LinkagesQuestion for the same program.
         """
-        # In theory this could be done with the OneToOne relationship. However I'm unable to override that field or the Meta class.
-        if LinkagesQuestion.objects.filter(program=self.program).exists():
-            raise IntegrityError(
-                "UNIQUE constraint failed: epic_app_question.program_id"
-            )
+        self.linkages_program_id = self.program_id
         return super(LinkagesQuestion, self).save(*args, **kwargs)
 
-    @staticmethod
-    def generate_linkages():
+    @classmethod
+    def generate_linkages(cls) -> List[LinkagesQuestion]:
         """
-        Generates linkages questions for all the available programs
+        Generates linkages questions for all the available programs still without one, with a constant number of queries.
+
+        Returns:
+            List[LinkagesQuestion]: The created linkages questions.
         """
-        for p_obj in base_models.Program.objects.all():
-            LinkagesQuestion(
-                title=LinkagesQuestion._linkages_title, program=p_obj
-            ).save()
+        with transaction.atomic():
+            # Filtered on the inherited `program`, in case the mirror field is not filled yet.
+            missing_program_ids = base_models.Program.objects.exclude(
+                pk__in=cls.objects.values("program_id")
+            ).values_list("pk", flat=True)
+            return bulk_create_submodel_instances(
+                cls,
+                [
+                    cls(
+                        title=cls._linkages_title,
+                        program_id=program_id,
+                        linkages_program_id=program_id,
+                    )
+                    for program_id in missing_program_ids
+                ],
+            )
+
+    @classmethod
+    def fill_linkages_programs(cls) -> Tuple[int, List[LinkagesQuestion]]:
+        """
+        Fills the `linkages_program` mirror field of the linkages questions stored before it existed, within a single transaction.
+        When a program has several linkages questions only the first one (lowest `pk`) is filled, so the one to one constraint holds.
+
+        Returns:
+            Tuple[int, List[LinkagesQuestion]]: Number of filled linkages questions and the duplicated ones left unfilled.
+        """
+        with transaction.atomic():
+            taken_program_ids = set(
+                cls.objects.filter(linkages_program__isnull=False).values_list(
+                    "linkages_program_id", flat=True
+                )
+            )
+            filled_linkages, duplicated_linkages = [], []
+            for l_question in cls.objects.filter(
+                linkages_program__isnull=True
+            ).order_by("pk"):
+                if l_question.program_id in taken_program_ids:
+                    duplicated_linkages.append(l_question)
+                    continue
+                taken_program_ids.add(l_question.program_id)
+                l_question.linkages_program_id = l_question.program_id
+                filled_linkages.append(l_question)
+            cls.objects.bulk_update(filled_linkages, ["linkages_program"])
+            return len(filled_linkages), duplicated_linkages
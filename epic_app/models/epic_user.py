@@ -1,12 +1,56 @@
 from __future__ import annotations
 
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Set
 
+import django
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
 from django.utils.crypto import get_random_string
 from rest_framework.authtoken.models import Token
 
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
+from epic_app.utils import bulk_create_submodel_instances
+
+# Minimum number of passwords to hash them in a process pool.
+_min_parallel_passwords = 32
+
+
+def _get_unique_usernames(n_usernames: int, length: int = 7) -> List[str]:
+    """
+    Gets random usernames not yet in use, only the (indexed) generated candidates are looked up.
+    """
+    usernames: Set[str] = set()
+    while len(usernames) < n_usernames:
+        candidates = {
+            get_random_string(length=length)
+            for _ in range(n_usernames - len(usernames))
+        } - usernames
+        candidates -= set(
+            User.objects.filter(username__in=candidates).values_list(
+                "username", flat=True
+            )
+        )
+        usernames.update(candidates)
+    return list(usernames)
+
+
+def _hash_passwords(raw_passwords: List[str], jobs: int = 1) -> List[str]:
+    """
+    Hashes the passwords with the default hasher, in a process pool of `jobs` workers when there are enough of them to compensate its start up.
+    """
+    if jobs <= 1 or len(raw_passwords) < _min_parallel_passwords:
+        return list(map(make_password, raw_passwords))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=django.setup) as executor:
+        return list(
+            executor.map(
+                make_password,
+                raw_passwords,
+                chunksize=max(len(raw_passwords) // (4 * jobs), 1),
+            )
+        )
+
 
 class EpicOrganization(models.Model):
     name: str = models.CharField(max_length=250)
@@ -14,33 +58,37 @@ class EpicOrganization(models.Model):
     def __str__(self) -> str:
         return self.name
 
-    def generate_users(self, n_users: int) -> List[EpicUser]:
+    def generate_users(self, n_users: int, hash_jobs: int = 1) -> List[EpicUser]:
         """
-        Creates 'n' `EpicUser` objects that belong to this `EpicOrganization`
+        Creates 'n' `EpicUser` objects (and their tokens) that belong to this `EpicOrganization` in bulk, within a single transaction.
+        Each user gets a random unique username and a matching (lowercase) password.
 
         Args:
             n_users (int): Number of users to create.
+            hash_jobs (int, optional): Processes hashing the passwords, only meant for command line usage (not within web requests). Defaults to 1.
 
         Returns:
             List[EpicUser]: List of created `EpicUsers`
         """
-
-        def create_epic_user() -> EpicUser:
-            """
-            Creates an epic user with a random unique username and a matching (lowercase) password.
-
-            Returns:
-                EpicUser: Generated `EpicUser`.
-            """
-            epic_username: str = (
-                f"{get_random_string(length=7)}{len(EpicUser.objects.all())}"
+        epic_usernames = _get_unique_usernames(n_users)
+        hashed_passwords = _hash_passwords(
+            [epic_username.lower() for epic_username in epic_usernames], hash_jobs
+        )
+        epic_users = [
+            EpicUser(
+                username=epic_username, password=hashed_password, organization=self
             )
-            epic_user = EpicUser(username=epic_username, organization=self)
-            epic_user.set_password(epic_username.lower())
-            epic_user.save()
-            return epic_user
-
-        return [create_epic_user() for n in range(0, n_users)]
+            for epic_username, hashed_password in zip(epic_usernames, hashed_passwords)
+        ]
+        with transaction.atomic():
+            bulk_create_submodel_instances(EpicUser, epic_users)
+            Token.objects.bulk_create(
+                Token(key=Token.generate_key(), user_id=epic_user.pk)
+                for epic_user in epic_users
+            )
+            # Bulk inserts do not send the `post_save` signal.
+            EpicDataVersion.renew(EpicDataVersionName.ANSWERS, [self.pk])
+        return epic_users
 
 
 class EpicUser(User):
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from django.db import models
+from django.db.models.functions import Upper
 from django.forms import ValidationError
 
 
@@ -101,18 +102,29 @@ class Program(models.Model):
     reference_description = models.TextField(blank=True, null=True)
     reference_link = models.URLField(blank=True)
 
+    class Meta:
+        constraints = [
+            # Matches the expression of `name__iexact` lookups so they are indexed.
+            models.UniqueConstraint(
+                Upper("name"), name="unique_case_insensitive_program_name"
+            )
+        ]
+
     @staticmethod
-    def check_unique_name(value: str):
+    def check_unique_name(value: str, program_pk: Optional[int] = None):
         """
         Checks whether there is a Program with provided value as a name.
 
         Args:
             value (str): Name to give to a new Program.
+            program_pk (Optional[int], optional): Program being saved, excluded from the check. Defaults to None.
 
         Raises:
             ValidationError: When there is already a Program with the same case insensitive name.
         """
-        existing_program = Program.get_program_by_name(value)
+        existing_program = (
+            Program.objects.filter(name__iexact=value).exclude(pk=program_pk).first()
+        )
         if existing_program:
             raise ValidationError(
                 f"There's already a Program with the name: {existing_program.name}."
@@ -129,12 +141,10 @@ class Program(models.Model):
         Returns:
             Optional[Program]: Found program.
         """
-        return next(
-            (p for p in Program.objects.all() if p.name.lower() == value.lower()), None
-        )
+        return Program.objects.filter(name__iexact=value).first()
 
     def save(self, *args, **kwargs) -> None:
-        self.check_unique_name(self.name)
+        self.check_unique_name(self.name, self.pk)
         return super(Program, self).save(*args, **kwargs)
 
     def __str__(self) -> str:
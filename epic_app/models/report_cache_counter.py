@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ReportCacheCounterName(models.TextChoices):
+    HITS = "hits", _("Hits")
+    MISSES = "misses", _("Misses")
+
+
+class ReportCacheCounter(models.Model):
+    """
+    Number of reports served from (`hits`) and generated into (`misses`) the report cache.
+    Counters are kept in the database, as unlike the file based cache it increments them atomically for all the workers.
+    They are only counted when enabled (`EPIC_REPORTS_CACHE_STATS`), as otherwise cached reads do not write.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    name: str = models.CharField(
+        max_length=50, choices=ReportCacheCounterName.choices, unique=True
+    )
+    count: int = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.count}"
+
+    @classmethod
+    def increment(cls, name: ReportCacheCounterName):
+        """
+        Increments a counter, creating it when it does not exist yet.
+
+        Args:
+            name (ReportCacheCounterName): Counter to increment.
+        """
+        if cls.objects.filter(name=name).update(count=models.F("count") + 1):
+            return
+        if not cls.objects.get_or_create(name=name, defaults=dict(count=1))[1]:
+            # Created concurrently by another worker.
+            cls.objects.filter(name=name).update(count=models.F("count") + 1)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+from django.contrib.auth.models import User
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class ReportJobStatus(models.TextChoices):
+    PENDING = "PENDING", _("Pending")
+    RUNNING = "RUNNING", _("Running")
+    DONE = "DONE", _("Done")
+    FAILED = "FAILED", _("Failed")
+
+
+class ReportJob(models.Model):
+    """
+    Queued request of a PDF report of the answers visible to the requesting `User`.
+    The jobs are rendered by a worker process (`process_report_jobs` command) into a file on disk.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    user = models.ForeignKey(
+        to=User, on_delete=models.CASCADE, related_name="report_jobs"
+    )
+    status: str = models.CharField(
+        max_length=50,
+        choices=ReportJobStatus.choices,
+        default=ReportJobStatus.PENDING,
+    )
+    progress: int = models.PositiveSmallIntegerField(default=0)
+    attempts: int = models.PositiveSmallIntegerField(default=0)
+    report_file: str = models.CharField(max_length=500, blank=True)
+    error: str = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    # Times a job can be claimed before giving up on it (e.g. its report keeps killing the worker).
+    max_attempts: int = 3
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self) -> str:
+        return f"[{self.user}] Report {self.pk} ({self.status})"
+
+    @classmethod
+    def claim_next(cls) -> Optional[ReportJob]:
+        """
+        Gets the oldest pending job and marks it as running, so that concurrent workers do not claim it twice.
+
+        Returns:
+            Optional[ReportJob]: Claimed job, `None` when there are no pending jobs.
+        """
+        with transaction.atomic():
+            r_job = (
+                cls.objects.select_for_update(skip_locked=True)
+                .filter(status=ReportJobStatus.PENDING)
+                .order_by("created_at", "pk")
+                .first()
+            )
+            if not r_job:
+                return None
+            r_job.status = ReportJobStatus.RUNNING
+            r_job.started_at = timezone.now()
+            r_job.attempts += 1
+            r_job.save(update_fields=["status", "started_at", "attempts"])
+        return r_job
+
+    @classmethod
+    def recover_stale(cls, timeout: timedelta) -> int:
+        """
+        Re-queues the jobs running for longer than the given timeout, as their worker most likely died.
+        Jobs already claimed `max_attempts` times are marked as failed instead.
+
+        Args:
+            timeout (timedelta): Longest time a report can take to render.
+
+        Returns:
+            int: Number of recovered (re-queued or failed) jobs.
+        """
+        stale_jobs = cls.objects.filter(
+            status=ReportJobStatus.RUNNING, started_at__lt=timezone.now() - timeout
+        )
+        with transaction.atomic():
+            n_failed = stale_jobs.filter(attempts__gte=cls.max_attempts).update(
+                status=ReportJobStatus.FAILED,
+                error=f"Report not rendered after {cls.max_attempts} attempts.",
+                finished_at=timezone.now(),
+            )
+            n_requeued = stale_jobs.update(
+                status=ReportJobStatus.PENDING, progress=0, started_at=None
+            )
+        return n_failed + n_requeued
+
+    @classmethod
+    def delete_expired(cls, retention: timedelta) -> int:
+        """
+        Deletes the jobs finished longer than the given retention ago, together with their reports on disk.
+
+        Args:
+            retention (timedelta): Time a finished job (and its report) is kept.
+
+        Returns:
+            int: Number of deleted jobs.
+        """
+        expired_jobs = cls.objects.filter(
+            status__in=[ReportJobStatus.DONE, ReportJobStatus.FAILED],
+            finished_at__lt=timezone.now() - retention,
+        )
+        report_files = list(
+            expired_jobs.exclude(report_file="").values_list("report_file", flat=True)
+        )
+        n_deleted = expired_jobs.delete()[0]
+        for report_file in report_files:
+            Path(report_file).unlink(missing_ok=True)
+        return n_deleted
+
+    def set_progress(self, progress: int):
+        """
+        Updates the job progress (percentage), only when it increases.
+
+        Args:
+            progress (int): New progress percentage.
+        """
+        progress = min(max(int(progress), 0), 100)
+        if progress <= self.progress:
+            return
+        self.progress = progress
+        self.save(update_fields=["progress"])
+
+    def set_done(self, report_file: Path):
+        self.status = ReportJobStatus.DONE
+        self.report_file = str(report_file)
+        self.progress = 100
+        self.finished_at = timezone.now()
+        self.save(update_fields=["status", "report_file", "progress", "finished_at"])
+
+    def set_failed(self, error: str):
+        self.status = ReportJobStatus.FAILED
+        self.error = error
+        self.finished_at = timezone.now()
+        self.save(update_fields=["status", "error", "finished_at"])
+
+    def get_report_path(self) -> Optional[Path]:
+        """
+        Gets the path to the rendered report, if it is (still) available.
+
+        Returns:
+            Optional[Path]: Path to the PDF report.
+        """
+        if self.status != ReportJobStatus.DONE or not self.report_file:
+            return None
+        report_path = Path(self.report_file)
+        return report_path if report_path.is_file() else None
+
+    def delete(self, *args, **kwargs):
+        """
+        Overriding of the delete method to also remove the rendered report from disk.
+        """
+        if self.report_file:
+            Path(self.report_file).unlink(missing_ok=True)
+        return super().delete(*args, **kwargs)
@@ -0,0 +1,23 @@
+from rest_framework.pagination import CursorPagination
+
+
+class EpicCursorPagination(CursorPagination):
+    """
+    Cursor based pagination on the (stable and indexed) primary key, so that every page costs the same regardless of its position or the table size.
+    Clients can request a different page size (`page_size`) up to `max_page_size`.
+    """
+
+    ordering = "pk"
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+
+class AnswerCursorPagination(EpicCursorPagination):
+    page_size = 200
+    max_page_size = 1000
+
+
+class EpicUserCursorPagination(EpicCursorPagination):
+    page_size = 100
+    max_page_size = 500
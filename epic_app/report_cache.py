@@ -0,0 +1,112 @@
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
+from epic_app.models.report_cache_counter import (
+    ReportCacheCounter,
+    ReportCacheCounterName,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReportCache:
+    """
+    Cache of the generated reports keyed by their scope and the current answers (of the scope) and domain versions.
+    Entries become unreachable as soon as any answer or user of their scope, or any domain entity changes, so they never need to be explicitly invalidated.
+    """
+
+    def __init__(self, user: User) -> None:
+        """
+        Args:
+            user (User): User requesting the report, it determines the report scope.
+        """
+        self.user = user
+        self._cache = caches[settings.EPIC_REPORTS_CACHE]
+
+    def _get_organization_id(self) -> Optional[int]:
+        if self.user.is_staff or self.user.is_superuser:
+            return None
+        return self.user.epicuser.organization_id
+
+    def _get_scope(self) -> str:
+        if self.user.is_staff or self.user.is_superuser:
+            return "all"
+        return f"organization_{self._get_organization_id()}"
+
+    def get_key(self, report_format: str, *key_parts: Any) -> str:
+        """
+        Gets the cache key of a report for the current data versions.
+
+        Args:
+            report_format (str): Format of the report (`json`, `pdf`, ...).
+            key_parts (Any): Extra values the report depends on.
+
+        Returns:
+            str: Report cache key.
+        """
+        versions = EpicDataVersion.get_versions(
+            EpicDataVersionName.ANSWERS,
+            EpicDataVersionName.DOMAIN,
+            organization_id=self._get_organization_id(),
+        )
+        return ":".join(
+            map(
+                str,
+                [
+                    "epic_report",
+                    report_format,
+                    self._get_scope(),
+                    versions[EpicDataVersionName.ANSWERS],
+                    versions[EpicDataVersionName.DOMAIN],
+                    *key_parts,
+                ],
+            )
+        )
+
+    @staticmethod
+    def _count(counter_name: ReportCacheCounterName):
+        # Cached reads stay read-only unless the stats are enabled.
+        if settings.EPIC_REPORTS_CACHE_STATS:
+            ReportCacheCounter.increment(counter_name)
+
+    def get_or_set(
+        self, report_key: str, generate_report: Callable[[], Any]
+    ) -> Tuple[Any, bool]:
+        """
+        Gets a cached report, generating (and caching) it when not found.
+
+        Args:
+            report_key (str): Key as given by `get_key`.
+            generate_report (Callable[[], Any]): Method to generate the report on a cache miss.
+
+        Returns:
+            Tuple[Any, bool]: The (cached) report and whether it was found in the cache.
+        """
+        report = self._cache.get(report_key, None)
+        if report is not None:
+            self._count(ReportCacheCounterName.HITS)
+            logger.debug("Report cache hit: %s", report_key)
+            return report, True
+        self._count(ReportCacheCounterName.MISSES)
+        logger.debug("Report cache miss: %s", report_key)
+        report = generate_report()
+        self._cache.set(report_key, report)
+        return report, False
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """
+        Gets the report cache hits and misses counted since the stats were enabled (`EPIC_REPORTS_CACHE_STATS`).
+
+        Returns:
+            Dict[str, Any]: Number of `hits` and `misses`, and whether they are being counted (`enabled`).
+        """
+        stats = dict.fromkeys(ReportCacheCounterName.values, 0)
+        stats.update(ReportCacheCounter.objects.values_list("name", "count"))
+        stats["enabled"] = settings.EPIC_REPORTS_CACHE_STATS
+        return stats
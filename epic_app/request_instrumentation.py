@@ -0,0 +1,177 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+_current_timings: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "epic_request_timings", default=None
+)
+
+
+class RequestTimings:
+    """
+    Queries and timed sections (serializer, pdf, ...) of a single request.
+    Sections are wall times, so they include the queries run within them.
+    """
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.queries: List[Tuple[str, float]] = []
+        self.sections: Dict[str, float] = {}
+        self._open_sections: Dict[str, int] = {}
+
+    def record_query(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: dict
+    ) -> Any:
+        """
+        Database execute wrapper (`connection.execute_wrapper`) recording the (parametrized) statement and its duration.
+        """
+        query_start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - query_start))
+
+    @property
+    def db_time(self) -> float:
+        return sum(duration for _, duration in self.queries)
+
+    def get_top_repeated_queries(self, n_queries: int) -> List[Dict[str, Any]]:
+        """
+        Gets the statements executed most often, N+1 queries show up as the same statement with different parameters.
+
+        Args:
+            n_queries (int): Maximum number of statements to return.
+
+        Returns:
+            List[Dict[str, Any]]: Statement (`sql`), number of executions (`count`) and their total `duration` in ms.
+        """
+        sql_counts = Counter(sql for sql, _ in self.queries)
+        sql_durations = Counter()
+        for sql, duration in self.queries:
+            sql_durations[sql] += duration
+        return [
+            dict(sql=sql, count=count, duration=round(sql_durations[sql] * 1000, 2))
+            for sql, count in sql_counts.most_common(n_queries)
+            if count > 1
+        ]
+
+
+@contextmanager
+def timed_section(name: str):
+    """
+    Adds the wall time of the enclosed code to the given section of the current request timings.
+    It does nothing outside an instrumented request, and nested sections with the same name are only timed once.
+
+    Args:
+        name (str): Name of the section (`Server-Timing` metric).
+    """
+    timings = _current_timings.get()
+    if timings is None or timings._open_sections.get(name):
+        yield
+        return
+    timings._open_sections[name] = 1
+    section_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings._open_sections[name] = 0
+        timings.sections[name] = timings.sections.get(name, 0.0) + (
+            time.perf_counter() - section_start
+        )
+
+
+def _instrument_serializers():
+    """
+    Times the (top level) serialization of every DRF serializer, nested serializers are part of it.
+    """
+    serializer_data = serializers.BaseSerializer.data
+    if getattr(serializer_data.fget, "epic_instrumented", False):
+        return
+
+    def get_timed_data(serializer: serializers.BaseSerializer):
+        with timed_section("serializer"):
+            return serializer_data.fget(serializer)
+
+    get_timed_data.epic_instrumented = True
+    serializers.BaseSerializer.data = property(get_timed_data)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Opt-in (`EPIC_REQUEST_INSTRUMENTATION`) middleware reporting the number of queries, database, serializer, pdf and total time of each request.
+    Timings are returned as `Server-Timing` headers and logged as one JSON line per request. Requests slower than
+    `EPIC_SLOW_REQUEST_THRESHOLD` seconds also log their most repeated SQL statements.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not getattr(settings, "EPIC_REQUEST_INSTRUMENTATION", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        _instrument_serializers()
+
+    def _get_server_timing(self, timings: RequestTimings, total_time: float) -> str:
+        metrics = [
+            f'db;dur={timings.db_time * 1000:.2f};desc="{len(timings.queries)} queries"'
+        ]
+        metrics.extend(
+            f"{name};dur={duration * 1000:.2f}"
+            for name, duration in timings.sections.items()
+        )
+        metrics.append(f"total;dur={total_time * 1000:.2f}")
+        return ", ".join(metrics)
+
+    def _log_request(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        timings: RequestTimings,
+        total_time: float,
+    ):
+        request_log = dict(
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+            queries=len(timings.queries),
+            db=round(timings.db_time * 1000, 2),
+            **{
+                name: round(duration * 1000, 2)
+                for name, duration in timings.sections.items()
+            },
+            total=round(total_time * 1000, 2),
+        )
+        if total_time < settings.EPIC_SLOW_REQUEST_THRESHOLD:
+            logger.info(json.dumps(request_log))
+            return
+        request_log["top_repeated_queries"] = timings.get_top_repeated_queries(
+            settings.EPIC_SLOW_REQUEST_TOP_QUERIES
+        )
+        logger.warning(json.dumps(request_log))
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        timings = RequestTimings()
+        context_token = _current_timings.set(timings)
+        try:
+            with ExitStack() as db_wrappers:
+                for connection in connections.all():
+                    db_wrappers.enter_context(
+                        connection.execute_wrapper(timings.record_query)
+                    )
+                response = self.get_response(request)
+        finally:
+            _current_timings.reset(context_token)
+        total_time = time.perf_counter() - timings.start
+        response["Server-Timing"] = self._get_server_timing(timings, total_time)
+        self._log_request(request, response, timings, total_time)
+        return response
@@ -2,6 +2,7 @@
 from epic_app.serializers.agency_serializer import AgencySerializer
 from epic_app.serializers.answer_serializer import AnswerSerializer
 from epic_app.serializers.area_serializer import AreaSerializer
+from epic_app.serializers.bulk_answer_serializer import BulkAnswerSerializer
 from epic_app.serializers.epic_user_serializer import (
     EpicOrganizationSerializer,
     EpicUserSerializer,
@@ -16,4 +17,5 @@ from epic_app.serializers.question_serializer import (
     NationalFrameworkQuestionSerializer,
     QuestionSerializer,
 )
+from epic_app.serializers.report_job_serializer import ReportJobSerializer
 from epic_app.serializers.report_serializer import ProgramReportSerializer
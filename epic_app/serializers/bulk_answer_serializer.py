@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Set
+
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from epic_app.models.answer_tally import AnswerTally, AnswerTallyChanges
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    Answer,
+    EvolutionAnswer,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import EvolutionChoiceType
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.utils import bulk_create_submodel_instances
+
+# Values accepted as `selected_choice` per answer subtype, blank means not answered yet.
+_answer_choices = {
+    AgreementAnswer: ["", *AgreementAnswerType.values],
+    EvolutionAnswer: ["", *EvolutionChoiceType.values],
+}
+# Fields of each answer subtype that can be submitted in bulk.
+_answer_fields = {
+    AgreementAnswer: ["selected_choice", "justify_answer"],
+    EvolutionAnswer: ["selected_choice", "justify_answer"],
+    MultipleChoiceAnswer: [],
+}
+
+
+class BulkAnswerListSerializer(serializers.ListSerializer):
+    """
+    Validates the answers of a bulk submission against one preloaded map of question types, and upserts them within a single transaction.
+    The `EpicUser` submitting the answers is expected in the `user` context.
+    """
+
+    max_answers = 500
+
+    def to_internal_value(self, data: Any) -> List[Dict[str, Any]]:
+        """
+        Validates each answer and then all of them together, so that errors are reported per answer (in the submitted order).
+        """
+        if isinstance(data, list) and len(data) > self.max_answers:
+            raise serializers.ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        f"At most {self.max_answers} answers can be submitted at once."
+                    ]
+                }
+            )
+        attrs = super().to_internal_value(data)
+        question_ids = [a_data["question"] for a_data in attrs]
+        answer_types = Answer.get_question_answer_types(question_ids)
+        program_ids = set(
+            Program.objects.filter(
+                pk__in=[
+                    p_id
+                    for a_data in attrs
+                    for p_id in a_data.get("selected_programs", [])
+                ]
+            ).values_list("pk", flat=True)
+        )
+        answer_errors = []
+        found_questions = set()
+        for a_data in attrs:
+            a_errors = {}
+            a_type = answer_types.get(a_data["question"])
+            if not a_type:
+                a_errors["question"] = [
+                    f"Invalid pk \"{a_data['question']}\" - object does not exist."
+                ]
+            elif a_data["question"] in found_questions:
+                a_errors["question"] = ["Question answered more than once."]
+            elif (
+                a_type in _answer_choices
+                and a_data.get("selected_choice", "") not in _answer_choices[a_type]
+            ):
+                a_errors["selected_choice"] = [
+                    f"\"{a_data['selected_choice']}\" is not a valid choice."
+                ]
+            elif a_type is MultipleChoiceAnswer and not program_ids.issuperset(
+                a_data.get("selected_programs", [])
+            ):
+                a_errors["selected_programs"] = ["Invalid program pk."]
+            found_questions.add(a_data["question"])
+            a_data["answer_type"] = a_type
+            answer_errors.append(a_errors)
+        if any(answer_errors):
+            raise serializers.ValidationError(answer_errors)
+        return attrs
+
+    def _set_selected_programs(
+        self, validated_data: List[Dict[str, Any]], answers: List[Answer]
+    ):
+        selected_programs = {
+            answer.pk: a_data["selected_programs"]
+            for a_data, answer in zip(validated_data, answers)
+            if "selected_programs" in a_data
+            and isinstance(answer, MultipleChoiceAnswer)
+        }
+        if not selected_programs:
+            return
+        programs_through = MultipleChoiceAnswer.selected_programs.through
+        programs_through.objects.filter(
+            multiplechoiceanswer_id__in=selected_programs
+        ).delete()
+        programs_through.objects.bulk_create(
+            programs_through(multiplechoiceanswer_id=answer_pk, program_id=program_id)
+            for answer_pk, program_ids in selected_programs.items()
+            for program_id in set(program_ids)
+        )
+
+    def create(self, validated_data: List[Dict[str, Any]]) -> List[Answer]:
+        """
+        Creates or updates (upsert) the validated answers of the context `user`, with one bulk query per answer subtype.
+
+        Returns:
+            List[Answer]: The answers (as their subtype) in the same order as submitted.
+        """
+        epic_user: EpicUser = self.context["user"]
+        answers: List[Optional[Answer]] = [None] * len(validated_data)
+        answers_programs: Dict[int, Set[int]] = {}
+        tally_changes = AnswerTallyChanges()
+        with transaction.atomic():
+            for a_type, a_fields in _answer_fields.items():
+                type_data = {
+                    a_data["question"]: (n_answer, a_data)
+                    for n_answer, a_data in enumerate(validated_data)
+                    if a_data["answer_type"] is a_type
+                }
+                if not type_data:
+                    continue
+                existing_answers = {
+                    answer.question_id: answer
+                    for answer in a_type.objects.select_for_update().filter(
+                        user=epic_user, question_id__in=type_data
+                    )
+                }
+                if a_type is MultipleChoiceAnswer:
+                    answers_programs = AnswerTally.get_answers_program_ids(
+                        answer.pk for answer in existing_answers.values()
+                    )
+                new_answers = []
+                for question_id, (n_answer, a_data) in type_data.items():
+                    answer = existing_answers.get(question_id)
+                    if answer:
+                        tally_changes.add_answer(
+                            answer,
+                            epic_user.organization_id,
+                            answers_programs.get(answer.pk, ()),
+                            sign=-1,
+                        )
+                    else:
+                        answer = a_type(user_id=epic_user.pk, question_id=question_id)
+                        new_answers.append(answer)
+                    for a_field in a_fields:
+                        if a_field in a_data:
+                            setattr(answer, a_field, a_data[a_field])
+                    answers[n_answer] = answer
+                bulk_create_submodel_instances(a_type, new_answers)
+                if a_fields and existing_answers:
+                    a_type.objects.bulk_update(existing_answers.values(), a_fields)
+            self._set_selected_programs(validated_data, answers)
+            if validated_data:
+                # Bulk queries do not send the `post_save` nor `m2m_changed` signals.
+                for a_data, answer in zip(validated_data, answers):
+                    tally_changes.add_answer(
+                        answer,
+                        epic_user.organization_id,
+                        a_data.get(
+                            "selected_programs", answers_programs.get(answer.pk, ())
+                        ),
+                    )
+                tally_changes.apply()
+                EpicDataVersion.renew(
+                    EpicDataVersionName.ANSWERS, [epic_user.organization_id]
+                )
+        prefetch_related_objects(
+            [a for a in answers if isinstance(a, MultipleChoiceAnswer)],
+            "selected_programs",
+        )
+        return answers
+
+
+class BulkAnswerSerializer(serializers.Serializer):
+    """
+    Serializer for one of the answers of a bulk submission, the fields not related to the question's answer type are ignored.
+    """
+
+    question = serializers.IntegerField()
+    selected_choice = serializers.CharField(required=False, allow_blank=True)
+    justify_answer = serializers.CharField(required=False, allow_blank=True)
+    selected_programs = serializers.ListField(
+        child=serializers.IntegerField(), required=False
+    )
+
+    class Meta:
+        list_serializer_class = BulkAnswerListSerializer
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from rest_framework import serializers
+
+from epic_app.models.epic_questions import (
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.serializers.question_serializer import (
+    EvolutionQuestionSerializer,
+    KeyAgencyQuestionSerializer,
+    LinkagesQuestionSerializer,
+    NationalFrameworkQuestionSerializer,
+)
+
+# Question types of a snapshot program, named after their `program/{pk}/question-*` endpoints.
+_snapshot_question_types = {
+    "nationalframework": (
+        NationalFrameworkQuestion,
+        NationalFrameworkQuestionSerializer,
+    ),
+    "keyagencyactions": (KeyAgencyActionsQuestion, KeyAgencyQuestionSerializer),
+    "evolution": (EvolutionQuestion, EvolutionQuestionSerializer),
+    "linkages": (LinkagesQuestion, LinkagesQuestionSerializer),
+}
+
+
+def _get_program_questions() -> Dict[int, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Serializes all questions with one query per question type and groups them by program and type.
+    """
+    program_questions: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+    for type_name, (q_type, q_serializer) in _snapshot_question_types.items():
+        for q_data in q_serializer(q_type.objects.order_by("pk"), many=True).data:
+            program_questions.setdefault(q_data["program"], {}).setdefault(
+                type_name, []
+            ).append(q_data)
+    return program_questions
+
+
+class SnapshotProgramSerializer(serializers.ModelSerializer):
+    """
+    Serializer for 'Program' with its agencies (ids) and its questions by type.
+    The questions are read from the `program_questions` context so that they are not queried per program.
+    """
+
+    questions = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Program
+        fields = (
+            "id",
+            "name",
+            "description",
+            "reference_description",
+            "reference_link",
+            "agencies",
+            "questions",
+        )
+
+    def get_questions(self, program: Program) -> Dict[str, List[Dict[str, Any]]]:
+        program_questions = self.context["program_questions"].get(program.pk, {})
+        return {
+            type_name: program_questions.get(type_name, [])
+            for type_name in _snapshot_question_types
+        }
+
+
+class SnapshotGroupSerializer(serializers.ModelSerializer):
+    programs = SnapshotProgramSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Group
+        fields = ("id", "name", "programs")
+
+
+class SnapshotAreaSerializer(serializers.ModelSerializer):
+    groups = SnapshotGroupSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Area
+        fields = ("id", "name", "groups")
+
+
+class SnapshotAgencySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Agency
+        fields = ("id", "name")
+
+
+def get_domain_snapshot() -> Dict[str, Any]:
+    """
+    Serializes the whole domain (areas, groups, programs and their questions, and agencies) in a constant number of queries.
+
+    Returns:
+        Dict[str, Any]: The domain `areas` tree and the `agencies` its programs refer to.
+    """
+    areas = Area.objects.prefetch_related("groups__programs__agencies").order_by("name")
+    return dict(
+        areas=SnapshotAreaSerializer(
+            areas,
+            many=True,
+            context=dict(program_questions=_get_program_questions()),
+        ).data,
+        agencies=SnapshotAgencySerializer(
+            Agency.objects.order_by("name"), many=True
+        ).data,
+    )
@@ -1,12 +1,14 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from django.db import models
+from django.db.models import Count
 from rest_framework import serializers
 
-from epic_app.models.epic_answers import Answer
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
 from epic_app.models.epic_questions import Question
 from epic_app.models.epic_user import EpicUser
 from epic_app.models.models import Program
-from epic_app.utils import get_instance_as_submodel_type
+from epic_app.utils import get_submodel_type_list
 
 _QuestionAnswer = Tuple[Question, Optional[Answer]]
 
@@ -19,40 +21,91 @@ class _QuestionAnswerSerializer(serializers.BaseSerializer):
         return {"question": question.id, "answer": answer.id if answer else None}
 
 
+class ProgressListSerializer(serializers.ListSerializer):
+    """
+    Serializer to show the progress of the context `EpicUser` for many `Program` at once.
+    The user answers to the serialized programs are loaded once and shared between them.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        programs = list(iterable)
+        user_answers = self.child._get_user_answers(
+            program_ids=[program.pk for program in programs]
+        )
+        return [
+            {"program": program.id, **self.child._get_progress(program, user_answers)}
+            for program in programs
+        ]
+
+
 class ProgressSerializer(serializers.BaseSerializer):
     """
     Serializer to show the progress of the context `EpicUser`.
     Only meant for GET / FETCH endpoints.
     """
 
+    class Meta:
+        list_serializer_class = ProgressListSerializer
+
     def _get_context_epic_user(self) -> EpicUser:
         try:
             return self.context["request"].user
         except:
             raise ValueError("No user found in context-request.")
 
-    def _get_question_answer(self, question: Question) -> _QuestionAnswer:
+    def _get_user_answers(
+        self,
+        questions: Optional[List[Question]] = None,
+        program_ids: Optional[List[int]] = None,
+    ) -> Dict[int, Answer]:
+        """
+        Gets the answers of the context `EpicUser` as their `Answer` subtype, with one query per subtype.
+
+        Args:
+            questions (Optional[List[Question]], optional): Questions to restrict the answers to. Defaults to None (all questions).
+            program_ids (Optional[List[int]], optional): Programs to restrict the answers to. Defaults to None (all programs).
+
+        Returns:
+            Dict[int, Answer]: `Answer` subtype instances by their `Question` id.
+        """
         progress_user: EpicUser = self._get_context_epic_user()
-        answer = None
-        try:
-            answer = Answer.objects.get(user=progress_user, question=question)
-            answer = get_instance_as_submodel_type(answer)
-        finally:
-            return (question, answer)
+        user_answers = {}
+        for answer_subtype in get_submodel_type_list(Answer):
+            subtype_queryset = answer_subtype.objects.filter(user=progress_user)
+            if questions is not None:
+                subtype_queryset = subtype_queryset.filter(question__in=questions)
+            if program_ids is not None:
+                subtype_queryset = subtype_queryset.filter(
+                    question__program_id__in=program_ids
+                )
+            if answer_subtype is MultipleChoiceAnswer:
+                subtype_queryset = subtype_queryset.annotate(
+                    selected_programs_count=Count("selected_programs")
+                )
+            user_answers.update({a.question_id: a for a in subtype_queryset})
+        return user_answers
 
     def _get_total_progress(self, answer_list: List[_QuestionAnswer]) -> float:
+        if not answer_list:
+            return 0.0
         valid_answers = sum(a.is_valid_answer() for _, a in answer_list if a)
         return valid_answers / len(answer_list)
 
-    def to_representation(self, instance: Program):
-        if not isinstance(instance, Program):
-            raise ValueError(
-                f"Expected instance type {type(Program)}, got {type(instance)}"
-            )
-        qa_list = [self._get_question_answer(q) for q in instance.questions.all()]
+    def _get_progress(self, program: Program, user_answers: Dict[int, Answer]) -> dict:
+        qa_list = [(q, user_answers.get(q.pk, None)) for q in program.questions.all()]
         return {
             "progress": self._get_total_progress(qa_list),
             "questions_answers": [
                 _QuestionAnswerSerializer().to_representation(qa) for qa in qa_list
             ],
         }
+
+    def to_representation(self, instance: Program):
+        if not isinstance(instance, Program):
+            raise ValueError(
+                f"Expected instance type {type(Program)}, got {type(instance)}"
+            )
+        return self._get_progress(
+            instance, self._get_user_answers(questions=instance.questions.all())
+        )
@@ -53,4 +53,4 @@ class EvolutionQuestionSerializer(serializers.ModelSerializer):
 class LinkagesQuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = LinkagesQuestion
-        fields = "__all__"
+        exclude = ["linkages_program"]
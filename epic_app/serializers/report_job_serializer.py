@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from epic_app.models.report_job import ReportJob
+
+
+class ReportJobSerializer(serializers.HyperlinkedModelSerializer):
+    """
+    Serializer for 'ReportJob', exposing its status and progress.
+    """
+
+    download = serializers.HyperlinkedIdentityField(
+        view_name="reportjob-download", read_only=True
+    )
+
+    class Meta:
+        model = ReportJob
+        fields = (
+            "url",
+            "id",
+            "status",
+            "progress",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "download",
+        )
+        read_only_fields = fields
@@ -1,6 +1,9 @@
+import os
+import tempfile
 from datetime import datetime
 from io import BytesIO
-from typing import Any, List, Optional
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, List, Optional, Union
 
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.shapes import Drawing, Rect
@@ -13,6 +16,13 @@ from reportlab.platypus.paragraph import Paragraph
 from reportlab.platypus.tableofcontents import TableOfContents
 from reportlab.rl_config import defaultPageSize
 
+from epic_app.models.report_job import ReportJob
+from epic_app.request_instrumentation import timed_section
+from epic_app.serializers.report_serializer import (
+    get_report_data,
+    get_report_organization_names,
+)
+
 PAGE_HEIGHT = defaultPageSize[1]
 PAGE_WIDTH = defaultPageSize[0]
 
@@ -54,10 +64,21 @@ class EpicStyles:
 
 
 class EpicReportDocTemplate(SimpleDocTemplate):
+    # Optional callback notified with the (rendered, total) flowables of the current pass.
+    progress_callback: Optional[Callable[[int, int], None]] = None
+
+    def build(self, flowables: List[Any], *args, **kwargs):
+        self._n_flowables = len(flowables)
+        self._n_rendered = 0
+        return super().build(flowables, *args, **kwargs)
+
     def afterFlowable(self, flowable):
         """
-        Registers TOC entries.
+        Registers TOC entries and notifies the progress.
         """
+        if self.progress_callback:
+            self._n_rendered += 1
+            self.progress_callback(self._n_rendered, self._n_flowables)
         if flowable.__class__.__name__ == "Paragraph":
             indentation = {
                 "TOCHeading1": 1,
@@ -213,13 +234,70 @@ class EpicPdfReport:
             story.append(PageBreak())
         return story
 
-    def generate_report(self, buffer: BytesIO, report_data: dict):
-        report_story = [Spacer(1, 2 * inch)]
-        report_story.extend(self._get_abstract())
-        report_story.extend(self._get_toc())
-        report_story.extend(self._get_programs(report_data))
-        EpicReportDocTemplate(buffer).multiBuild(
-            report_story,
-            onFirstPage=self._first_page,
-            onLaterPages=self._later_pages,
-        )
+    def generate_report(
+        self,
+        buffer: Union[BytesIO, BinaryIO, str],
+        report_data: dict,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        Renders the report data into the given buffer (or file path).
+
+        Args:
+            buffer (Union[BytesIO, BinaryIO, str]): Output stream or path of the PDF file.
+            report_data (dict): Serialized report (`ProgramReportSerializer`).
+            progress_callback (Optional[Callable[[int, int], None]], optional): Called with the rendered and total flowables of each build pass. Defaults to None.
+        """
+        with timed_section("pdf"):
+            report_story = [Spacer(1, 2 * inch)]
+            report_story.extend(self._get_abstract())
+            report_story.extend(self._get_toc())
+            report_story.extend(self._get_programs(report_data))
+            report_template = EpicReportDocTemplate(buffer)
+            report_template.progress_callback = progress_callback
+            report_template.multiBuild(
+                report_story,
+                onFirstPage=self._first_page,
+                onLaterPages=self._later_pages,
+            )
+
+
+def generate_job_report(report_job: ReportJob, reports_dir: Path) -> Path:
+    """
+    Renders the PDF report of a (claimed) `ReportJob` into a file within the given directory, updating the job progress meanwhile.
+    The report is first written into a temporary file so that a partial report is never exposed.
+
+    Args:
+        report_job (ReportJob): Job whose report needs to be rendered.
+        reports_dir (Path): Directory where to store the rendered reports.
+
+    Returns:
+        Path: Location of the rendered report.
+    """
+
+    def on_render_progress(n_rendered: int, n_total: int):
+        # Data gathering takes the first 30%, rendering up to 95%.
+        report_job.set_progress(30 + 65 * n_rendered // max(n_total, 1))
+
+    report_job.set_progress(10)
+    report_data = get_report_data(report_job.user)
+    report_job.set_progress(30)
+
+    pdf_report = EpicPdfReport()
+    pdf_report.report_subtitle = "EPIC report for {}".format(
+        (", ").join(get_report_organization_names(report_job.user))
+    )
+    pdf_report.report_author = report_job.user.username
+
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_report = tempfile.mkstemp(
+        suffix=".pdf.part", prefix=f"epic_report_{report_job.pk}_", dir=reports_dir
+    )
+    os.close(tmp_fd)
+    try:
+        pdf_report.generate_report(tmp_report, report_data, on_render_progress)
+        report_path = reports_dir / f"epic_report_{report_job.pk}.pdf"
+        os.replace(tmp_report, report_path)
+    finally:
+        Path(tmp_report).unlink(missing_ok=True)
+    return report_path
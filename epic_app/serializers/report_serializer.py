@@ -1,43 +1,126 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
+from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import Q
 from rest_framework import serializers
+from rest_framework.utils.serializer_helpers import ReturnList
 
+from epic_app.models.answer_tally import AnswerTally
 from epic_app.models.epic_answers import Answer
 from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicOrganization, EpicUser
 from epic_app.models.models import Program
 from epic_app.serializers.answer_serializer import AnswerSerializer
-from epic_app.utils import get_instance_as_submodel_type
+from epic_app.utils import get_instance_as_submodel_type, get_submodel_type_list
+
+
+class ReportAnswersIndex:
+    """
+    Bulk loads the `Answer` subtype instances given by a set of `EpicUser` and groups them by `Question`.
+    This way a report requires one query per `Answer` subtype instead of several queries per `Question`.
+    The users are filtered in the database (subquery or organization), so the report queries do not grow with the number of users.
+    """
+
+    def __init__(
+        self,
+        users: models.QuerySet,
+        questions: Optional[Union[models.QuerySet, List[int]]] = None,
+        answers_filter: Optional[Q] = None,
+    ) -> None:
+        """
+        Args:
+            users (models.QuerySet): Users whose answers will be reported.
+            questions (Optional[Union[models.QuerySet, List[int]]], optional): Questions to restrict the answers to. Defaults to None (all questions).
+            answers_filter (Optional[Q], optional): Filter equivalent to the answers of `users` (e.g. on `user__organization_id`). Defaults to None (subquery of `users`).
+        """
+        self.users = users
+        if answers_filter is None:
+            answers_filter = Q(user__in=users.values("pk"))
+        self._answers_filter = answers_filter
+        self._questions = questions
+        self._question_answers: Optional[Dict[int, List[Answer]]] = None
+        self._expected_answers: Optional[int] = None
+
+    @classmethod
+    def for_user(cls, user: User) -> ReportAnswersIndex:
+        """
+        Gets the index of all the answers visible to the given user (see `get_report_users`).
+        """
+        return cls(
+            get_report_users(user), answers_filter=get_report_answers_filter(user)
+        )
+
+    @property
+    def expected_answers(self) -> int:
+        """
+        Number of answers expected per `Question` (one per user), counted in the database once.
+        """
+        if self._expected_answers is None:
+            self._expected_answers = self.users.count()
+        return self._expected_answers
+
+    def _get_subtype_queryset(self, answer_subtype: Type[Answer]) -> models.QuerySet:
+        subtype_queryset = answer_subtype.objects.filter(self._answers_filter)
+        if self._questions is not None:
+            subtype_queryset = subtype_queryset.filter(question__in=self._questions)
+        m2m_fields = [m2m.name for m2m in answer_subtype._meta.many_to_many]
+        return subtype_queryset.prefetch_related(*m2m_fields).order_by("pk")
+
+    def _load_question_answers(self) -> Dict[int, List[Answer]]:
+        question_answers: Dict[int, List[Answer]] = {}
+        for answer_subtype in get_submodel_type_list(Answer):
+            for st_answer in self._get_subtype_queryset(answer_subtype):
+                question_answers.setdefault(st_answer.question_id, []).append(st_answer)
+        return question_answers
+
+    def get_answers(self, question: Question) -> List[Answer]:
+        """
+        Gets the answers (as their concrete subtype) given to the provided `Question`.
+
+        Args:
+            question (Question): Question whose answers are requested.
+
+        Returns:
+            List[Answer]: List of `Answer` subtype instances sorted by `pk`.
+        """
+        if self._question_answers is None:
+            self._question_answers = self._load_question_answers()
+        return self._question_answers.get(question.pk, [])
 
 
 class AnswerListReportSerializer(serializers.ListSerializer):
     def _get_answers_summary(
-        self, answers_list: Union[models.QuerySet, List[Answer]], expected_answers: int
+        self, answers_list: List[Answer], expected_answers: int
     ) -> Dict[str, Any]:
-        if not answers_list or len(answers_list) == 0:
+        if not answers_list:
             return {}
-        subtype: Type[Answer] = type(
-            get_instance_as_submodel_type(answers_list.first())
-        )
-        subtype_answer_list = subtype.objects.filter(
-            id__in=[al.id for al in answers_list]
-        )
-        detailed_summary = subtype.get_detailed_summary(
-            subtype_answer_list,
-        )
+        detailed_summary = type(answers_list[0]).get_detailed_summary(answers_list)
         missing_answers = expected_answers - len(answers_list)
         detailed_summary["no_valid_response"] = (
             missing_answers + detailed_summary["no_valid_response"]
         )
         return detailed_summary
 
+    def _get_answers_index(self, question: Question) -> ReportAnswersIndex:
+        answers_index: Optional[ReportAnswersIndex] = self.context.get(
+            "answers_index", None
+        )
+        if answers_index is None:
+            # Serializing a single question, only its answers are required.
+            answers_index = ReportAnswersIndex(
+                self.context["users"], questions=[question.pk]
+            )
+        return answers_index
+
     def to_representation(self, data):
-        organization_users = self.context["users"].all()
-        user_ids = [eu.id for eu in organization_users]
-        filtered_data = Answer.objects.filter(question=data.instance, user__in=user_ids)
-        answers_summary = self._get_answers_summary(filtered_data, len(user_ids))
+        answers_index = self._get_answers_index(data.instance)
+        filtered_data = answers_index.get_answers(data.instance)
+        answers_summary = self._get_answers_summary(
+            filtered_data, answers_index.expected_answers
+        )
 
         serialized_answers = super(AnswerListReportSerializer, self).to_representation(
             filtered_data
@@ -52,7 +135,9 @@ class AnswerReportSerializer(serializers.BaseSerializer):
         list_serializer_class = AnswerListReportSerializer
 
     def to_representation(self, instance: Answer):
-        st_answer: Answer = get_instance_as_submodel_type(instance)
+        st_answer: Answer = instance
+        if type(instance) is Answer:
+            st_answer = get_instance_as_submodel_type(instance)
         st_serializer: serializers.ModelSerializer = (
             AnswerSerializer.get_concrete_serializer(type(st_answer))
         )
@@ -61,7 +146,18 @@ class AnswerReportSerializer(serializers.BaseSerializer):
         )
 
 
-class QuestionReportSerializer(serializers.ModelSerializer):
+class _ReportUrlMixin:
+    def get_fields(self):
+        """
+        Reports rendered out of a request (`ReportJob`) cannot build the `url` field, so it is left out.
+        """
+        report_fields = super().get_fields()
+        if self.context.get("request", None) is None:
+            report_fields.pop("url", None)
+        return report_fields
+
+
+class QuestionReportSerializer(_ReportUrlMixin, serializers.ModelSerializer):
     question_answers = AnswerReportSerializer(many=True, read_only=True)
 
     class Meta:
@@ -69,10 +165,126 @@ class QuestionReportSerializer(serializers.ModelSerializer):
         fields = ("url", "id", "title", "question_answers")
 
 
-class ProgramReportSerializer(serializers.ModelSerializer):
+class ProgramReportSerializer(_ReportUrlMixin, serializers.ModelSerializer):
+    """
+    Serializer to report all the answers given to the questions of a `Program`.
+    When serializing many programs the context should contain an `answers_index` (`ReportAnswersIndex`) so the answers are loaded in bulk.
+    """
 
     questions = QuestionReportSerializer(many=True, read_only=True)
 
     class Meta:
         model = Program
         fields = ("url", "id", "name", "questions")
+
+
+def get_report_users(user: User) -> models.QuerySet:
+    """
+    Gets the `EpicUser` whose answers can be reported to the given user.
+
+    Args:
+        user (User): User requesting the report.
+
+    Returns:
+        models.QuerySet: All `EpicUser` for admins, otherwise those of the user's organization.
+    """
+    if user.is_staff or user.is_superuser:
+        return EpicUser.objects.all()
+    return EpicUser.objects.filter(organization_id=user.epicuser.organization_id)
+
+
+def get_report_answers_filter(user: User) -> Q:
+    """
+    Gets the filter of the `Answer` given by the users of `get_report_users`, on the organization instead of on (a list of) the users.
+
+    Args:
+        user (User): User requesting the report.
+
+    Returns:
+        Q: Empty filter for admins, otherwise the answers of the user's organization.
+    """
+    if user.is_staff or user.is_superuser:
+        return Q()
+    return Q(user__organization_id=user.epicuser.organization_id)
+
+
+def get_report_organization_names(user: User) -> List[str]:
+    """
+    Gets the names of the `EpicOrganization` included in the report of the given user.
+    """
+    if user.is_staff or user.is_superuser:
+        return [eo.name for eo in EpicOrganization.objects.all()]
+    return [user.epicuser.organization.name]
+
+
+def get_report_data(user: User, request: Optional[Any] = None) -> ReturnList:
+    """
+    Serializes the report of all `Program` with the answers visible to the given user.
+
+    Args:
+        user (User): User requesting the report.
+        request (Optional[Any], optional): Request to build the `url` fields with. Defaults to None (no urls).
+
+    Returns:
+        ReturnList: Serialized report, one entry per `Program`.
+    """
+    answers_index = ReportAnswersIndex.for_user(user)
+    return ProgramReportSerializer(
+        Program.objects.prefetch_related("questions"),
+        many=True,
+        context={
+            "request": request,
+            "users": answers_index.users,
+            "answers_index": answers_index,
+        },
+    ).data
+
+
+def get_report_summary(user: User) -> List[Dict[str, Any]]:
+    """
+    Summarizes the answers visible to the given user per `Program` and `Question` from the answer tallies (`AnswerTally`).
+    The number of queries and rows read does not depend on the number of users nor answers, but justifications are not included.
+
+    Args:
+        user (User): User requesting the summary.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per `Program` with the summary of each of its questions.
+    """
+    tallies = AnswerTally.objects.all()
+    if not (user.is_staff or user.is_superuser):
+        tallies = tallies.filter(organization_id=user.epicuser.organization_id)
+    question_tallies: Dict[int, AnswerTally] = {}
+    for tally in tallies:
+        question_tallies.setdefault(
+            tally.question_id, AnswerTally(question_id=tally.question_id)
+        ).add_tally(tally)
+    answer_types = Answer.get_question_answer_types(question_tallies)
+    expected_answers = get_report_users(user).count()
+    programs = list(Program.objects.prefetch_related("questions").order_by("pk"))
+    program_names = {str(program.pk): program.name for program in programs}
+
+    def get_question_summary(question: Question) -> Dict[str, Any]:
+        tally = question_tallies.get(question.pk)
+        a_type = answer_types.get(question.pk)
+        if not tally or not tally.n_answers or not a_type:
+            return {}
+        tally_summary = a_type.get_tally_summary(tally, program_names)
+        tally_summary["no_valid_response"] += expected_answers - tally.n_answers
+        return tally_summary
+
+    return [
+        dict(
+            id=program.pk,
+            name=program.name,
+            questions=[
+                dict(
+                    id=question.pk,
+                    title=question.title,
+                    summary=get_question_summary(question),
+                )
+                for question in program.questions.all()
+            ],
+        )
+        for program in programs
+    ]
@@ -0,0 +1,321 @@
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from django.db import models
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from epic_app.models.answer_tally import AnswerTally, AnswerTallyChanges
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.utils import get_submodel_type_list
+
+# Users and organizations define the scope (and expected answers) of a report.
+_answers_models = (Answer, EpicUser, EpicOrganization)
+_domain_models = (Area, Group, Program, Agency, Question)
+# Deleting these models also deletes (cascade) the answers and their tallies.
+_tally_models = (Area, Group, Program, Question, EpicOrganization)
+
+
+def _get_instance_organization_ids(instance: Any) -> Set[Optional[int]]:
+    if isinstance(instance, EpicOrganization):
+        return {instance.pk}
+    if isinstance(instance, EpicUser):
+        # A user moved to another organization also changes the reports of the previous one.
+        return {
+            instance.organization_id,
+            instance.__dict__.get("_tally_organization_id", instance.organization_id),
+        }
+    return set(_get_organization_ids([instance]).values())
+
+
+def _get_data_version_name(
+    model: Type[models.Model],
+) -> Optional[EpicDataVersionName]:
+    if issubclass(model, _answers_models):
+        return EpicDataVersionName.ANSWERS
+    if issubclass(model, _domain_models):
+        return EpicDataVersionName.DOMAIN
+    return None
+
+
+def _renew_data_version(instance: Any):
+    data_version_name = _get_data_version_name(type(instance))
+    if data_version_name == EpicDataVersionName.ANSWERS:
+        EpicDataVersion.renew(
+            EpicDataVersionName.ANSWERS, _get_instance_organization_ids(instance)
+        )
+    elif data_version_name:
+        EpicDataVersion.renew(data_version_name)
+
+
+def renew_deleted_data_version(model: Type[models.Model]):
+    """
+    Renews (once) the data version of a model after deleting a queryset of it, as its rows do not renew it one by one.
+
+    Args:
+        model (Type[models.Model]): Model whose queryset was deleted.
+    """
+    data_version_name = _get_data_version_name(model)
+    if data_version_name:
+        EpicDataVersion.renew(data_version_name)
+
+
+@receiver(post_save)
+def renew_version_on_save(sender, instance: Any, raw: bool = False, **kwargs):
+    if not raw:
+        _renew_data_version(instance)
+
+
+def renew_version_on_delete(sender, instance: Any, origin: Any = None, **kwargs):
+    if origin is None or origin is instance:
+        _renew_data_version(instance)
+        return
+    if isinstance(origin, models.QuerySet) or _get_data_version_name(type(origin)):
+        # Queryset deletes (e.g. imports) renew the version once explicitly, cascades through their origin.
+        return
+    # Cascaded from an unversioned instance (e.g. a `User`), renewed once for the whole delete.
+    renewed_names = origin.__dict__.setdefault("_renewed_data_versions", set())
+    data_version_name = _get_data_version_name(type(instance))
+    if data_version_name not in renewed_names:
+        renewed_names.add(data_version_name)
+        EpicDataVersion.renew(data_version_name)
+
+
+# Explicit senders, listening to the deletes of any model disables their fast (cascade) deletes.
+for _versioned_model in [
+    *_answers_models,
+    *get_submodel_type_list(Answer),
+    *_domain_models,
+    *get_submodel_type_list(Question),
+]:
+    post_delete.connect(renew_version_on_delete, sender=_versioned_model)
+
+
+@receiver(m2m_changed)
+def renew_version_on_m2m_changed(sender, instance: Any, action: str, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        _renew_data_version(instance)
+
+
+def _is_tallied_answer(instance: Any) -> bool:
+    # Answers are tallied as their subtype, base `Answer` instances are also sent when deleting a subtype.
+    return isinstance(instance, Answer) and type(instance) is not Answer
+
+
+def _get_answer_tally_key(answer: Answer) -> Tuple[Any, ...]:
+    return (
+        answer.question_id,
+        answer.user_id,
+        getattr(answer, "selected_choice", None),
+    )
+
+
+def _get_organization_ids(answers: List[Answer]) -> Dict[int, Optional[int]]:
+    """
+    Gets the organization of the users of the given answers, only querying the users not already cached.
+    """
+    organization_ids: Dict[int, Optional[int]] = {}
+    for answer in answers:
+        if Answer.user.is_cached(answer) and answer.user.pk == answer.user_id:
+            organization_ids[answer.user_id] = answer.user.organization_id
+    missing_user_ids = {answer.user_id for answer in answers} - organization_ids.keys()
+    if missing_user_ids:
+        organization_ids.update(
+            EpicUser.objects.filter(pk__in=missing_user_ids).values_list(
+                "pk", "organization_id"
+            )
+        )
+    return organization_ids
+
+
+def _get_answer_program_ids(answer: Answer) -> Set[int]:
+    if not isinstance(answer, MultipleChoiceAnswer):
+        return set()
+    return AnswerTally.get_answers_program_ids([answer.pk])[answer.pk]
+
+
+def _is_tally_deleted(origin: Any) -> bool:
+    if isinstance(origin, models.QuerySet):
+        return issubclass(origin.model, _tally_models)
+    return isinstance(origin, _tally_models)
+
+
+@receiver(pre_save)
+def load_tallied_answer(sender, instance: Any, raw: bool = False, **kwargs):
+    if (
+        raw
+        or not _is_tallied_answer(instance)
+        or instance.pk is None
+        or hasattr(instance, "_loaded_values")
+    ):
+        return
+    # Answers not loaded from the database (e.g. built with an existing `pk`) discount their stored values.
+    stored_answer = type(instance)._base_manager.filter(pk=instance.pk).first()
+    instance._loaded_values = getattr(stored_answer, "_loaded_values", None)
+
+
+@receiver(post_save)
+def tally_answer_on_save(
+    sender, instance: Any, created: bool, raw: bool = False, **kwargs
+):
+    if raw or not _is_tallied_answer(instance):
+        return
+    loaded_values = None if created else getattr(instance, "_loaded_values", None)
+    stored_answer = type(instance)(**loaded_values) if loaded_values else None
+    instance._loaded_values = {
+        a_field.attname: getattr(instance, a_field.attname)
+        for a_field in instance._meta.concrete_fields
+    }
+    if stored_answer and _get_answer_tally_key(stored_answer) == _get_answer_tally_key(
+        instance
+    ):
+        return
+    program_ids = set() if created else _get_answer_program_ids(instance)
+    organization_ids = _get_organization_ids(
+        [instance] + ([stored_answer] if stored_answer else [])
+    )
+    tally_changes = AnswerTallyChanges()
+    if stored_answer:
+        tally_changes.add_answer(
+            stored_answer,
+            organization_ids.get(stored_answer.user_id),
+            program_ids,
+            sign=-1,
+        )
+    tally_changes.add_answer(
+        instance, organization_ids.get(instance.user_id), program_ids
+    )
+    tally_changes.apply()
+
+
+def _tally_programs_change(
+    programs_before: Dict[int, Set[int]], programs_after: Dict[int, Set[int]]
+):
+    changed_ids = [
+        answer_id
+        for answer_id, program_ids in programs_before.items()
+        if program_ids != programs_after[answer_id]
+    ]
+    if not changed_ids:
+        return
+    tally_changes = AnswerTallyChanges()
+    for answer in (
+        MultipleChoiceAnswer.objects.filter(pk__in=changed_ids)
+        .annotate(organization_id=models.F("user__organization_id"))
+        .only("question_id")
+    ):
+        tally_changes.add_answer(
+            answer, answer.organization_id, programs_before[answer.pk], sign=-1
+        )
+        tally_changes.add_answer(
+            answer, answer.organization_id, programs_after[answer.pk]
+        )
+    tally_changes.apply()
+
+
+@receiver(pre_delete, sender=Program)
+def discount_answer_on_delete(sender, instance: Any, **kwargs):
+    if isinstance(instance, Program):
+        # The answers to the program's own questions are deleted with it.
+        programs_before = AnswerTally.get_answers_program_ids(
+            instance.selected_answers.exclude(question__program=instance).values_list(
+                "pk", flat=True
+            )
+        )
+        _tally_programs_change(
+            programs_before,
+            {
+                answer_id: program_ids - {instance.pk}
+                for answer_id, program_ids in programs_before.items()
+            },
+        )
+        return
+    if not _is_tallied_answer(instance) or _is_tally_deleted(kwargs.get("origin")):
+        return
+    loaded_values = getattr(instance, "_loaded_values", None)
+    stored_answer = type(instance)(**loaded_values) if loaded_values else instance
+    tally_changes = AnswerTallyChanges()
+    tally_changes.add_answer(
+        stored_answer,
+        _get_organization_ids([instance, stored_answer]).get(stored_answer.user_id),
+        _get_answer_program_ids(instance),
+        sign=-1,
+    )
+    tally_changes.apply()
+
+
+for _answer_type in get_submodel_type_list(Answer):
+    pre_delete.connect(discount_answer_on_delete, sender=_answer_type)
+
+
+@receiver(m2m_changed, sender=MultipleChoiceAnswer.selected_programs.through)
+def tally_selected_programs(
+    sender,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs,
+):
+    if action.startswith("pre_"):
+        if not reverse:
+            answer_ids = [instance.pk]
+        elif pk_set is None:
+            answer_ids = instance.selected_answers.values_list("pk", flat=True)
+        else:
+            answer_ids = pk_set
+        instance._tally_programs = AnswerTally.get_answers_program_ids(answer_ids)
+        return
+    programs_before = instance.__dict__.pop("_tally_programs", None)
+    if programs_before:
+        _tally_programs_change(
+            programs_before, AnswerTally.get_answers_program_ids(programs_before)
+        )
+
+
+@receiver(pre_save, sender=EpicUser)
+def load_user_organization(sender, instance: EpicUser, raw: bool = False, **kwargs):
+    if raw or instance._state.adding:
+        return
+    instance._tally_organization_id = (
+        EpicUser.objects.filter(pk=instance.pk)
+        .values_list("organization_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=EpicUser)
+def move_user_tallies(
+    sender, instance: EpicUser, created: bool, raw: bool = False, **kwargs
+):
+    if raw or created:
+        return
+    stored_organization_id = instance.__dict__.pop(
+        "_tally_organization_id", instance.organization_id
+    )
+    if stored_organization_id == instance.organization_id:
+        return
+    tally_changes = AnswerTallyChanges()
+    for a_type in get_submodel_type_list(Answer):
+        user_answers = list(a_type.objects.filter(user=instance))
+        answers_programs = (
+            AnswerTally.get_answers_program_ids(a.pk for a in user_answers)
+            if a_type is MultipleChoiceAnswer
+            else {}
+        )
+        for answer in user_answers:
+            program_ids = answers_programs.get(answer.pk, ())
+            tally_changes.add_answer(
+                answer, stored_organization_id, program_ids, sign=-1
+            )
+            tally_changes.add_answer(answer, instance.organization_id, program_ids)
+    tally_changes.apply()
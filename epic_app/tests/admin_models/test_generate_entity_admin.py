@@ -1,11 +1,14 @@
 import pytest
 from django.contrib import admin
+from django.contrib.auth.models import Permission, User
 from rest_framework.test import APIClient
 
+from epic_app.admin_models.data_version_admin import DataVersionAdmin
 from epic_app.admin_models.generate_entity_admin import EpicOrganizationAdmin, LnkAdmin
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
 from epic_app.models.epic_questions import LinkagesQuestion
 from epic_app.models.epic_user import EpicOrganization, EpicUser
-from epic_app.models.models import Program
+from epic_app.models.models import Group, Program
 from epic_app.tests.epic_db_fixture import epic_test_db
 from epic_app.tests.request_helper import _create_get_request, _create_post_request
 
@@ -42,6 +45,7 @@ class TestLinkagesQuestionAdmin:
         # Verify initial expectations
         assert len(Program.objects.all()) > 0
         previous_lq_ids = [lq.pk for lq in LinkagesQuestion.objects.all()]
+        domain_version = EpicDataVersion.get_versions(EpicDataVersionName.DOMAIN)
 
         # Run test
         r_result = api_client.post(
@@ -58,6 +62,31 @@ class TestLinkagesQuestionAdmin:
         assert not any(
             lq.pk in previous_lq_ids for lq in LinkagesQuestion.objects.all()
         )
+        assert (
+            EpicDataVersion.get_versions(EpicDataVersionName.DOMAIN) != domain_version
+        )
+
+    @pytest.mark.django_db
+    def test_POST_generate_entities_without_permissions(self, epic_test_db):
+        # Define test data, a staff user only allowed to view the linkages.
+        staff_user = User.objects.create_user(
+            username="Tarkin", password="tarkin", is_staff=True
+        )
+        staff_user.user_permissions.add(
+            Permission.objects.get(codename="view_linkagesquestion")
+        )
+        api_client = APIClient()
+        api_client.login(username="Tarkin", password="tarkin")
+        LinkagesQuestion.generate_linkages()
+        previous_lq_ids = [lq.pk for lq in LinkagesQuestion.objects.all()]
+
+        # Run test
+        api_client.post(
+            "/admin/epic_app/linkagesquestion/", {"action": "generate_entities"}
+        )
+
+        # Verify expectations
+        assert [lq.pk for lq in LinkagesQuestion.objects.all()] == previous_lq_ids
 
 
 class TestEpicOrganizationAdmin:
@@ -125,3 +154,23 @@ class TestEpicOrganizationAdmin:
         assert r_result.status_code == 302  # Redirection
         assert r_result.url == ".."
         assert len(EpicUser.objects.all()) == generate_n_users
+
+
+class TestDataVersionAdmin:
+    @pytest.mark.django_db
+    def test_delete_queryset_renews_data_version(self, epic_test_db):
+        # Define test data
+        group_admin: DataVersionAdmin = admin.site._registry[Group]
+        domain_version = EpicDataVersion.get_versions(EpicDataVersionName.DOMAIN)
+
+        # Run test
+        group_admin.delete_queryset(
+            _create_post_request("delete/", {}), Group.objects.all()
+        )
+
+        # Verify expectations
+        assert isinstance(group_admin, DataVersionAdmin)
+        assert not Group.objects.exists()
+        assert (
+            EpicDataVersion.get_versions(EpicDataVersionName.DOMAIN) != domain_version
+        )
@@ -0,0 +1,172 @@
+import os
+from typing import Dict, List
+
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+
+from epic_app.load_dataset import LoadDataset
+from epic_app.models.epic_questions import (
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.utils import bulk_create_submodel_instances
+
+
+class BenchmarkScale:
+    """
+    Size of the synthetic dataset the benchmarks run against.
+    """
+
+    def __init__(
+        self,
+        n_areas: int,
+        n_groups_per_area: int,
+        n_programs_per_group: int,
+        n_questions_per_program: int,
+        n_organizations: int,
+        n_users_per_organization: int,
+        answered_ratio: float,
+        seed: int = 42,
+    ) -> None:
+        """
+        Args:
+            n_areas (int): Number of `Area`.
+            n_groups_per_area (int): Number of `Group` in each `Area`.
+            n_programs_per_group (int): Number of `Program` in each `Group`.
+            n_questions_per_program (int): Number of questions of each (agreement and evolution) type in each `Program`.
+            n_organizations (int): Number of `EpicOrganization`.
+            n_users_per_organization (int): Number of `EpicUser` in each `EpicOrganization`.
+            answered_ratio (float): Ratio (0 to 1) of questions answered by each user.
+            seed (int, optional): Seed of the random choices, so that the dataset is reproducible. Defaults to 42.
+        """
+        self.n_areas = n_areas
+        self.n_groups_per_area = n_groups_per_area
+        self.n_programs_per_group = n_programs_per_group
+        self.n_questions_per_program = n_questions_per_program
+        self.n_organizations = n_organizations
+        self.n_users_per_organization = n_users_per_organization
+        self.answered_ratio = answered_ratio
+        self.seed = seed
+
+
+benchmark_scales: Dict[str, BenchmarkScale] = {
+    "small": BenchmarkScale(2, 2, 3, 2, 2, 10, 0.5),
+    "medium": BenchmarkScale(4, 3, 4, 3, 5, 100, 0.5),
+    # Workshop sized, 5000 users.
+    "large": BenchmarkScale(3, 2, 2, 2, 10, 500, 0.1),
+}
+
+
+def get_benchmark_scale_name() -> str:
+    """
+    Gets the benchmark scale requested through the `EPIC_BENCHMARK_SCALE` environment variable, `small` by default.
+    """
+    scale_name = os.environ.get("EPIC_BENCHMARK_SCALE", "small")
+    if scale_name not in benchmark_scales:
+        raise ValueError(
+            f"Unknown benchmark scale {scale_name}, available: {', '.join(benchmark_scales)}."
+        )
+    return scale_name
+
+
+def _create_domain(scale: BenchmarkScale) -> List[Program]:
+    areas = Area.objects.bulk_create(
+        Area(name=f"Area {n_area}") for n_area in range(scale.n_areas)
+    )
+    groups = Group.objects.bulk_create(
+        Group(name=f"Group {area.pk}.{n_group}", area=area)
+        for area in areas
+        for n_group in range(scale.n_groups_per_area)
+    )
+    programs = Program.objects.bulk_create(
+        Program(
+            name=f"Program {group.pk}.{n_program}",
+            description=f"Description of program {group.pk}.{n_program}.",
+            group=group,
+        )
+        for group in groups
+        for n_program in range(scale.n_programs_per_group)
+    )
+    agencies = Agency.objects.bulk_create(
+        Agency(name=f"Agency {n_agency}") for n_agency in range(len(groups))
+    )
+    Program.agencies.through.objects.bulk_create(
+        Program.agencies.through(program_id=program.pk, agency_id=agency.pk)
+        for n_program, program in enumerate(programs)
+        for agency in agencies[n_program % len(agencies) :][:2]
+    )
+    return programs
+
+
+def _create_questions(scale: BenchmarkScale, programs: List[Program]):
+    for agreement_type in [NationalFrameworkQuestion, KeyAgencyActionsQuestion]:
+        bulk_create_submodel_instances(
+            agreement_type,
+            [
+                agreement_type(
+                    title=f"{agreement_type.__name__} {n_question}",
+                    description="Lorem ipsum dolor sit amet.",
+                    program=program,
+                )
+                for program in programs
+                for n_question in range(scale.n_questions_per_program)
+            ],
+        )
+    bulk_create_submodel_instances(
+        EvolutionQuestion,
+        [
+            EvolutionQuestion(
+                title=f"Dimension {n_question}",
+                nascent_description="Nascent.",
+                engaged_description="Engaged.",
+                capable_description="Capable.",
+                effective_description="Effective.",
+                program=program,
+            )
+            for program in programs
+            for n_question in range(scale.n_questions_per_program)
+        ],
+    )
+    LinkagesQuestion.generate_linkages()
+
+
+def _create_admin() -> User:
+    admin_user = User(username="admin", is_superuser=True, is_staff=True)
+    admin_user.set_password("admin")
+    admin_user.save()
+    Token.objects.create(user=admin_user)
+    return admin_user
+
+
+def create_benchmark_dataset(scale: BenchmarkScale) -> Dict[str, User]:
+    """
+    Creates a reproducible EPIC dataset (domain, questions, users and answers) of the given scale in bulk.
+
+    Args:
+        scale (BenchmarkScale): Size of the dataset.
+
+    Returns:
+        Dict[str, User]: The `admin`, `advisor` and (non advisor) `epic_user` users to request with.
+    """
+    _create_questions(scale, _create_domain(scale))
+    admin_user = _create_admin()
+    LoadDataset(
+        n_organizations=scale.n_organizations,
+        n_users_per_organization=scale.n_users_per_organization,
+        answered_ratio=scale.answered_ratio,
+        prefix="benchmark",
+        password="benchmark",
+        seed=scale.seed,
+    ).generate()
+    epic_users = EpicUser.objects.filter(username__startswith="benchmark_").order_by(
+        "pk"
+    )
+    # One advisor per dataset, the first user of the first organization.
+    advisor = epic_users.first()
+    advisor.is_advisor = True
+    advisor.save()
+    return dict(admin=admin_user, advisor=advisor, epic_user=epic_users.last())
@@ -0,0 +1,123 @@
+import re
+from typing import Callable, Dict, Set
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection, models, transaction
+from django.db.models import Count
+from django.test.utils import override_settings
+
+from epic_app.models.answer_tally import AnswerTally
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.serializers.report_serializer import (
+    ReportAnswersIndex,
+    get_report_users,
+)
+from epic_app.tests.benchmarks.benchmark_dataset import (
+    benchmark_scales,
+    create_benchmark_dataset,
+)
+from epic_app.utils import get_submodel_type_list
+
+# Tables growing with the number of users.
+large_tables = {
+    a_model._meta.db_table
+    for a_model in [
+        User,
+        EpicUser,
+        AnswerTally,
+        MultipleChoiceAnswer.selected_programs.through,
+        *get_submodel_type_list(Answer),
+        Answer,
+    ]
+}
+
+
+def _get_scanned_tables(queryset: models.QuerySet) -> Set[str]:
+    """
+    Gets the tables sequentially scanned (not searched through an index) by the plan of a queryset.
+    """
+    query_plan = queryset.explain()
+    if connection.vendor == "postgresql":
+        return set(re.findall(r"Seq Scan on (\w+)", query_plan))
+    return set(re.findall(r"\bSCAN (?:TABLE )?(\w+)", query_plan))
+
+
+@pytest.fixture(scope="module")
+def query_plans_dataset(
+    django_db_setup: pytest.fixture, django_db_blocker: pytest.fixture
+) -> Dict[str, User]:
+    """
+    Creates the small benchmark dataset once for all the query plans, it is rolled back at the end.
+    """
+    with django_db_blocker.unblock(), override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    ):
+        with transaction.atomic():
+            dataset = create_benchmark_dataset(benchmark_scales["small"])
+            if connection.vendor == "postgresql":
+                # Such a small dataset would be scanned anyway, we only verify an index can be used.
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+            yield dataset
+            transaction.set_rollback(True)
+
+
+def _get_progress_queryset(dataset: Dict[str, User]) -> models.QuerySet:
+    return MultipleChoiceAnswer.objects.filter(
+        user=dataset["epic_user"],
+        question__in=Program.objects.order_by("pk").first().questions.all(),
+    ).annotate(selected_programs_count=Count("selected_programs"))
+
+
+def _get_question_answers_queryset(dataset: Dict[str, User]) -> models.QuerySet:
+    return Answer.objects.filter(
+        question=Question.objects.order_by("pk").first(),
+        user__in=EpicUser.objects.all(),
+    ).values_list("user_id", flat=True)
+
+
+def _get_report_answers_queryset(answer_type) -> Callable[..., models.QuerySet]:
+    return lambda dataset: ReportAnswersIndex.for_user(
+        dataset["advisor"]
+    )._get_subtype_queryset(answer_type)
+
+
+# The admin report reads all the answers, a sequential scan is expected there.
+hot_queries: Dict[str, Callable[[Dict[str, User]], models.QuerySet]] = {
+    "progress": _get_progress_queryset,
+    "question-answers": _get_question_answers_queryset,
+    **{
+        f"advisor-report-{a_type.__name__}": _get_report_answers_queryset(a_type)
+        for a_type in get_submodel_type_list(Answer)
+    },
+    "advisor-report-users": lambda dataset: get_report_users(dataset["advisor"]),
+    "advisor-report-summary": lambda dataset: AnswerTally.objects.filter(
+        organization_id=dataset["advisor"].organization_id
+    ),
+    "program-questions": lambda dataset: Question.objects.filter(
+        program=Program.objects.order_by("pk").first()
+    ),
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "get_queryset",
+    [pytest.param(get_qs, id=q_name) for q_name, get_qs in hot_queries.items()],
+)
+def test_hot_query_does_not_scan_large_tables(
+    get_queryset: Callable[[Dict[str, User]], models.QuerySet],
+    query_plans_dataset: Dict[str, User],
+):
+    # Define test data
+    queryset = get_queryset(query_plans_dataset)
+
+    # Run test
+    scanned_tables = _get_scanned_tables(queryset)
+
+    # Verify final expectations
+    assert not (scanned_tables & large_tables), queryset.explain()
@@ -0,0 +1,473 @@
+import json
+import os
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from epic_app.models.epic_answers import AgreementAnswer, AgreementAnswerType, Answer
+from epic_app.models.epic_questions import (
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.epic_user import EpicOrganization
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.models.report_job import ReportJob
+from epic_app.tests.benchmarks.benchmark_dataset import (
+    benchmark_scales,
+    create_benchmark_dataset,
+    get_benchmark_scale_name,
+)
+from epic_app.urls import router
+
+baseline_file = Path(__file__).parent / "rest_benchmark_baseline.json"
+# Wall time and peak memory depend on the machine, they are only verified when explicitely benchmarking.
+strict_benchmark = bool(os.environ.get("EPIC_BENCHMARK", ""))
+update_baseline = bool(os.environ.get("EPIC_BENCHMARK_UPDATE_BASELINE", ""))
+tolerance = float(os.environ.get("EPIC_BENCHMARK_TOLERANCE", "1.5"))
+# Absolute margins so that the fastest (and smallest) requests do not fail on noise.
+wall_time_margin = 0.05
+peak_memory_margin = 256 * 1024
+
+
+class BenchmarkRequest:
+    """
+    Request to benchmark, its url and data are resolved once the dataset exists.
+    """
+
+    def __init__(
+        self,
+        url_name: str,
+        username: str,
+        method: str = "get",
+        get_url_kwargs: Optional[Callable[[Dict[str, User]], Dict[str, Any]]] = None,
+        get_data: Optional[Callable[[Dict[str, User]], Dict[str, Any]]] = None,
+        set_up: Optional[Callable[[Dict[str, User]], None]] = None,
+    ) -> None:
+        """
+        Args:
+            url_name (str): Name of the router url.
+            username (str): Dataset user (`admin`, `advisor` or `epic_user`) doing the request.
+            method (str, optional): HTTP method. Defaults to "get".
+            get_url_kwargs (Optional[Callable[[Dict[str, User]], Dict[str, Any]]], optional): Gets the url arguments. Defaults to None.
+            get_data (Optional[Callable[[Dict[str, User]], Dict[str, Any]]], optional): Gets the request data. Defaults to None.
+            set_up (Optional[Callable[[Dict[str, User]], None]], optional): Restores the data before each (non idempotent) request. Defaults to None.
+        """
+        self.url_name = url_name
+        self.username = username
+        self.method = method
+        self.get_url_kwargs = get_url_kwargs or (lambda dataset: {})
+        self.get_data = get_data or (lambda dataset: None)
+        self.set_up = set_up or (lambda dataset: None)
+
+
+def _first_pk(model_type) -> Callable[[Dict[str, User]], Dict[str, Any]]:
+    return lambda dataset: dict(pk=model_type.objects.order_by("pk").first().pk)
+
+
+def _own_pk(username: str) -> Callable[[Dict[str, User]], Dict[str, Any]]:
+    return lambda dataset: dict(pk=dataset[username].pk)
+
+
+def _own_agreement_answer_pk(dataset: Dict[str, User]) -> Dict[str, Any]:
+    return dict(
+        pk=AgreementAnswer.objects.filter(user=dataset["epic_user"])
+        .order_by("pk")
+        .first()
+        .pk
+    )
+
+
+def _new_answer_data(dataset: Dict[str, User]) -> Dict[str, Any]:
+    return dict(
+        question=NationalFrameworkQuestion.objects.order_by("pk").first().pk,
+        selected_choice=AgreementAnswerType.AGR,
+        justify_answer="Lorem ipsum.",
+    )
+
+
+def _remove_new_answer(dataset: Dict[str, User]):
+    Answer.objects.filter(
+        user=dataset["epic_user"], question=_new_answer_data(dataset)["question"]
+    ).delete()
+
+
+def _program_answers_data(dataset: Dict[str, User]) -> List[Dict[str, Any]]:
+    """
+    Answers of all the questions of the first program, as a user filling it in at once.
+    """
+    program = Program.objects.order_by("pk").first()
+    return [
+        dict(
+            question=q_pk, justify_answer="Lorem ipsum.", selected_programs=[program.pk]
+        )
+        for q_pk in program.questions.order_by("pk").values_list("pk", flat=True)
+    ]
+
+
+def _own_report_job_pk(dataset: Dict[str, User]) -> Dict[str, Any]:
+    return dict(pk=ReportJob.objects.filter(user=dataset["advisor"]).first().pk)
+
+
+benchmark_requests = [
+    pytest.param(BenchmarkRequest("api-root", "epic_user"), id="api-root"),
+    # Users
+    pytest.param(BenchmarkRequest("epicuser-list", "admin"), id="epicuser-list"),
+    pytest.param(
+        BenchmarkRequest("epicuser-detail", "admin", get_url_kwargs=_own_pk("advisor")),
+        id="epicuser-detail",
+    ),
+    pytest.param(
+        BenchmarkRequest(
+            "epicuser-change_password",
+            "epic_user",
+            method="put",
+            get_url_kwargs=_own_pk("epic_user"),
+            get_data=lambda dataset: dict(password="epic_user"),
+        ),
+        id="epicuser-change_password",
+    ),
+    pytest.param(
+        BenchmarkRequest("epicorganization-list", "admin"), id="epicorganization-list"
+    ),
+    pytest.param(
+        BenchmarkRequest(
+            "epicorganization-detail",
+            "admin",
+            get_url_kwargs=_first_pk(EpicOrganization),
+        ),
+        id="epicorganization-detail",
+    ),
+    pytest.param(
+        BenchmarkRequest("epicorganization-report", "advisor"),
+        id="epicorganization-report-advisor",
+    ),
+    pytest.param(
+        BenchmarkRequest("epicorganization-report", "admin"),
+        id="epicorganization-report-admin",
+    ),
+    pytest.param(
+        BenchmarkRequest("epicorganization-report-summary", "advisor"),
+        id="epicorganization-report-summary-advisor",
+    ),
+    pytest.param(
+        BenchmarkRequest("epicorganization-report-summary", "admin"),
+        id="epicorganization-report-summary-admin",
+    ),
+    pytest.param(
+        BenchmarkRequest("epicorganization-report-pdf", "advisor"),
+        id="epicorganization-report-pdf",
+    ),
+    pytest.param(
+        BenchmarkRequest("epicorganization-report-cache", "admin"),
+        id="epicorganization-report-cache",
+    ),
+    # Report jobs
+    pytest.param(
+        BenchmarkRequest("reportjob-list", "advisor", method="post"),
+        id="reportjob-create",
+    ),
+    pytest.param(BenchmarkRequest("reportjob-list", "advisor"), id="reportjob-list"),
+    pytest.param(
+        BenchmarkRequest(
+            "reportjob-detail", "advisor", get_url_kwargs=_own_report_job_pk
+        ),
+        id="reportjob-detail",
+    ),
+    pytest.param(
+        BenchmarkRequest(
+            "reportjob-download", "advisor", get_url_kwargs=_own_report_job_pk
+        ),
+        id="reportjob-download",
+    ),
+    # Domain
+    pytest.param(BenchmarkRequest("area-list", "epic_user"), id="area-list"),
+    pytest.param(
+        BenchmarkRequest("area-detail", "epic_user", get_url_kwargs=_first_pk(Area)),
+        id="area-detail",
+    ),
+    pytest.param(BenchmarkRequest("agency-list", "epic_user"), id="agency-list"),
+    pytest.param(
+        BenchmarkRequest(
+            "agency-detail", "epic_user", get_url_kwargs=_first_pk(Agency)
+        ),
+        id="agency-detail",
+    ),
+    pytest.param(BenchmarkRequest("group-list", "epic_user"), id="group-list"),
+    pytest.param(
+        BenchmarkRequest("group-detail", "epic_user", get_url_kwargs=_first_pk(Group)),
+        id="group-detail",
+    ),
+    pytest.param(BenchmarkRequest("program-list", "epic_user"), id="program-list"),
+    pytest.param(
+        BenchmarkRequest(
+            "program-detail", "epic_user", get_url_kwargs=_first_pk(Program)
+        ),
+        id="program-detail",
+    ),
+    pytest.param(
+        BenchmarkRequest(
+            "program-progress", "epic_user", get_url_kwargs=_first_pk(Program)
+        ),
+        id="program-progress",
+    ),
+    pytest.param(
+        BenchmarkRequest("program-progress_list", "epic_user"),
+        id="program-progress_list",
+    ),
+    pytest.param(
+        BenchmarkRequest("domain-snapshot", "epic_user"), id="domain-snapshot"
+    ),
+    *[
+        pytest.param(
+            BenchmarkRequest(
+                f"program-question_{q_name}",
+                "epic_user",
+                get_url_kwargs=_first_pk(Program),
+            ),
+            id=f"program-question_{q_name}",
+        )
+        for q_name in [
+            "nationalframework",
+            "keyagencyactions",
+            "evolution",
+            "linkages",
+        ]
+    ],
+    # Questions
+    pytest.param(BenchmarkRequest("question-list", "epic_user"), id="question-list"),
+    *[
+        pytest.param(
+            BenchmarkRequest(
+                "question-detail", "epic_user", get_url_kwargs=_first_pk(q_type)
+            ),
+            id=f"question-detail-{q_type.__name__}",
+        )
+        for q_type in [
+            NationalFrameworkQuestion,
+            KeyAgencyActionsQuestion,
+            EvolutionQuestion,
+            LinkagesQuestion,
+        ]
+    ],
+    pytest.param(
+        BenchmarkRequest(
+            "question-answers",
+            "epic_user",
+            get_url_kwargs=_first_pk(NationalFrameworkQuestion),
+        ),
+        id="question-answers-epic_user",
+    ),
+    # One answer per user of the dataset.
+    pytest.param(
+        BenchmarkRequest(
+            "question-answers",
+            "admin",
+            get_url_kwargs=_first_pk(NationalFrameworkQuestion),
+        ),
+        id="question-answers-admin",
+    ),
+    # Answers
+    pytest.param(BenchmarkRequest("answer-list", "epic_user"), id="answer-list"),
+    pytest.param(
+        BenchmarkRequest(
+            "answer-list",
+            "epic_user",
+            method="post",
+            get_data=_new_answer_data,
+            set_up=_remove_new_answer,
+        ),
+        id="answer-create",
+    ),
+    pytest.param(
+        BenchmarkRequest(
+            "answer-detail", "epic_user", get_url_kwargs=_own_agreement_answer_pk
+        ),
+        id="answer-detail",
+    ),
+    pytest.param(
+        BenchmarkRequest(
+            "answer-detail",
+            "epic_user",
+            method="patch",
+            get_url_kwargs=_own_agreement_answer_pk,
+            get_data=lambda dataset: dict(
+                selected_choice=AgreementAnswerType.SAGR,
+                justify_answer="Lorem ipsum dolor.",
+            ),
+        ),
+        id="answer-update",
+    ),
+    pytest.param(
+        BenchmarkRequest(
+            "answer-bulk", "epic_user", method="post", get_data=_program_answers_data
+        ),
+        id="answer-bulk",
+    ),
+]
+
+
+def _load_baseline() -> Dict[str, Any]:
+    if not baseline_file.is_file():
+        return {}
+    return json.loads(baseline_file.read_text())
+
+
+@pytest.fixture(scope="module")
+def benchmark_results() -> Dict[str, Dict[str, Any]]:
+    """
+    Collects the measures of all the benchmarks, written as the new baseline when requested.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    yield results
+    if not update_baseline or not results:
+        return
+    baseline = _load_baseline()
+    scale_baseline = baseline.setdefault(get_benchmark_scale_name(), {})
+    scale_baseline.update(results)
+    baseline_file.write_text(
+        json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+@pytest.fixture(scope="module")
+def benchmark_dataset(
+    django_db_setup: pytest.fixture, django_db_blocker: pytest.fixture, tmp_path_factory
+) -> Dict[str, User]:
+    """
+    Creates the dataset once for all the benchmarks, it is rolled back at the end.
+    """
+    # Hashing passwords is deliberately slow, it is not what we measure.
+    with django_db_blocker.unblock(), override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    ):
+        with transaction.atomic():
+            dataset = create_benchmark_dataset(
+                benchmark_scales[get_benchmark_scale_name()]
+            )
+            if not AgreementAnswer.objects.filter(user=dataset["epic_user"]).exists():
+                AgreementAnswer(
+                    user=dataset["epic_user"],
+                    question=NationalFrameworkQuestion.objects.last(),
+                    selected_choice=AgreementAnswerType.DIS,
+                ).save()
+            report_file = tmp_path_factory.mktemp("reports") / "epic_report.pdf"
+            report_file.write_bytes(b"%PDF-1.4 benchmark")
+            ReportJob.objects.create(user=dataset["advisor"]).set_done(report_file)
+            yield dataset
+            transaction.set_rollback(True)
+
+
+def _measure_request(
+    send_request: Callable[[], Any], set_up: Callable[[], None]
+) -> Dict[str, Any]:
+    """
+    Measures the queries, wall time and peak memory of a request after a warm up run.
+    The reports and domain caches are cleared before each run so that responses are always generated.
+    """
+    report_cache = caches[settings.EPIC_REPORTS_CACHE]
+    domain_cache = caches[settings.EPIC_DOMAIN_CACHE]
+
+    def prepare():
+        set_up()
+        report_cache.clear()
+        domain_cache.clear()
+
+    prepare()
+    response = send_request()
+    assert response.status_code < 300, response.content[:500]
+
+    prepare()
+    with CaptureQueriesContext(connection) as captured_queries:
+        start_time = time.perf_counter()
+        send_request()
+        wall_time = time.perf_counter() - start_time
+    # The captured queries are lazily read from the log, which every request resets.
+    n_queries = len(captured_queries)
+
+    prepare()
+    tracemalloc.start()
+    try:
+        send_request()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return dict(
+        queries=n_queries,
+        wall_time=round(wall_time, 4),
+        peak_memory=peak_memory,
+        database=connection.vendor,
+    )
+
+
+def _get_regressions(measured: Dict[str, Any], expected: Dict[str, Any]) -> list:
+    regressions = []
+    if measured["queries"] > expected["queries"]:
+        regressions.append(
+            f"queries: {measured['queries']} > {expected['queries']} (baseline)"
+        )
+    if not strict_benchmark:
+        return regressions
+    for measure, margin in [
+        ("wall_time", wall_time_margin),
+        ("peak_memory", peak_memory_margin),
+    ]:
+        if measured[measure] > expected[measure] * tolerance + margin:
+            regressions.append(
+                f"{measure}: {measured[measure]} > {expected[measure]} (baseline) * {tolerance}"
+            )
+    return regressions
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("benchmark_request", benchmark_requests)
+def test_rest_endpoint_benchmark(
+    benchmark_request: BenchmarkRequest,
+    benchmark_dataset: Dict[str, User],
+    benchmark_results: Dict[str, Dict[str, Any]],
+    request: pytest.FixtureRequest,
+):
+    # Define test data
+    api_client = APIClient()
+    request_user = benchmark_dataset[benchmark_request.username]
+    token, _ = Token.objects.get_or_create(user_id=request_user.pk)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+    url = reverse(
+        benchmark_request.url_name,
+        kwargs=benchmark_request.get_url_kwargs(benchmark_dataset),
+    )
+    data = benchmark_request.get_data(benchmark_dataset)
+    benchmark_id = request.node.callspec.id
+
+    # Run test
+    measured = _measure_request(
+        lambda: getattr(api_client, benchmark_request.method)(url, data, format="json"),
+        lambda: benchmark_request.set_up(benchmark_dataset),
+    )
+    benchmark_results[benchmark_id] = measured
+
+    # Verify final expectations
+    expected = _load_baseline().get(get_benchmark_scale_name(), {}).get(benchmark_id)
+    if expected is None or update_baseline:
+        return
+    regressions = _get_regressions(measured, expected)
+    assert not regressions, f"{benchmark_id} regressed: {'; '.join(regressions)}"
+
+
+def test_all_router_endpoints_are_benchmarked():
+    benchmarked_urls = {b_param.values[0].url_name for b_param in benchmark_requests}
+    router_urls = {r_url.name for r_url in router.urls}
+    assert router_urls - benchmarked_urls == set()
@@ -39,3 +39,12 @@ class TestEpicAgencyImporter:
         assert (
             multiple_agency_programs
         ), "There should have been programs with more than one agency."
+
+    @pytest.mark.django_db
+    def test_import_file_runs_constant_queries(
+        self, default_epic_domain_data, django_assert_max_num_queries: pytest.fixture
+    ):
+        test_file = test_data_dir / "xlsx" / "agency_data.xlsx"
+        with django_assert_max_num_queries(10):
+            EpicAgencyImporter().import_file(test_file)
+        assert len(Agency.objects.all()) == 7
@@ -1,11 +1,90 @@
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import openpyxl
 import pytest
 
-from epic_app.importers.xlsx import BaseEpicImporter
+from epic_app.importers.xlsx import BaseEpicImporter, EpicDomainImporter
 from epic_app.importers.xlsx.base_importer import ProtocolEpicImporter
 
 
+def _write_domain_xlsx(xlsx_file: Path, n_rows: int) -> Path:
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    worksheet.append(["Area", "Group", "Program", "Description", "Reference", "Link"])
+    for n_row in range(n_rows):
+        worksheet.append(
+            [
+                f"Area {n_row % 10}",
+                f"Group {n_row % 100}",
+                f"Program {n_row}",
+                f"Description of the program {n_row} " * 4,
+                f"Reference {n_row}",
+                f"https://www.deltares.nl/{n_row}",
+            ]
+        )
+    workbook.save(xlsx_file)
+    return xlsx_file
+
+
+def _get_peak_memory(parse_file: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        parse_file()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory
+
+
+def _stream_xlsx(xlsx_file: Path):
+    for _ in EpicDomainImporter()._iter_xlsx_line_objects(xlsx_file):
+        pass
+
+
+def _load_xlsx(xlsx_file: Path):
+    loaded_workbook = openpyxl.load_workbook(xlsx_file)
+    return [[cell.value for cell in row] for row in loaded_workbook.active.rows]
+
+
 class TestBaseEpicImporter:
     @pytest.mark.django_db
     def test_epic_agency_importer(self):
         base_importer = BaseEpicImporter()
         assert isinstance(base_importer, ProtocolEpicImporter)
+
+    def test_iter_xlsx_line_chunks(self, tmp_path: Path):
+        # Define test data
+        xlsx_file = _write_domain_xlsx(tmp_path / "domain.xlsx", 25)
+        domain_importer = EpicDomainImporter()
+        domain_importer.import_chunk_size = 10
+
+        # Run test
+        lines_chunks = list(domain_importer._iter_xlsx_line_chunks(xlsx_file))
+
+        # Verify final expectations
+        assert [len(lines_chunk) for lines_chunk in lines_chunks] == [10, 10, 5]
+        n_line, first_line = lines_chunks[0][0]
+        assert n_line == 2
+        assert first_line.program == "Program 0"
+        assert lines_chunks[-1][-1][0] == 26
+
+    def test_iter_xlsx_line_objects_memory_does_not_grow_with_rows(
+        self, tmp_path: Path
+    ):
+        """
+        Only the workbook shared strings remain in memory while streaming, so the peak memory (as traced by python) grows far slower than the number of rows.
+        """
+        # Define test data
+        small_xlsx = _write_domain_xlsx(tmp_path / "small.xlsx", 1000)
+        large_xlsx = _write_domain_xlsx(tmp_path / "large.xlsx", 10000)
+
+        # Run test
+        small_peak = _get_peak_memory(lambda: _stream_xlsx(small_xlsx))
+        large_peak = _get_peak_memory(lambda: _stream_xlsx(large_xlsx))
+        large_loaded_peak = _get_peak_memory(lambda: _load_xlsx(large_xlsx))
+
+        # Verify final expectations
+        assert large_peak < 4 * small_peak
+        assert large_peak < large_loaded_peak / 5
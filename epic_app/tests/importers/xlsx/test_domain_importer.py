@@ -1,7 +1,12 @@
+import csv
+import gzip
 from io import BytesIO
+from pathlib import Path
 
+import openpyxl
 import pytest
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.forms import ValidationError
 
 from epic_app.importers.xlsx import BaseEpicImporter, EpicDomainImporter
 from epic_app.importers.xlsx.base_importer import ProtocolEpicImporter
@@ -9,6 +14,15 @@ from epic_app.models.models import Area, Group, Program
 from epic_app.tests import test_data_dir
 
 
+def _xlsx_to_csv(xlsx_file: Path, csv_file: Path) -> Path:
+    open_file = gzip.open if csv_file.suffix == ".gz" else open
+    loaded_workbook = openpyxl.load_workbook(xlsx_file, read_only=True)
+    with open_file(csv_file, "wt", newline="", encoding="utf-8") as csv_io:
+        csv.writer(csv_io).writerows(loaded_workbook.active.iter_rows(values_only=True))
+    loaded_workbook.close()
+    return csv_file
+
+
 @pytest.mark.django_db
 class TestEpicDomainImporter:
     domain_xlsx_file = test_data_dir / "xlsx" / "initial_epic_data.xlsx"
@@ -76,6 +90,83 @@ class TestEpicDomainImporter:
             dict(area=dummy_area, group=dummy_group, program=dummy_program)
         )
 
+    @pytest.mark.parametrize("csv_suffix", [".csv", ".csv.gz"])
+    def test_import_file_from_csv_filepath(self, csv_suffix: str, tmp_path: Path):
+        # Define test data
+        csv_file = _xlsx_to_csv(
+            self.domain_xlsx_file, tmp_path / f"initial_epic_data{csv_suffix}"
+        )
+        xlsx_lines = [
+            vars(xlsx_line)
+            for xlsx_line in EpicDomainImporter()._iter_line_objects(
+                self.domain_xlsx_file
+            )
+        ]
+
+        # Run test
+        csv_lines = [
+            vars(csv_line)
+            for csv_line in EpicDomainImporter()._iter_line_objects(csv_file)
+        ]
+        EpicDomainImporter().import_file(csv_file)
+
+        # Verify final expectations
+        assert csv_lines == xlsx_lines
+        assert len(Area.objects.all()) == 5
+        assert len(Group.objects.all()) == 11
+        assert len(Program.objects.all()) == 38
+
+    def test_import_file_from_gzip_csv_inmemoryuploaddedfile(self, tmp_path: Path):
+        # Define request.
+        csv_file = _xlsx_to_csv(
+            self.domain_xlsx_file, tmp_path / "initial_epic_data.csv.gz"
+        )
+        file_io = BytesIO(csv_file.read_bytes())
+        csv_inmemoryfile = InMemoryUploadedFile(
+            file_io,
+            None,
+            csv_file.name,
+            "application/gzip",
+            len(file_io.getvalue()),
+            None,
+        )
+
+        # Run test
+        EpicDomainImporter().import_file(csv_inmemoryfile)
+
+        # Verify final expectations
+        assert len(Program.objects.all()) == 38
+        assert not csv_inmemoryfile.closed
+
+    def test_import_file_with_duplicated_program_leaves_db_unchanged(
+        self, tmp_path: Path
+    ):
+        # Define test data
+        EpicDomainImporter().import_file(self.domain_xlsx_file)
+        initial_programs = list(Program.objects.values_list("pk", "name"))
+        duplicated_file = tmp_path / "duplicated_epic_data.xlsx"
+        workbook = openpyxl.Workbook()
+        workbook.active.append(["Area", "Group", "Program", "Description"])
+        workbook.active.append(["An area", "A group", "A program", "Lorem ipsum."])
+        workbook.active.append(["An area", "A group", "a PROGRAM ", "Lorem ipsum."])
+        workbook.save(duplicated_file)
+
+        # Run test
+        with pytest.raises(ValidationError) as exc_info:
+            EpicDomainImporter().import_file(duplicated_file)
+
+        # Verify final expectations
+        assert "Line 3" in str(exc_info.value)
+        assert list(Program.objects.values_list("pk", "name")) == initial_programs
+
+    def test_import_file_runs_constant_queries(
+        self, django_assert_max_num_queries: pytest.fixture
+    ):
+        # Areas, groups and programs are inserted in bulk.
+        with django_assert_max_num_queries(20):
+            EpicDomainImporter().import_file(self.domain_xlsx_file)
+        assert len(Program.objects.all()) == 38
+
     def _verify_default_import_final_expectations(self, dummy_set: dict):
         # Verify final expectations
         assert len(Area.objects.all()) == 5
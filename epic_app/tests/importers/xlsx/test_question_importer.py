@@ -1,7 +1,9 @@
 from pathlib import Path
 from typing import Tuple, Type
 
+import openpyxl
 import pytest
+from django.forms import ValidationError
 
 from epic_app.importers.xlsx.base_importer import BaseEpicImporter, ProtocolEpicImporter
 from epic_app.importers.xlsx.question_importer import (
@@ -16,6 +18,7 @@ from epic_app.models.epic_questions import (
     NationalFrameworkQuestion,
     Question,
 )
+from epic_app.models.models import Program
 from epic_app.tests import test_data_dir
 from epic_app.tests.importers import default_epic_domain_data
 
@@ -71,6 +74,57 @@ class TestYesNoJustifyQuestionImporter:
         assert len(question_type.objects.all()) == dict_values["expected_entries"]
         assert question_type.objects.first().title == dict_values["first_entry_title"]
 
+    def test_import_file_with_unknown_program_leaves_db_unchanged(
+        self, default_epic_domain_data, tmp_path: Path
+    ):
+        # Define test data
+        NationalFrameworkQuestionImporter().import_file(
+            self.question_type_dict[NationalFrameworkQuestionImporter]["test_file"]
+        )
+        initial_questions = list(
+            NationalFrameworkQuestion.objects.values_list("pk", flat=True)
+        )
+        a_program = Program.objects.select_related("group").first()
+        invalid_file = tmp_path / "invalid_questions.xlsx"
+        workbook = openpyxl.Workbook()
+        workbook.active.append(["Group", "Program", "Description", "Title"])
+        workbook.active.append(
+            [a_program.group.name, a_program.name.upper(), "Lorem", "Ipsum?"]
+        )
+        workbook.active.append([a_program.group.name, "Not a program", "Lorem", "?"])
+        workbook.save(invalid_file)
+
+        # Run test
+        with pytest.raises(ValidationError) as exc_info:
+            NationalFrameworkQuestionImporter().import_file(invalid_file)
+
+        # Verify final expectations
+        assert "Line 3" in str(exc_info.value)
+        assert "Line 2" not in str(exc_info.value)
+        assert (
+            list(NationalFrameworkQuestion.objects.values_list("pk", flat=True))
+            == initial_questions
+        )
+
+    @pytest.mark.parametrize(
+        "question_type_fixture",
+        question_type_dict.items(),
+        ids=question_type_dict.keys(),
+    )
+    def test_import_file_runs_constant_queries(
+        self,
+        question_type_fixture: Tuple[Type[_YesNoJustifyQuestionImporter], dict],
+        default_epic_domain_data,
+        django_assert_max_num_queries: pytest.fixture,
+    ):
+        importer_type, dict_values = question_type_fixture
+        with django_assert_max_num_queries(10):
+            importer_type().import_file(dict_values["test_file"])
+        assert (
+            len(dict_values["question_type"].objects.all())
+            == dict_values["expected_entries"]
+        )
+
 
 @pytest.mark.django_db
 class TestEvolutionQuestionImporter:
@@ -88,3 +142,11 @@ class TestEvolutionQuestionImporter:
         EvolutionQuestionImporter().import_file(test_file)
 
         assert len(EvolutionQuestion.objects.all()) == 55
+
+    def test_import_file_runs_constant_queries(
+        self, default_epic_domain_data, django_assert_max_num_queries: pytest.fixture
+    ):
+        test_file = test_data_dir / "xlsx" / "evolutionquestions.xlsx"
+        with django_assert_max_num_queries(10):
+            EvolutionQuestionImporter().import_file(test_file)
+        assert len(EvolutionQuestion.objects.all()) == 55
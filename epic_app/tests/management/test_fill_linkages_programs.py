@@ -0,0 +1,80 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from epic_app.models.epic_questions import LinkagesQuestion, Question
+from epic_app.models.models import Program
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.fixture(autouse=True)
+def fill_linkages_programs_fixture(epic_test_db: pytest.fixture):
+    """
+    Dummy fixture just to load a default db from dummy_db.
+
+    Args:
+        epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+    """
+    pass
+
+
+@pytest.mark.django_db
+class TestFillLinkagesProgramsCommand:
+    def test_fill_linkages_programs_fills_stored_linkages(self):
+        # Define test data, as stored before the mirror field existed.
+        LinkagesQuestion.generate_linkages()
+        LinkagesQuestion.objects.update(linkages_program=None)
+        command_output = StringIO()
+
+        # Run test
+        call_command("fill_linkages_programs", stdout=command_output)
+
+        # Verify final expectations
+        assert all(
+            l_question.linkages_program_id == l_question.program_id
+            for l_question in LinkagesQuestion.objects.all()
+        )
+        assert (
+            f"Filled {len(Program.objects.all())} linkages questions."
+            in command_output.getvalue()
+        )
+
+    def test_fill_linkages_programs_skips_duplicated_linkages(self):
+        # Define test data, a second linkages question for a program.
+        LinkagesQuestion.generate_linkages()
+        first_linkage, duplicated_linkage = LinkagesQuestion.objects.order_by("pk")[:2]
+        LinkagesQuestion.objects.update(linkages_program=None)
+        Question.objects.filter(pk=duplicated_linkage.pk).update(
+            program=first_linkage.program
+        )
+        command_error = StringIO()
+
+        # Run test
+        call_command("fill_linkages_programs", stdout=StringIO(), stderr=command_error)
+
+        # Verify final expectations
+        assert (
+            LinkagesQuestion.objects.get(pk=first_linkage.pk).linkages_program_id
+            == first_linkage.program_id
+        )
+        assert (
+            LinkagesQuestion.objects.get(pk=duplicated_linkage.pk).linkages_program
+            is None
+        )
+        assert f"Linkages question {duplicated_linkage.pk} left unfilled" in (
+            command_error.getvalue()
+        )
+
+    def test_generate_linkages_with_unfilled_linkages(self):
+        # Define test data
+        LinkagesQuestion.generate_linkages()
+        n_linkages = len(LinkagesQuestion.objects.all())
+        LinkagesQuestion.objects.update(linkages_program=None)
+
+        # Run test
+        created_linkages = LinkagesQuestion.generate_linkages()
+
+        # Verify final expectations
+        assert created_linkages == []
+        assert len(LinkagesQuestion.objects.all()) == n_linkages
@@ -0,0 +1,76 @@
+import csv
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from epic_app.models import epic_user
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+
+
+@pytest.mark.django_db
+class TestGenerateEpicUsersCommand:
+    def test_generate_epic_users_writes_csv(self, tmp_path: Path):
+        # Define test data
+        epic_org = EpicOrganization.objects.create(name="Workshop")
+        csv_file = tmp_path / "workshop_users.csv"
+
+        # Run test
+        call_command(
+            "generate_epic_users",
+            "Workshop",
+            "5",
+            "--output",
+            str(csv_file),
+            stderr=StringIO(),
+        )
+
+        # Verify final expectations
+        with csv_file.open(newline="") as csv_io:
+            csv_rows = list(csv.DictReader(csv_io))
+        assert len(csv_rows) == 5
+        assert {r["username"] for r in csv_rows} == set(
+            epic_org.organization_users.values_list("username", flat=True)
+        )
+        for csv_row in csv_rows:
+            assert csv_row["organization"] == "Workshop"
+            e_user = EpicUser.objects.get(username=csv_row["username"])
+            assert e_user.check_password(csv_row["password"])
+
+    def test_generate_epic_users_to_stdout(self):
+        # Define test data
+        EpicOrganization.objects.create(name="Workshop")
+        command_output = StringIO()
+
+        # Run test
+        call_command("generate_epic_users", "Workshop", "2", stdout=command_output)
+
+        # Verify final expectations
+        csv_lines = command_output.getvalue().splitlines()
+        assert csv_lines[0] == "organization,username,password"
+        assert len(csv_lines) == 3
+
+    def test_generate_epic_users_hashes_with_jobs(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Define test data
+        monkeypatch.setattr(epic_user, "_min_parallel_passwords", 2)
+        epic_org = EpicOrganization.objects.create(name="Workshop")
+
+        # Run test
+        call_command(
+            "generate_epic_users", "Workshop", "4", "--jobs", "2", stdout=StringIO()
+        )
+
+        # Verify final expectations
+        assert all(
+            e_user.check_password(e_user.username.lower())
+            for e_user in epic_org.organization_users.all()
+        )
+        assert len(epic_org.organization_users.all()) == 4
+
+    def test_generate_epic_users_unknown_organization(self):
+        with pytest.raises(CommandError):
+            call_command("generate_epic_users", "Unknown organization", "2")
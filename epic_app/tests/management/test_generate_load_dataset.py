@@ -0,0 +1,68 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from epic_app.models.epic_answers import AgreementAnswer, AgreementAnswerType, Answer
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.mark.django_db
+class TestGenerateLoadDatasetCommand:
+    def test_generate_load_dataset(self, epic_test_db: pytest.fixture):
+        # Define test data
+        command_output = StringIO()
+
+        # Run test
+        call_command(
+            "generate_load_dataset",
+            "3",
+            "4",
+            "--agreement-weights",
+            "agree=3,disagree=1",
+            "--prefix",
+            "workshop",
+            stdout=command_output,
+        )
+
+        # Verify final expectations
+        assert EpicOrganization.objects.filter(name__startswith="workshop").count() == 3
+        assert EpicUser.objects.filter(username__startswith="workshop_").count() == 12
+        assert (
+            Answer.objects.filter(user__username__startswith="workshop_").count()
+            == 12 * Question.objects.count()
+        )
+        assert set(
+            AgreementAnswer.objects.values_list("selected_choice", flat=True)
+        ) <= {AgreementAnswerType.AGR, AgreementAnswerType.DIS}
+        assert "Generated 3 organizations, 12 users" in command_output.getvalue()
+
+    @pytest.mark.parametrize(
+        "command_args",
+        [
+            pytest.param(["0", "1"], id="No organizations"),
+            pytest.param(["1", "1", "--answered-ratio", "2"], id="Invalid ratio"),
+            pytest.param(
+                ["1", "1", "--evolution-weights", "MAYBE=1"], id="Unknown choice"
+            ),
+            pytest.param(
+                ["1", "1", "--evolution-weights", "NASCENT"], id="Invalid weight"
+            ),
+        ],
+    )
+    def test_generate_load_dataset_invalid_arguments(self, command_args):
+        with pytest.raises(CommandError):
+            call_command("generate_load_dataset", *command_args)
+
+    def test_generate_load_dataset_existing_prefix(self):
+        # Define test data
+        call_command(
+            "generate_load_dataset", "1", "1", stdout=StringIO(), stderr=StringIO()
+        )
+
+        # Run test
+        with pytest.raises(CommandError):
+            call_command("generate_load_dataset", "1", "1")
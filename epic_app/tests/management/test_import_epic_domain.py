@@ -0,0 +1,100 @@
+import shutil
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from epic_app.importers.xlsx import BaseEpicImporter
+from epic_app.models.epic_questions import (
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.models import Agency, Program
+from epic_app.tests import test_data_dir
+
+
+@pytest.mark.django_db
+class TestImportEpicDomainCommand:
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_import_epic_domain(self, jobs: int):
+        # Define test data
+        domain_dir = test_data_dir / "xlsx"
+        command_output = StringIO()
+
+        # Run test
+        call_command(
+            "import_epic_domain", domain_dir, "--jobs", str(jobs), stdout=command_output
+        )
+
+        # Verify final expectations
+        assert len(Program.objects.all()) == 38
+        assert len(Agency.objects.all()) == 7
+        assert NationalFrameworkQuestion.objects.exists()
+        assert KeyAgencyActionsQuestion.objects.exists()
+        assert EvolutionQuestion.objects.exists()
+        assert len(LinkagesQuestion.objects.all()) == 38
+        output = command_output.getvalue()
+        assert "Import stage 2 done in" in output
+        assert "Failed to import" not in output
+        assert "Generated linkages in" in output
+
+    def test_import_epic_domain_reports_invalid_file(self, tmp_path):
+        # Define test data
+        (tmp_path / "agency_data.csv").write_text(
+            "Agency,Program\nAn agency,Unknown program\n"
+        )
+        command_output = StringIO()
+
+        # Run test
+        call_command(
+            "import_epic_domain", tmp_path, "--jobs", "1", stdout=command_output
+        )
+
+        # Verify final expectations
+        output = command_output.getvalue()
+        assert "File to import not found at initial_epic_data.xlsx" in output
+        assert "Failed to import agency_data.csv." in output
+        assert "Program: 'Unknown program' does not exist." in output
+        assert not Agency.objects.exists()
+
+    def test_import_epic_domain_streams_files_in_chunks(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Define test data, chunks smaller than the files so they are streamed in parts.
+        monkeypatch.setattr(BaseEpicImporter, "import_chunk_size", 5)
+        command_output = StringIO()
+
+        # Run test
+        call_command(
+            "import_epic_domain",
+            test_data_dir / "xlsx",
+            "--jobs",
+            "2",
+            stdout=command_output,
+        )
+
+        # Verify final expectations
+        assert "Failed to import" not in command_output.getvalue()
+        assert len(Program.objects.all()) == 38
+        assert len(Agency.objects.all()) == 7
+
+    def test_import_epic_domain_reports_unparsable_file(self, tmp_path):
+        # Define test data
+        for xlsx_file in (test_data_dir / "xlsx").iterdir():
+            shutil.copy(xlsx_file, tmp_path)
+        (tmp_path / "evolutionquestions.xlsx").write_bytes(b"Not a workbook.")
+        command_output = StringIO()
+
+        # Run test
+        call_command(
+            "import_epic_domain", tmp_path, "--jobs", "2", stdout=command_output
+        )
+
+        # Verify final expectations
+        output = command_output.getvalue()
+        assert "Failed to import evolutionquestions.xlsx." in output
+        assert "Imported nationalframeworkquestions.xlsx." in output
+        assert not EvolutionQuestion.objects.exists()
+        assert NationalFrameworkQuestion.objects.exists()
@@ -0,0 +1,59 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from epic_app.load_dataset import LoadDataset
+from epic_app.models.answer_tally import AnswerTally
+from epic_app.models.epic_questions import Question
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.fixture(autouse=True)
+def rebuild_answer_tallies_fixture(epic_test_db: pytest.fixture):
+    """
+    Dummy fixture just to load a default db from dummy_db.
+
+    Args:
+        epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+    """
+    pass
+
+
+@pytest.mark.django_db
+class TestRebuildAnswerTalliesCommand:
+    def test_rebuild_answer_tallies_restores_tallies(self):
+        # Define test data
+        LoadDataset(2, 3).generate()
+        expected_tallies = sorted(
+            AnswerTally.objects.values_list(
+                "question_id",
+                "organization_id",
+                "n_answers",
+                "n_invalid",
+                "choice_counts",
+                "program_counts",
+            )
+        )
+        AnswerTally.objects.all().delete()
+        command_output = StringIO()
+
+        # Run test
+        call_command("rebuild_answer_tallies", stdout=command_output)
+
+        # Verify final expectations
+        assert (
+            sorted(
+                AnswerTally.objects.values_list(
+                    "question_id",
+                    "organization_id",
+                    "n_answers",
+                    "n_invalid",
+                    "choice_counts",
+                    "program_counts",
+                )
+            )
+            == expected_tallies
+        )
+        assert len(expected_tallies) == 2 * len(Question.objects.all())
+        assert "Rebuilt 12 answer tallies." in command_output.getvalue()
@@ -0,0 +1,268 @@
+from typing import Any, Dict, Optional, Tuple
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from epic_app.load_dataset import LoadDataset
+from epic_app.models.answer_tally import AnswerTally, AnswerTallyChanges
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    Answer,
+    EvolutionAnswer,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.models.models import Program
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.fixture(autouse=True)
+def answer_tally_fixture(epic_test_db: pytest.fixture):
+    """
+    Dummy fixture just to load a default db from dummy_db.
+
+    Args:
+        epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+    """
+    pass
+
+
+def _get_tallies() -> Dict[Tuple[int, Optional[int]], Dict[str, Any]]:
+    return {
+        (tally.question_id, tally.organization_id): dict(
+            n_answers=tally.n_answers,
+            n_invalid=tally.n_invalid,
+            choice_counts=tally.choice_counts,
+            program_counts=tally.program_counts,
+        )
+        for tally in AnswerTally.objects.all()
+        if tally.n_answers
+    }
+
+
+def _get_rebuilt_tallies() -> Dict[Tuple[int, Optional[int]], Dict[str, Any]]:
+    AnswerTally.rebuild()
+    return _get_tallies()
+
+
+def _get_tally(question_id: int, organization_id: Optional[int]) -> AnswerTally:
+    return AnswerTally.objects.get(
+        question_id=question_id, organization_id=organization_id
+    )
+
+
+@pytest.mark.django_db
+class TestAnswerTally:
+    @pytest.fixture(autouse=False)
+    def epic_org(self) -> EpicOrganization:
+        return EpicOrganization.objects.get(name="Gallactic Empire")
+
+    def _answer_all_questions(self) -> None:
+        for e_user in EpicUser.objects.all():
+            for nfq in NationalFrameworkQuestion.objects.all():
+                AgreementAnswer.objects.create(
+                    user=e_user, question=nfq, selected_choice=AgreementAnswerType.AGR
+                )
+            for evq in EvolutionQuestion.objects.all():
+                EvolutionAnswer.objects.create(user=e_user, question=evq)
+            for lnk in LinkagesQuestion.objects.all():
+                MultipleChoiceAnswer.objects.create(
+                    user=e_user, question=lnk
+                ).selected_programs.add(Program.objects.last())
+
+    def test_add_answers_drops_empty_counts(self):
+        # Define test data
+        tally = AnswerTally(question_id=1)
+        tally.add_answers(2, 1, {"AGREE": 1, "": 1}, {3: 1})
+
+        # Run test
+        tally.add_answers(-1, -1, {"": -1}, {3: -1})
+
+        # Verify final expectations
+        assert tally.n_answers == 1
+        assert tally.n_invalid == 0
+        assert tally.choice_counts == {"AGREE": 1}
+        assert tally.program_counts == {}
+
+    def test_answer_create_update_and_delete(self, epic_org: EpicOrganization):
+        # Define test data
+        e_user = EpicUser.objects.get(username="Anakin")
+        nfq = NationalFrameworkQuestion.objects.first()
+
+        # Run test
+        answer = AgreementAnswer.objects.create(user=e_user, question=nfq)
+        created_tally = _get_tally(nfq.pk, epic_org.pk)
+        answer.selected_choice = AgreementAnswerType.DIS
+        answer.save()
+        updated_tally = _get_tally(nfq.pk, epic_org.pk)
+        AgreementAnswer.objects.get(pk=answer.pk).delete()
+        deleted_tally = _get_tally(nfq.pk, epic_org.pk)
+
+        # Verify final expectations
+        assert (created_tally.n_answers, created_tally.n_invalid) == (1, 1)
+        assert created_tally.choice_counts == {"": 1}
+        assert (updated_tally.n_answers, updated_tally.n_invalid) == (1, 0)
+        assert updated_tally.choice_counts == {AgreementAnswerType.DIS: 1}
+        assert (deleted_tally.n_answers, deleted_tally.n_invalid) == (0, 0)
+        assert deleted_tally.choice_counts == {}
+
+    def test_answer_justification_change_keeps_tally(self):
+        # Define test data
+        answer = EvolutionAnswer.objects.create(
+            user=EpicUser.objects.get(username="Anakin"),
+            question=EvolutionQuestion.objects.first(),
+            selected_choice=EvolutionChoiceType.ENGAGED,
+        )
+        answer = EvolutionAnswer.objects.get(pk=answer.pk)
+        tally_before = _get_tallies()
+        answer.justify_answer = "Lorem ipsum"
+
+        # Run test
+        answer.save()
+
+        # Verify final expectations
+        assert _get_tallies() == tally_before
+
+    def test_selected_programs_changes(self, epic_org: EpicOrganization):
+        # Define test data
+        lnk = LinkagesQuestion.objects.first()
+        answer = MultipleChoiceAnswer.objects.create(
+            user=EpicUser.objects.get(username="Anakin"), question=lnk
+        )
+        a_program, b_program = Program.objects.order_by("pk")[:2]
+
+        # Run test
+        answer.selected_programs.add(a_program, b_program)
+        added_tally = _get_tally(lnk.pk, epic_org.pk)
+        answer.selected_programs.remove(a_program)
+        removed_tally = _get_tally(lnk.pk, epic_org.pk)
+        b_program.selected_answers.clear()
+        cleared_tally = _get_tally(lnk.pk, epic_org.pk)
+
+        # Verify final expectations
+        assert (added_tally.n_answers, added_tally.n_invalid) == (1, 0)
+        assert added_tally.program_counts == {
+            str(a_program.pk): 1,
+            str(b_program.pk): 1,
+        }
+        assert removed_tally.program_counts == {str(b_program.pk): 1}
+        assert (cleared_tally.n_answers, cleared_tally.n_invalid) == (1, 1)
+        assert cleared_tally.program_counts == {}
+
+    def test_program_delete_discounts_selected_program(
+        self, epic_org: EpicOrganization
+    ):
+        # Define test data
+        self._answer_all_questions()
+        lnk = LinkagesQuestion.objects.first()
+        selected_program = Program.objects.last()
+        assert lnk.program != selected_program
+
+        # Run test
+        selected_program.delete()
+
+        # Verify final expectations
+        lnk_tally = _get_tally(lnk.pk, epic_org.pk)
+        assert lnk_tally.program_counts == {}
+        assert lnk_tally.n_invalid == lnk_tally.n_answers == 3
+        assert _get_tallies() == _get_rebuilt_tallies()
+
+    def test_user_organization_change_moves_tallies(self, epic_org: EpicOrganization):
+        # Define test data
+        self._answer_all_questions()
+        new_org = EpicOrganization.objects.create(name="Rebel Alliance")
+        e_user = EpicUser.objects.get(username="Anakin")
+
+        # Run test
+        e_user.organization = new_org
+        e_user.save()
+
+        # Verify final expectations
+        nfq = NationalFrameworkQuestion.objects.first()
+        assert _get_tally(nfq.pk, epic_org.pk).n_answers == 2
+        assert _get_tally(nfq.pk, new_org.pk).n_answers == 1
+        assert _get_tallies() == _get_rebuilt_tallies()
+
+    def test_user_delete_discounts_answers(self, epic_org: EpicOrganization):
+        # Define test data
+        self._answer_all_questions()
+
+        # Run test
+        EpicUser.objects.get(username="Anakin").delete()
+
+        # Verify final expectations
+        nfq = NationalFrameworkQuestion.objects.first()
+        assert _get_tally(nfq.pk, epic_org.pk).n_answers == 2
+        assert _get_tallies() == _get_rebuilt_tallies()
+
+    def test_base_answer_delete_discounts_answer(self, epic_org: EpicOrganization):
+        # Define test data
+        self._answer_all_questions()
+
+        # Run test
+        Answer.objects.filter(user__username="Anakin").delete()
+
+        # Verify final expectations
+        assert _get_tallies() == _get_rebuilt_tallies()
+
+    def test_answer_changes_match_rebuild(self):
+        # Define test data
+        self._answer_all_questions()
+        incremental_tallies = _get_tallies()
+
+        # Run test
+        rebuilt_tallies = _get_rebuilt_tallies()
+
+        # Verify final expectations
+        assert incremental_tallies == rebuilt_tallies
+        assert len(rebuilt_tallies) == len(
+            NationalFrameworkQuestion.objects.all()
+        ) + len(EvolutionQuestion.objects.all()) + len(LinkagesQuestion.objects.all())
+
+    def test_load_dataset_matches_rebuild(self):
+        # Define test data
+        LoadDataset(2, 5, answered_ratio=0.5).generate()
+        incremental_tallies = _get_tallies()
+
+        # Run test
+        rebuilt_tallies = _get_rebuilt_tallies()
+
+        # Verify final expectations
+        assert incremental_tallies
+        assert incremental_tallies == rebuilt_tallies
+
+    def _get_apply_queries(self, tally_changes: AnswerTallyChanges) -> int:
+        with CaptureQueriesContext(connection) as apply_queries:
+            tally_changes.apply()
+        return len(apply_queries)
+
+    def test_tally_changes_apply_has_constant_queries(self, epic_org: EpicOrganization):
+        # Define test data
+        single_changes = AnswerTallyChanges()
+        single_changes.add_answer(
+            AgreementAnswer(question=NationalFrameworkQuestion.objects.first()),
+            epic_org.pk,
+        )
+        many_changes = AnswerTallyChanges()
+        for e_user in EpicUser.objects.all():
+            for nfq in NationalFrameworkQuestion.objects.all():
+                many_changes.add_answer(AgreementAnswer(question=nfq), epic_org.pk)
+                many_changes.add_answer(AgreementAnswer(question=nfq), None)
+
+        # Run test
+        single_queries = self._get_apply_queries(single_changes)
+        many_queries = self._get_apply_queries(many_changes)
+
+        # Verify final expectations
+        assert many_queries == single_queries
+        nfq = NationalFrameworkQuestion.objects.last()
+        assert _get_tally(nfq.pk, epic_org.pk).n_invalid == 3
+        assert _get_tally(nfq.pk, None).n_answers == 3
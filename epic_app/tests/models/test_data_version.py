@@ -0,0 +1,194 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import (
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.models.models import Area, Program
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.fixture(autouse=True)
+def data_version_fixture(epic_test_db: pytest.fixture):
+    """
+    Dummy fixture just to load a default db from dummy_db.
+
+    Args:
+        epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+    """
+    pass
+
+
+def _count_version_updates(captured_queries: CaptureQueriesContext) -> int:
+    return sum(
+        c_query["sql"].startswith("UPDATE") and "epicdataversion" in c_query["sql"]
+        for c_query in captured_queries
+    )
+
+
+def _get_version(name: EpicDataVersionName, organization_id: int = None) -> str:
+    return EpicDataVersion.get_versions(name, organization_id=organization_id)[name]
+
+
+@pytest.mark.django_db
+class TestEpicDataVersion:
+    def test_get_versions_creates_missing_versions(self):
+        EpicDataVersion.objects.all().delete()
+        versions = EpicDataVersion.get_versions(
+            EpicDataVersionName.ANSWERS, EpicDataVersionName.DOMAIN
+        )
+        assert versions == dict(EpicDataVersion.objects.values_list("name", "version"))
+        assert len(set(versions.values())) == 2
+
+    def test_renew_changes_version(self):
+        initial_version = _get_version(EpicDataVersionName.ANSWERS)
+        EpicDataVersion.renew(EpicDataVersionName.ANSWERS)
+        assert _get_version(EpicDataVersionName.ANSWERS) != initial_version
+
+    def test_answer_changes_renew_answers_version(self):
+        # Define test data.
+        domain_version = _get_version(EpicDataVersionName.DOMAIN)
+        answer_versions = [_get_version(EpicDataVersionName.ANSWERS)]
+
+        # Run test (save, many-to-many changes and delete).
+        mc_answer = MultipleChoiceAnswer.objects.create(
+            user=EpicUser.objects.first(), question=LinkagesQuestion.objects.first()
+        )
+        answer_versions.append(_get_version(EpicDataVersionName.ANSWERS))
+        mc_answer.selected_programs.add(Program.objects.first())
+        answer_versions.append(_get_version(EpicDataVersionName.ANSWERS))
+        mc_answer.delete()
+        answer_versions.append(_get_version(EpicDataVersionName.ANSWERS))
+
+        # Verify final expectations.
+        assert len(set(answer_versions)) == len(answer_versions)
+        assert _get_version(EpicDataVersionName.DOMAIN) == domain_version
+
+    def test_domain_changes_renew_domain_version(self):
+        # Define test data.
+        answers_version = _get_version(EpicDataVersionName.ANSWERS)
+        domain_version = _get_version(EpicDataVersionName.DOMAIN)
+
+        # Run test.
+        an_area = Area.objects.first()
+        an_area.name = "Lorem ipsum"
+        an_area.save()
+
+        # Verify final expectations.
+        assert _get_version(EpicDataVersionName.DOMAIN) != domain_version
+        assert _get_version(EpicDataVersionName.ANSWERS) == answers_version
+
+    def test_answer_changes_renew_their_organization_answers_version(self):
+        # Define test data.
+        epic_user = EpicUser.objects.first()
+        other_organization = EpicOrganization.objects.create(name="Rebel Alliance")
+        all_version = _get_version(EpicDataVersionName.ANSWERS)
+        organization_version = _get_version(
+            EpicDataVersionName.ANSWERS, epic_user.organization_id
+        )
+        other_version = _get_version(EpicDataVersionName.ANSWERS, other_organization.pk)
+
+        # Run test.
+        MultipleChoiceAnswer.objects.create(
+            user=epic_user, question=LinkagesQuestion.objects.first()
+        )
+
+        # Verify final expectations.
+        assert _get_version(EpicDataVersionName.ANSWERS) != all_version
+        assert (
+            _get_version(EpicDataVersionName.ANSWERS, epic_user.organization_id)
+            != organization_version
+        )
+        assert (
+            _get_version(EpicDataVersionName.ANSWERS, other_organization.pk)
+            == other_version
+        )
+
+    def test_moving_user_renews_both_organizations_answers_version(self):
+        # Define test data.
+        epic_user = EpicUser.objects.first()
+        previous_organization_id = epic_user.organization_id
+        other_organization = EpicOrganization.objects.create(name="Rebel Alliance")
+        previous_version = _get_version(
+            EpicDataVersionName.ANSWERS, previous_organization_id
+        )
+        other_version = _get_version(EpicDataVersionName.ANSWERS, other_organization.pk)
+
+        # Run test.
+        epic_user.organization = other_organization
+        epic_user.save()
+
+        # Verify final expectations.
+        assert (
+            _get_version(EpicDataVersionName.ANSWERS, previous_organization_id)
+            != previous_version
+        )
+        assert (
+            _get_version(EpicDataVersionName.ANSWERS, other_organization.pk)
+            != other_version
+        )
+
+    def _answer_all_questions(self):
+        for epic_user in EpicUser.objects.all():
+            for nfq in NationalFrameworkQuestion.objects.all():
+                AgreementAnswer.objects.create(
+                    user=epic_user,
+                    question=nfq,
+                    selected_choice=AgreementAnswerType.AGR,
+                )
+
+    def test_queryset_delete_does_not_renew_versions_per_row(self):
+        # Define test data, queryset deletes (e.g. imports) renew the version explicitly.
+        self._answer_all_questions()
+
+        # Run test.
+        with CaptureQueriesContext(connection) as delete_queries:
+            NationalFrameworkQuestion.objects.all().delete()
+
+        # Verify final expectations.
+        assert not AgreementAnswer.objects.exists()
+        assert _count_version_updates(delete_queries) == 0
+
+    def test_instance_delete_renews_version_once(self):
+        # Define test data.
+        self._answer_all_questions()
+        domain_version = _get_version(EpicDataVersionName.DOMAIN)
+        answers_version = _get_version(EpicDataVersionName.ANSWERS)
+
+        # Run test, the answers are deleted in cascade.
+        with CaptureQueriesContext(connection) as delete_queries:
+            NationalFrameworkQuestion.objects.first().delete()
+
+        # Verify final expectations.
+        assert _count_version_updates(delete_queries) == 1
+        assert _get_version(EpicDataVersionName.DOMAIN) != domain_version
+        assert _get_version(EpicDataVersionName.ANSWERS) == answers_version
+
+    def test_unversioned_cascade_delete_renews_version_once(self):
+        # Define test data.
+        self._answer_all_questions()
+        epic_user = EpicUser.objects.first()
+        organization_version = _get_version(
+            EpicDataVersionName.ANSWERS, epic_user.organization_id
+        )
+
+        # Run test, the epic user and its answers are deleted in cascade.
+        with CaptureQueriesContext(connection) as delete_queries:
+            User.objects.get(pk=epic_user.pk).delete()
+
+        # Verify final expectations.
+        assert _count_version_updates(delete_queries) == 1
+        assert (
+            _get_version(EpicDataVersionName.ANSWERS, epic_user.organization_id)
+            != organization_version
+        )
@@ -1,8 +1,9 @@
 import itertools
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type
 
 import pytest
 from django.db import IntegrityError
+from django.db.models import Count
 
 from epic_app.models.epic_answers import (
     AgreementAnswer,
@@ -153,6 +154,64 @@ class TestEpicAnswers:
             self.test_SAVE_answer(question_subtype, answer_subtype)
 
 
+@pytest.mark.django_db
+class TestDetailedSummary:
+    @pytest.fixture(autouse=False)
+    def _summary_answers_fixture(self):
+        justify = "Lorem ipsum dolor sit amet."
+        for n_user, e_user in enumerate(EpicUser.objects.all()):
+            AgreementAnswer.objects.create(
+                user=e_user,
+                question=NationalFrameworkQuestion.objects.first(),
+                selected_choice=list(AgreementAnswerType)[n_user] if n_user else "",
+                justify_answer=justify if n_user % 2 else "",
+            )
+            EvolutionAnswer.objects.create(
+                user=e_user,
+                question=EvolutionQuestion.objects.first(),
+                selected_choice=EvolutionChoiceType.ENGAGED if n_user else "",
+                justify_answer=justify,
+            )
+
+    @pytest.mark.parametrize("answer_type", [AgreementAnswer, EvolutionAnswer])
+    def test_get_detailed_summary_queryset_runs_fixed_queries(
+        self,
+        answer_type: Type[Answer],
+        _summary_answers_fixture: pytest.fixture,
+        django_assert_num_queries: pytest.fixture,
+    ):
+        # Run test
+        with django_assert_num_queries(2):
+            queryset_summary = answer_type.get_detailed_summary(
+                answer_type.objects.all()
+            )
+
+        # Verify final expectations
+        assert queryset_summary["no_valid_response"] == 1
+        assert sum(v for v in queryset_summary.values() if isinstance(v, int)) == len(
+            EpicUser.objects.all()
+        )
+
+    @pytest.mark.parametrize("answer_type", [AgreementAnswer, EvolutionAnswer])
+    def test_get_detailed_summary_list_matches_queryset(
+        self,
+        answer_type: Type[Answer],
+        _summary_answers_fixture: pytest.fixture,
+        django_assert_num_queries: pytest.fixture,
+    ):
+        # Define test data
+        answers_list = list(answer_type.objects.all())
+
+        # Run test
+        with django_assert_num_queries(0):
+            list_summary = answer_type.get_detailed_summary(answers_list)
+
+        # Verify final expectations
+        assert list_summary == answer_type.get_detailed_summary(
+            answer_type.objects.all()
+        )
+
+
 @pytest.mark.django_db
 class TestEvolutionAnswer:
     @pytest.mark.parametrize(
@@ -258,6 +317,53 @@ class TestEvolutionAnswer:
         # Verify expectations
         assert return_summary == expected_result
 
+    @pytest.fixture(autouse=False)
+    def _described_answers_fixture(self) -> EvolutionQuestion:
+        evq = EvolutionQuestion.objects.first()
+        evq.nascent_description = "Lorem nascent."
+        evq.engaged_description = "Lorem engaged."
+        evq.capable_description = "Lorem capable."
+        evq.effective_description = None
+        evq.save()
+        e_users = list(EpicUser.objects.order_by("pk"))
+        for e_user, selected_choice in zip(
+            e_users,
+            [EvolutionChoiceType.ENGAGED, EvolutionChoiceType.EFFECTIVE, ""],
+        ):
+            EvolutionAnswer.objects.create(
+                user=e_user, question=evq, selected_choice=selected_choice
+            )
+        return evq
+
+    def test_evolutionanswer_get_selected_choice_text(
+        self, _described_answers_fixture: EvolutionQuestion
+    ):
+        # Run test
+        selected_texts = [
+            ev_answer.get_selected_choice_text()
+            for ev_answer in EvolutionAnswer.objects.order_by("pk")
+        ]
+
+        # Verify final expectations
+        assert selected_texts == ["Lorem engaged.", "", ""]
+
+    def test_evolutionanswer_get_selected_choice_texts_runs_one_query(
+        self,
+        _described_answers_fixture: EvolutionQuestion,
+        django_assert_num_queries: pytest.fixture,
+    ):
+        # Run test
+        with django_assert_num_queries(1):
+            selected_texts = EvolutionAnswer.get_selected_choice_texts(
+                EvolutionAnswer.objects.all()
+            )
+
+        # Verify final expectations
+        assert selected_texts == {
+            ev_answer.pk: ev_answer.get_selected_choice_text()
+            for ev_answer in EvolutionAnswer.objects.all()
+        }
+
 
 @pytest.mark.django_db
 class TestAgreementAnswer:
@@ -385,6 +491,35 @@ class TestMultipleChoiceAnswer:
         mca.save()
         assert mca.is_valid_answer() == expected_result
 
+    @pytest.mark.parametrize(
+        "selected_programs, expected_result",
+        [
+            pytest.param(["a", "b"], True, id="Multiple selection"),
+            pytest.param([], False, id="Empty selection"),
+        ],
+    )
+    def test_multiplechoiceanswer_is_valid_answer_with_annotated_count(
+        self,
+        selected_programs: List[str],
+        expected_result: bool,
+        django_assert_num_queries: pytest.fixture,
+    ):
+        # Define test data.
+        MultipleChoiceAnswer.objects.all().delete()
+        mca = MultipleChoiceAnswer.objects.create(
+            user=EpicUser.objects.first(), question=LinkagesQuestion.objects.first()
+        )
+        mca.selected_programs.set(
+            [Program.objects.get(name=p_name).id for p_name in selected_programs]
+        )
+        annotated_mca = MultipleChoiceAnswer.objects.annotate(
+            selected_programs_count=Count("selected_programs")
+        ).get(pk=mca.pk)
+
+        # Run test and verify expectations.
+        with django_assert_num_queries(0):
+            assert annotated_mca.is_valid_answer() == expected_result
+
     @pytest.mark.parametrize(
         "selected_programs",
         [
@@ -185,7 +185,24 @@ class TestLinkagesQuestion:
                 LinkagesQuestion(title=q_title, program=l_question.program).save()
 
         # Verify final expectations.
-        assert (
-            str(e_info.value)
-            == "UNIQUE constraint failed: epic_app_question.program_id"
-        )
+        assert "linkages_program" in str(e_info.value)
+
+    def test_generate_linkages_only_creates_missing(
+        self, django_assert_max_num_queries: pytest.fixture
+    ):
+        # Define test data
+        LinkagesQuestion.generate_linkages()
+        removed_linkage: LinkagesQuestion = LinkagesQuestion.objects.first()
+        removed_linkage.delete()
+        n_linkages = len(LinkagesQuestion.objects.all())
+
+        # Run test
+        with django_assert_max_num_queries(5):
+            created_linkages = LinkagesQuestion.generate_linkages()
+
+        # Verify final expectations
+        assert len(created_linkages) == 1
+        assert created_linkages[0].program == removed_linkage.program
+        assert len(LinkagesQuestion.objects.all()) == n_linkages + 1
+        assert len(LinkagesQuestion.objects.all()) == len(Program.objects.all())
+        assert LinkagesQuestion.generate_linkages() == []
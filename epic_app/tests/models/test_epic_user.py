@@ -7,6 +7,7 @@ from rest_framework.authtoken.views import obtain_auth_token
 from rest_framework.response import Response as RfResponse
 from rest_framework.test import APIRequestFactory
 
+from epic_app.models import epic_user
 from epic_app.models.epic_user import EpicOrganization, EpicUser
 from epic_app.tests.epic_db_fixture import epic_test_db
 from epic_app.views import EpicUserViewSet
@@ -57,6 +58,58 @@ class TestEpicOrganization:
         assert all(last_org.organization_users.contains(n_user) for n_user in new_users)
         assert len(EpicUser.objects.all()) - len(new_users) == previous_users
 
+    def test_generate_users_sets_password_and_token(self):
+        # Define test data
+        last_org: EpicOrganization = EpicOrganization.objects.last()
+
+        # Run test
+        new_users = last_org.generate_users(3)
+
+        # Verify final expectations
+        for new_user in EpicUser.objects.filter(pk__in=[nu.pk for nu in new_users]):
+            assert new_user.check_password(new_user.username.lower())
+            assert Token.objects.filter(user=new_user).exists()
+
+    def test_generate_users_hashes_passwords_in_process_pool(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Define test data
+        monkeypatch.setattr(epic_user, "_min_parallel_passwords", 2)
+        last_org: EpicOrganization = EpicOrganization.objects.last()
+
+        # Run test
+        new_users = last_org.generate_users(4, hash_jobs=2)
+
+        # Verify final expectations
+        assert len(set(nu.username for nu in new_users)) == 4
+        assert all(nu.check_password(nu.username.lower()) for nu in new_users)
+
+    def test_generate_users_hashes_passwords_sequentially_by_default(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Define test data, (e.g. admin) requests should not start a process pool.
+        monkeypatch.setattr(epic_user, "_min_parallel_passwords", 2)
+
+        def unexpected_pool(*args, **kwargs):
+            raise AssertionError("Passwords hashed in a process pool.")
+
+        monkeypatch.setattr(epic_user, "ProcessPoolExecutor", unexpected_pool)
+        last_org: EpicOrganization = EpicOrganization.objects.last()
+
+        # Run test
+        new_users = last_org.generate_users(4)
+
+        # Verify final expectations
+        assert all(nu.check_password(nu.username.lower()) for nu in new_users)
+
+    def test_generate_users_runs_constant_queries(
+        self, django_assert_max_num_queries: pytest.fixture
+    ):
+        last_org: EpicOrganization = EpicOrganization.objects.last()
+        with django_assert_max_num_queries(10):
+            new_users = last_org.generate_users(50)
+        assert len(last_org.organization_users.all()) >= len(new_users)
+
 
 @pytest.mark.django_db
 class TestEpicUser:
@@ -1,4 +1,5 @@
 import pytest
+from django.db import IntegrityError
 from django.forms import ValidationError
 
 from epic_app.models.models import Agency, Area, Group, Program
@@ -143,6 +144,26 @@ class TestProgram:
         )
         assert not Program.objects.filter(name=name_case).exists()
 
+    def test_program_update_keeps_its_name(self):
+        program: Program = Program.objects.filter(name="e").first()
+        program.description = "Lorem ipsum"
+        program.save()
+        assert Program.objects.get(name="e").description == "Lorem ipsum"
+
+    @pytest.mark.parametrize("name_case", ["e", "E"])
+    def test_get_program_by_name(self, name_case: str):
+        assert Program.get_program_by_name(name_case) == Program.objects.get(name="e")
+
+    def test_get_program_by_name_not_found(self):
+        assert Program.get_program_by_name("not a program") is None
+
+    def test_program_unique_name_db_constraint(self):
+        a_group: Group = Group.objects.all().first()
+        with pytest.raises(IntegrityError):
+            Program.objects.bulk_create(
+                [Program(name="E", group=a_group, description="Lorem ipsum")]
+            )
+
     def test_program_can_have_multiple_agencies(self):
         program: Program = Program.objects.filter(name="e").first()
         for agency in Agency.objects.all():
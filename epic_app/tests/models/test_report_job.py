@@ -0,0 +1,171 @@
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils import timezone
+
+from epic_app.models.report_job import ReportJob, ReportJobStatus
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.fixture(autouse=True)
+def report_job_fixture(epic_test_db: pytest.fixture):
+    """
+    Dummy fixture just to load a default db from dummy_db.
+
+    Args:
+        epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+    """
+    pass
+
+
+@pytest.mark.django_db
+class TestReportJob:
+    def test_claim_next_gets_oldest_pending_job(self):
+        # Define test data.
+        admin_user = User.objects.get(username="admin")
+        first_job = ReportJob.objects.create(user=admin_user)
+        second_job = ReportJob.objects.create(user=admin_user)
+
+        # Run test.
+        claimed_jobs = [ReportJob.claim_next(), ReportJob.claim_next()]
+
+        # Verify final expectations.
+        assert claimed_jobs == [first_job, second_job]
+        assert all(rj.status == ReportJobStatus.RUNNING for rj in claimed_jobs)
+        assert all(rj.started_at for rj in claimed_jobs)
+        assert ReportJob.claim_next() is None
+
+    def test_set_progress_only_increases(self):
+        r_job = ReportJob.objects.create(user=User.objects.get(username="admin"))
+        r_job.set_progress(40)
+        r_job.set_progress(20)
+        r_job.set_progress(120)
+        r_job.refresh_from_db()
+        assert r_job.progress == 100
+
+    def test_get_report_path_only_when_done(self, tmp_path: Path):
+        # Define test data.
+        r_job = ReportJob.objects.create(user=User.objects.get(username="admin"))
+        report_path = tmp_path / "report.pdf"
+        report_path.write_bytes(b"%PDF")
+        assert r_job.get_report_path() is None
+
+        # Run test.
+        r_job.set_done(report_path)
+
+        # Verify final expectations.
+        assert r_job.get_report_path() == report_path
+        r_job.delete()
+        assert not report_path.exists()
+
+    def test_set_failed(self):
+        r_job = ReportJob.objects.create(user=User.objects.get(username="admin"))
+        r_job.set_failed("Lorem ipsum")
+        r_job.refresh_from_db()
+        assert r_job.status == ReportJobStatus.FAILED
+        assert r_job.error == "Lorem ipsum"
+        assert r_job.get_report_path() is None
+
+    def test_recover_stale_requeues_or_fails_abandoned_jobs(self):
+        # Define test data, jobs left running by a dead worker.
+        admin_user = User.objects.get(username="admin")
+        stale_job = ReportJob.objects.create(user=admin_user)
+        exhausted_job = ReportJob.objects.create(user=admin_user)
+        recent_job = ReportJob.objects.create(user=admin_user)
+        for _ in range(3):
+            ReportJob.claim_next().set_progress(50)
+        ReportJob.objects.filter(pk__in=[stale_job.pk, exhausted_job.pk]).update(
+            started_at=timezone.now() - timedelta(hours=2)
+        )
+        ReportJob.objects.filter(pk=exhausted_job.pk).update(
+            attempts=ReportJob.max_attempts
+        )
+
+        # Run test.
+        n_recovered = ReportJob.recover_stale(timedelta(hours=1))
+
+        # Verify final expectations.
+        assert n_recovered == 2
+        stale_job.refresh_from_db()
+        assert stale_job.status == ReportJobStatus.PENDING
+        assert stale_job.progress == 0
+        assert stale_job.started_at is None
+        exhausted_job.refresh_from_db()
+        assert exhausted_job.status == ReportJobStatus.FAILED
+        assert exhausted_job.error
+        recent_job.refresh_from_db()
+        assert recent_job.status == ReportJobStatus.RUNNING
+        assert ReportJob.claim_next() == stale_job
+        assert ReportJob.objects.get(pk=stale_job.pk).attempts == 2
+
+    def test_process_report_jobs_recovers_stale_jobs(self, tmp_path: Path):
+        # Define test data, a job claimed by a worker that died.
+        r_job = ReportJob.objects.create(user=User.objects.get(username="admin"))
+        ReportJob.claim_next()
+        ReportJob.objects.filter(pk=r_job.pk).update(
+            started_at=timezone.now() - timedelta(hours=2)
+        )
+        command_output = StringIO()
+
+        # Run test.
+        call_command(
+            "process_report_jobs",
+            "--once",
+            "--reports-dir",
+            str(tmp_path),
+            stdout=command_output,
+        )
+
+        # Verify final expectations.
+        r_job.refresh_from_db()
+        assert r_job.status == ReportJobStatus.DONE
+        assert r_job.get_report_path()
+        assert "Recovered 1 stale report jobs." in command_output.getvalue()
+
+    def test_delete_expired_removes_old_finished_jobs_and_reports(self, tmp_path: Path):
+        # Define test data.
+        admin_user = User.objects.get(username="admin")
+        expired_job, recent_job, pending_job = [
+            ReportJob.objects.create(user=admin_user) for _ in range(3)
+        ]
+        for r_job in [expired_job, recent_job]:
+            report_path = tmp_path / f"report_{r_job.pk}.pdf"
+            report_path.write_bytes(b"%PDF")
+            r_job.set_done(report_path)
+        ReportJob.objects.filter(pk=expired_job.pk).update(
+            finished_at=timezone.now() - timedelta(days=8)
+        )
+
+        # Run test.
+        n_deleted = ReportJob.delete_expired(timedelta(days=7))
+
+        # Verify final expectations.
+        assert n_deleted == 1
+        assert list(ReportJob.objects.order_by("pk")) == [recent_job, pending_job]
+        assert not Path(expired_job.report_file).exists()
+        assert Path(recent_job.report_file).exists()
+
+    def test_process_report_jobs_deletes_expired_jobs(self, tmp_path: Path):
+        # Define test data.
+        r_job = ReportJob.objects.create(user=User.objects.get(username="admin"))
+        r_job.set_failed("Lorem ipsum")
+        command_output = StringIO()
+
+        # Run test.
+        call_command(
+            "process_report_jobs",
+            "--once",
+            "--reports-dir",
+            str(tmp_path),
+            "--retention",
+            "0",
+            stdout=command_output,
+        )
+
+        # Verify final expectations.
+        assert not ReportJob.objects.exists()
+        assert "Deleted 1 expired report jobs." in command_output.getvalue()
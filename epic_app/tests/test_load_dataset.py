@@ -0,0 +1,95 @@
+import pytest
+
+from epic_app.load_dataset import LoadDataset
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    Answer,
+    EvolutionAnswer,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicUser
+from epic_app.tests import django_postgresql_db
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@django_postgresql_db
+class TestLoadDataset:
+    def _get_answers_signature(self):
+        return list(
+            AgreementAnswer.objects.order_by(
+                "user__username", "question_id"
+            ).values_list("user__username", "question_id", "selected_choice")
+        ) + list(
+            MultipleChoiceAnswer.objects.order_by(
+                "user__username", "question_id", "selected_programs"
+            ).values_list("user__username", "question_id", "selected_programs")
+        )
+
+    def test_generate_full_coverage(self, epic_test_db: pytest.fixture):
+        # Define test data
+        load_dataset = LoadDataset(2, 5, batch_size=7)
+
+        # Run test
+        counts = load_dataset.generate()
+
+        # Verify final expectations
+        load_users = EpicUser.objects.filter(username__startswith="load_")
+        assert counts["organizations"] == 2
+        assert counts["users"] == load_users.count() == 10
+        assert all(load_user.check_password("load") for load_user in load_users)
+        assert all(load_user.auth_token for load_user in load_users)
+        assert (
+            counts["answers"]
+            == Answer.objects.filter(user__in=load_users).count()
+            == 10 * Question.objects.count()
+        )
+        assert (
+            counts["selected_programs"]
+            == MultipleChoiceAnswer.selected_programs.through.objects.count()
+            == 3 * MultipleChoiceAnswer.objects.count()
+        )
+        assert all(
+            answer.is_valid_answer()
+            for answer_type in [AgreementAnswer, EvolutionAnswer]
+            for answer in answer_type.objects.all()
+        )
+
+    def test_generate_is_reproducible(self, epic_test_db: pytest.fixture):
+        # Define test data
+        def generate_signature(seed: int):
+            LoadDataset(1, 4, answered_ratio=0.5, seed=seed).generate()
+            signature = self._get_answers_signature()
+            EpicUser.objects.filter(username__startswith="load_").delete()
+            return signature
+
+        # Run test
+        first_signature = generate_signature(seed=7)
+        second_signature = generate_signature(seed=7)
+        other_signature = generate_signature(seed=8)
+
+        # Verify final expectations
+        assert first_signature
+        assert first_signature == second_signature
+        assert first_signature != other_signature
+
+    def test_generate_with_weights(self, epic_test_db: pytest.fixture):
+        # Run test
+        LoadDataset(1, 5, agreement_weights={AgreementAnswerType.AGR: 1}).generate()
+
+        # Verify final expectations
+        assert set(
+            AgreementAnswer.objects.values_list("selected_choice", flat=True)
+        ) == {AgreementAnswerType.AGR}
+
+    @pytest.mark.parametrize(
+        "weights",
+        [
+            pytest.param(dict(MAYBE=1), id="Unknown choice"),
+            pytest.param(dict(AGREE=0), id="No positive weight"),
+        ],
+    )
+    def test_invalid_weights_raises(self, weights):
+        with pytest.raises(ValueError):
+            LoadDataset(1, 1, agreement_weights=weights)
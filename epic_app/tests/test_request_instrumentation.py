@@ -0,0 +1,139 @@
+import json
+import logging
+
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from epic_app.request_instrumentation import (
+    RequestTimings,
+    _current_timings,
+    timed_section,
+)
+from epic_app.tests import django_postgresql_db
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+_logger_name = "epic_app.request_instrumentation"
+
+
+@pytest.fixture
+def admin_api_client(epic_test_db: pytest.fixture) -> APIClient:
+    api_client = APIClient()
+    admin_token = User.objects.get(username="admin").auth_token.key
+    api_client.credentials(HTTP_AUTHORIZATION=f"Token {admin_token}")
+    return api_client
+
+
+def _get_server_timing(response) -> dict:
+    return {
+        metric.split(";")[0]: metric for metric in response["Server-Timing"].split(", ")
+    }
+
+
+@django_postgresql_db
+class TestRequestInstrumentationMiddleware:
+    def test_disabled_by_default(self, admin_api_client: APIClient):
+        # Run request
+        response = admin_api_client.get("/api/program/")
+
+        # Verify final expectations
+        assert response.status_code == 200
+        assert not response.has_header("Server-Timing")
+
+    @override_settings(EPIC_REQUEST_INSTRUMENTATION=True)
+    def test_server_timing_and_log(self, admin_api_client: APIClient, caplog):
+        # Run request
+        with caplog.at_level(logging.INFO, logger=_logger_name):
+            response = admin_api_client.get("/api/program/")
+
+        # Verify final expectations
+        assert response.status_code == 200
+        server_timing = _get_server_timing(response)
+        assert set(server_timing) == {"db", "serializer", "total"}
+        request_log = json.loads(caplog.records[-1].getMessage())
+        assert caplog.records[-1].levelno == logging.INFO
+        assert request_log["path"] == "/api/program/"
+        assert request_log["status"] == 200
+        assert request_log["queries"] > 0
+        assert f'desc="{request_log["queries"]} queries"' in server_timing["db"]
+        assert request_log["total"] >= request_log["serializer"]
+        assert "top_repeated_queries" not in request_log
+
+    @override_settings(EPIC_REQUEST_INSTRUMENTATION=True, EPIC_SLOW_REQUEST_THRESHOLD=0)
+    def test_slow_request_logs_repeated_queries(
+        self, admin_api_client: APIClient, caplog
+    ):
+        # Run request
+        with caplog.at_level(logging.INFO, logger=_logger_name):
+            admin_api_client.get("/api/program/")
+
+        # Verify final expectations
+        assert caplog.records[-1].levelno == logging.WARNING
+        request_log = json.loads(caplog.records[-1].getMessage())
+        assert isinstance(request_log["top_repeated_queries"], list)
+        assert (
+            len(request_log["top_repeated_queries"])
+            <= settings.EPIC_SLOW_REQUEST_TOP_QUERIES
+        )
+
+    @override_settings(EPIC_REQUEST_INSTRUMENTATION=True)
+    def test_pdf_report_timing(self, admin_api_client: APIClient):
+        # Define test data
+        caches[settings.EPIC_REPORTS_CACHE].clear()
+
+        # Run request
+        response = admin_api_client.get("/api/epicorganization/report-pdf/")
+
+        # Verify final expectations
+        assert response.status_code == 200
+        assert "pdf" in _get_server_timing(response)
+
+
+class TestRequestTimings:
+    def test_get_top_repeated_queries(self):
+        # Define test data
+        timings = RequestTimings()
+        timings.queries = [
+            ("SELECT * FROM program WHERE id = %s", 0.001),
+            ("SELECT * FROM program WHERE id = %s", 0.002),
+            ("SELECT * FROM program WHERE id = %s", 0.003),
+            ("SELECT * FROM area", 0.001),
+            ("SELECT * FROM group WHERE id = %s", 0.001),
+            ("SELECT * FROM group WHERE id = %s", 0.001),
+        ]
+
+        # Run test
+        top_queries = timings.get_top_repeated_queries(5)
+
+        # Verify final expectations
+        assert top_queries == [
+            dict(sql="SELECT * FROM program WHERE id = %s", count=3, duration=6.0),
+            dict(sql="SELECT * FROM group WHERE id = %s", count=2, duration=2.0),
+        ]
+
+    def test_timed_section_outside_request_does_nothing(self):
+        with timed_section("serializer"):
+            pass
+        assert _current_timings.get() is None
+
+    def test_nested_timed_sections_are_timed_once(self):
+        # Define test data
+        timings = RequestTimings()
+        context_token = _current_timings.set(timings)
+
+        # Run test
+        try:
+            with timed_section("serializer"):
+                with timed_section("serializer"):
+                    pass
+                with timed_section("pdf"):
+                    pass
+        finally:
+            _current_timings.reset(context_token)
+
+        # Verify final expectations
+        assert set(timings.sections) == {"serializer", "pdf"}
+        assert timings.sections["serializer"] >= timings.sections["pdf"]
@@ -1,12 +1,20 @@
 import json
+import re
 from pathlib import Path
-from typing import Callable, Optional, Type
+from typing import Callable, List, Optional, Type
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
 from django.http import FileResponse
+from django.test.utils import CaptureQueriesContext, override_settings
 from rest_framework.test import APIClient
 
+from epic_app import views
+from epic_app.load_dataset import LoadDataset
+from epic_app.models.answer_tally import AnswerTally
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
 from epic_app.models.epic_answers import (
     AgreementAnswer,
     AgreementAnswerType,
@@ -23,7 +31,9 @@ from epic_app.models.epic_questions import (
     Question,
 )
 from epic_app.models.epic_user import EpicOrganization, EpicUser
-from epic_app.models.models import Program
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.models.report_job import ReportJob, ReportJobStatus
+from epic_app.pagination import EpicUserCursorPagination
 from epic_app.tests import django_postgresql_db, test_data_dir
 from epic_app.tests.epic_db_fixture import epic_test_db
 from epic_app.utils import get_submodel_type_list
@@ -161,7 +171,47 @@ class TestEpicUserViewSet:
 
         # Verify final exepctations.
         assert response.status_code == 200
-        assert len(response.data) > 1
+        assert len(response.data["results"]) > 1
+
+    def test_GET_epic_user_is_paginated_by_cursor(
+        self,
+        admin_api_client: APIClient,
+    ):
+        # Define test data.
+        expected_ids = list(
+            EpicUser.objects.order_by("pk").values_list("pk", flat=True)
+        )
+        next_url = self.url_root + "?page_size=2"
+        found_ids = []
+
+        # Run request.
+        while next_url:
+            response = admin_api_client.get(next_url)
+            assert response.status_code == 200
+            assert len(response.data["results"]) <= 2
+            found_ids.extend(e_user["id"] for e_user in response.data["results"])
+            next_url = response.data["next"]
+
+        # Verify final exepctations.
+        assert found_ids == expected_ids
+
+    def test_GET_epic_user_page_size_is_limited(
+        self,
+        admin_api_client: APIClient,
+    ):
+        # Define test data.
+        max_page_size = EpicUserCursorPagination.max_page_size
+        LoadDataset(1, max_page_size, answered_ratio=0).generate()
+
+        # Run request.
+        response = admin_api_client.get(
+            self.url_root + f"?page_size={max_page_size + 1}"
+        )
+
+        # Verify final exepctations.
+        assert response.status_code == 200
+        assert len(response.data["results"]) == max_page_size
+        assert response.data["next"]
 
     def test_GET_epic_user_as_user_not_allowed(
         self,
@@ -383,6 +433,249 @@ class TestEpicOrganizationViewSet:
         assert response.status_code == 200
         assert len(response.data) == len(Program.objects.all())
 
+    def _get_report_queries(self, api_client: APIClient) -> int:
+        with CaptureQueriesContext(connection) as report_queries:
+            response = api_client.get(self.url_root + "report/")
+        assert response.status_code == 200
+        return len(report_queries)
+
+    @pytest.mark.parametrize(
+        "username",
+        [
+            pytest.param("Dooku", id="Advisor epic user"),
+            pytest.param("admin", id="Admin user"),
+        ],
+    )
+    def test_RETRIEVE_report_has_constant_queries(
+        self, username: str, _report_fixture: dict, api_client: APIClient
+    ):
+        # Define test data, the first report also creates its data versions.
+        set_user_auth_token(api_client, username)
+        self._get_report_queries(api_client)
+        EpicDataVersion.renew(EpicDataVersionName.ANSWERS)
+        initial_queries = self._get_report_queries(api_client)
+
+        # Extend the database with new programs, questions, users and answers.
+        new_users = EpicOrganization.objects.first().generate_users(3)
+        a_group = Program.objects.first().group
+        for p_name in ["f", "g", "h"]:
+            n_program = Program.objects.create(
+                name=p_name, group=a_group, description="Lorem ipsum dolor sit amet."
+            )
+            nfq = NationalFrameworkQuestion.objects.create(
+                title="Is this a new question?",
+                program=n_program,
+                description="Lorem ipsum dolor sit amet.",
+            )
+            evq = EvolutionQuestion.objects.create(
+                title="Is this a new evolution question?", program=n_program
+            )
+            lnk = LinkagesQuestion.objects.create(
+                title="Is this a new linkage question?", program=n_program
+            )
+            for n_user in new_users:
+                AgreementAnswer.objects.create(
+                    user=n_user,
+                    question=nfq,
+                    selected_choice=AgreementAnswerType.AGR,
+                    justify_answer="Lorem ipsum",
+                )
+                EvolutionAnswer.objects.create(
+                    user=n_user,
+                    question=evq,
+                    selected_choice=EvolutionChoiceType.NASCENT,
+                )
+                mca = MultipleChoiceAnswer.objects.create(user=n_user, question=lnk)
+                mca.selected_programs.add(n_program)
+
+        # Run test
+        extended_queries = self._get_report_queries(api_client)
+
+        # Verify final expectations.
+        assert extended_queries == initial_queries
+
+    @pytest.mark.parametrize(
+        "username",
+        [
+            pytest.param("Dooku", id="Advisor epic user"),
+            pytest.param("admin", id="Admin user"),
+        ],
+    )
+    def test_RETRIEVE_report_does_not_filter_by_user_ids(
+        self, username: str, _report_fixture: dict, api_client: APIClient
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, username)
+        EpicOrganization.objects.first().generate_users(5)
+
+        # Run test
+        with CaptureQueriesContext(connection) as report_queries:
+            response = api_client.get(self.url_root + "report/")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert not any(
+            re.search(r"\"user_id\" IN \(\d", r_query["sql"])
+            for r_query in report_queries
+        )
+
+    def test_RETRIEVE_report_is_cached_until_answers_change(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        # Define test data.
+        full_url = self.url_root + "report/"
+        set_user_auth_token(api_client, "Dooku")
+        first_response = api_client.get(full_url)
+
+        # Run request.
+        cached_response = api_client.get(full_url)
+        a_answer = AgreementAnswer.objects.first()
+        a_answer.selected_choice = AgreementAnswerType.SDIS
+        a_answer.save()
+        changed_response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert first_response["X-Report-Cache"] == "MISS"
+        assert cached_response["X-Report-Cache"] == "HIT"
+        assert cached_response.data == first_response.data
+        assert changed_response["X-Report-Cache"] == "MISS"
+        assert changed_response.data != first_response.data
+
+    def test_RETRIEVE_report_is_cached_while_other_organizations_change(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        # Define test data.
+        full_url = self.url_root + "report/"
+        set_user_auth_token(api_client, "Dooku")
+        api_client.get(full_url)
+        set_user_auth_token(api_client, "admin")
+        api_client.get(full_url)
+        other_user = EpicOrganization.objects.create(
+            name="Rebel Alliance"
+        ).generate_users(1)[0]
+
+        # Run request.
+        AgreementAnswer.objects.create(
+            user=other_user,
+            question=NationalFrameworkQuestion.objects.first(),
+            selected_choice=AgreementAnswerType.AGR,
+        )
+        all_response = api_client.get(full_url)
+        set_user_auth_token(api_client, "Dooku")
+        organization_response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert all_response["X-Report-Cache"] == "MISS"
+        assert organization_response["X-Report-Cache"] == "HIT"
+
+    @pytest.mark.parametrize(
+        "username",
+        [
+            pytest.param("Dooku", id="Advisor epic user"),
+            pytest.param("admin", id="Admin user"),
+        ],
+    )
+    def test_RETRIEVE_report_summary_matches_report(
+        self, username: str, _report_fixture: dict, api_client: APIClient
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, username)
+        LoadDataset(1, 4, answered_ratio=0.5).generate()
+        report = api_client.get(self.url_root + "report/").data
+
+        # Run request.
+        response = api_client.get(self.url_root + "report-summary/")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert len(response.data) == len(report)
+        for p_summary, p_report in zip(response.data, report):
+            assert p_summary["id"] == p_report["id"]
+            for q_summary, q_report in zip(
+                p_summary["questions"], p_report["questions"]
+            ):
+                assert q_summary["id"] == q_report["id"]
+                assert q_summary["summary"] == {
+                    s_key: s_value
+                    for s_key, s_value in q_report["question_answers"][
+                        "summary"
+                    ].items()
+                    if not s_key.endswith("_justify")
+                }
+
+    def _get_report_summary_queries(self, api_client: APIClient) -> int:
+        with CaptureQueriesContext(connection) as summary_queries:
+            response = api_client.get(self.url_root + "report-summary/")
+        assert response.status_code == 200
+        return len(summary_queries)
+
+    @pytest.mark.parametrize(
+        "username",
+        [
+            pytest.param("Dooku", id="Advisor epic user"),
+            pytest.param("admin", id="Admin user"),
+        ],
+    )
+    def test_RETRIEVE_report_summary_has_constant_queries(
+        self, username: str, _report_fixture: dict, api_client: APIClient
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, username)
+        initial_queries = self._get_report_summary_queries(api_client)
+        EpicOrganization.objects.first().generate_users(3)
+        LoadDataset(2, 5).generate()
+
+        # Run test
+        extended_queries = self._get_report_summary_queries(api_client)
+
+        # Verify final expectations.
+        assert extended_queries == initial_queries
+
+    def test_RETRIEVE_report_summary_as_epic_user_denied(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.get(self.url_root + "report-summary/")
+        assert response.status_code == 403
+
+    @override_settings(EPIC_REPORTS_CACHE_STATS=True)
+    def test_RETRIEVE_report_cache_stats(
+        self, _report_fixture: dict, admin_api_client: APIClient
+    ):
+        # Define test data.
+        full_url = self.url_root + "report-cache/"
+        initial_stats = admin_api_client.get(full_url).data
+
+        # Run request.
+        admin_api_client.get(self.url_root + "report/")
+        admin_api_client.get(self.url_root + "report/")
+        response = admin_api_client.get(full_url)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response.data["misses"] == initial_stats["misses"] + 1
+        assert response.data["hits"] == initial_stats["hits"] + 1
+        assert response.data["enabled"]
+
+    def test_RETRIEVE_cached_report_does_not_write(
+        self, _report_fixture: dict, admin_api_client: APIClient
+    ):
+        # Define test data.
+        full_url = self.url_root + "report/"
+        admin_api_client.get(full_url)
+
+        # Run request.
+        with CaptureQueriesContext(connection) as cached_queries:
+            response = admin_api_client.get(full_url)
+
+        # Verify final expectations.
+        assert response["X-Report-Cache"] == "HIT"
+        assert all(c_query["sql"].startswith("SELECT") for c_query in cached_queries)
+        assert not admin_api_client.get(self.url_root + "report-cache/").data["enabled"]
+
+    def test_RETRIEVE_report_cache_stats_as_advisor_denied(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(self.url_root + "report-cache/")
+        assert response.status_code == 403
+
     def test_RETRIEVE_pdf_report_As_Advisor_epic_user(
         self, _report_fixture: dict, api_client: APIClient
     ):
@@ -404,6 +697,68 @@ class TestEpicOrganizationViewSet:
         assert output_file.exists()
 
 
+@django_postgresql_db
+class TestReportJobViewSet:
+    url_root = "/api/reportjob/"
+
+    def test_POST_reportjob_as_non_advisor_epic_user_is_forbidden(
+        self, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.post(self.url_root, {}, format="json")
+        assert response.status_code == 403
+        assert not ReportJob.objects.exists()
+
+    def test_GET_reportjob_list_only_own_jobs(self, api_client: APIClient):
+        # Define test data.
+        ReportJob.objects.create(user=User.objects.get(username="admin"))
+        dooku_job = ReportJob.objects.create(user=User.objects.get(username="Dooku"))
+
+        # Run request.
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(self.url_root)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert [rj_data["id"] for rj_data in response.data] == [dooku_job.pk]
+
+    def test_POST_reportjob_process_and_download(
+        self, api_client: APIClient, tmp_path: Path
+    ):
+        # Define test data.
+        AgreementAnswer.objects.create(
+            user=EpicUser.objects.get(username="Anakin"),
+            question=NationalFrameworkQuestion.objects.first(),
+            selected_choice=AgreementAnswerType.AGR,
+            justify_answer="Lorem ipsum dolor sit amet.",
+        )
+
+        # Queue the report.
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.post(self.url_root, {}, format="json")
+        assert response.status_code == 201
+        assert response.data["status"] == ReportJobStatus.PENDING
+        job_url = self.url_root + str(response.data["id"]) + "/"
+
+        # Not yet available.
+        response = api_client.get(job_url + "download/")
+        assert response.status_code == 409
+
+        # Render the report as the worker would.
+        call_command("process_report_jobs", "--once", "--reports-dir", str(tmp_path))
+        response = api_client.get(job_url)
+        assert response.status_code == 200
+        assert response.data["status"] == ReportJobStatus.DONE
+        assert response.data["progress"] == 100
+
+        # Download the report.
+        response: FileResponse = api_client.get(job_url + "download/")
+        assert response.status_code == 200
+        assert response.filename == "answers_report.pdf"
+        assert b"".join(response.streaming_content).startswith(b"%PDF")
+        assert not list(tmp_path.glob("*.part"))
+
+
 @django_postgresql_db
 class TestAreaViewSet:
     url_root = "/api/area/"
@@ -665,6 +1020,265 @@ class TestProgramViewSet:
         for qa in response.data["questions_answers"]:
             assert qa in _progress_fixture["questions_answers"]
 
+    def test_GET_progress_list_epic_user(
+        self, api_client: APIClient, _progress_fixture: dict
+    ):
+        # Define test data.
+        full_url = self.url_root + "progress/"
+        a_program: Program = Program.objects.get(name="a")
+
+        # Run request.
+        set_user_auth_token(api_client, "Anakin")
+        with CaptureQueriesContext(connection) as all_programs_queries:
+            response = api_client.get(full_url)
+
+        # Verify final expectations
+        assert response.status_code == 200
+        assert len(response.data) == len(Program.objects.all())
+        for p_progress in response.data:
+            if p_progress["program"] != a_program.pk:
+                assert p_progress["progress"] == 0.0
+                assert p_progress["questions_answers"] == []
+                continue
+            assert p_progress["progress"] == _progress_fixture["progress"]
+            assert len(p_progress["questions_answers"]) == 6
+            for qa in p_progress["questions_answers"]:
+                assert qa in _progress_fixture["questions_answers"]
+
+        # The number of queries does not depend on the number of programs.
+        with CaptureQueriesContext(connection) as one_program_queries:
+            api_client.get(full_url + f"?program={a_program.pk}")
+        assert len(all_programs_queries) == len(one_program_queries)
+
+    def test_GET_progress_list_filtered_programs(
+        self, api_client: APIClient, _progress_fixture: dict
+    ):
+        # Define test data.
+        program_ids = [Program.objects.get(name=p_name).pk for p_name in ["a", "c"]]
+        full_url = (
+            self.url_root
+            + "progress/?"
+            + "&".join(f"program={p_id}" for p_id in program_ids)
+        )
+
+        # Run request.
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.get(full_url)
+
+        # Verify final expectations
+        assert response.status_code == 200
+        assert [p_progress["program"] for p_progress in response.data] == program_ids
+
+    def test_GET_progress_list_filtered_programs_only_loads_their_answers(
+        self, api_client: APIClient, _progress_fixture: dict
+    ):
+        # Define test data, program 'c' has no answers from 'Anakin'.
+        c_program: Program = Program.objects.get(name="c")
+        full_url = self.url_root + f"progress/?program={c_program.pk}"
+
+        # Run request.
+        set_user_auth_token(api_client, "Anakin")
+        with CaptureQueriesContext(connection) as progress_queries:
+            response = api_client.get(full_url)
+
+        # Verify final expectations
+        assert response.status_code == 200
+        assert response.data[0]["questions_answers"] == [
+            dict(question=q.pk, answer=None) for q in c_program.questions.all()
+        ]
+        answer_queries = [
+            c_query["sql"]
+            for c_query in progress_queries
+            if c_query["sql"].startswith("SELECT") and "_answer" in c_query["sql"]
+        ]
+        assert answer_queries
+        assert all('"program_id" IN' in a_query for a_query in answer_queries)
+
+    def test_GET_progress_list_invalid_program_returns_bad_request(
+        self, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.get(self.url_root + "progress/?program=a")
+        assert response.status_code == 400
+
+
+def _extend_domain():
+    for n_area in range(3):
+        n_area = Area.objects.create(name=f"new area {n_area}")
+        n_agency = Agency.objects.create(name=f"new agency {n_area.pk}")
+        for n_group in range(2):
+            n_group = Group.objects.create(
+                name=f"new group {n_area.pk}.{n_group}", area=n_area
+            )
+            n_program = Program.objects.create(
+                name=f"new program {n_group.pk}",
+                group=n_group,
+                description="Lorem ipsum dolor sit amet.",
+            )
+            n_program.agencies.add(n_agency)
+            EvolutionQuestion.objects.create(
+                title="Is this a new evolution question?", program=n_program
+            )
+            LinkagesQuestion.objects.create(
+                title="Is this a new linkage question?", program=n_program
+            )
+
+
+@django_postgresql_db
+class TestDomainViewSetsCache:
+    domain_url_roots = [
+        pytest.param("/api/area/", id="Area"),
+        pytest.param("/api/agency/", id="Agency"),
+        pytest.param("/api/group/", id="Group"),
+        pytest.param("/api/program/", id="Program"),
+    ]
+
+    def _get_list_queries(self, api_client: APIClient, url_root: str) -> int:
+        with CaptureQueriesContext(connection) as list_queries:
+            response = api_client.get(url_root)
+        assert response.status_code == 200
+        assert response["X-Domain-Cache"] == "MISS"
+        return len(list_queries)
+
+    @pytest.mark.parametrize("url_root", domain_url_roots)
+    def test_GET_domain_list_has_constant_queries(
+        self, url_root: str, api_client: APIClient
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+        initial_queries = self._get_list_queries(api_client, url_root)
+
+        # Extend the domain (which also renews its version).
+        _extend_domain()
+
+        # Run test
+        extended_queries = self._get_list_queries(api_client, url_root)
+
+        # Verify final expectations.
+        assert extended_queries == initial_queries
+
+    @pytest.mark.parametrize("url_root", domain_url_roots)
+    def test_GET_domain_list_is_cached_until_domain_changes(
+        self, url_root: str, api_client: APIClient
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+        first_response = api_client.get(url_root)
+
+        # Run test
+        cached_response = api_client.get(url_root)
+        # Importers renew the domain version once done.
+        EpicDataVersion.renew(EpicDataVersionName.DOMAIN)
+        renewed_response = api_client.get(url_root)
+
+        # Verify final expectations.
+        assert first_response["X-Domain-Cache"] == "MISS"
+        assert cached_response["X-Domain-Cache"] == "HIT"
+        assert renewed_response["X-Domain-Cache"] == "MISS"
+        assert json.loads(cached_response.content) == json.loads(first_response.content)
+        assert json.loads(renewed_response.content) == json.loads(
+            first_response.content
+        )
+
+
+@django_postgresql_db
+class TestDomainViewSet:
+    url_root = "/api/domain/snapshot/"
+
+    def _get_snapshot(self, api_client: APIClient, **headers):
+        set_user_auth_token(api_client, "Palpatine")
+        return api_client.get(self.url_root, **headers)
+
+    def test_GET_snapshot_without_auth_returns_error(self, api_client: APIClient):
+        # Run request
+        response = api_client.get(self.url_root)
+
+        # Verify final expectations.
+        assert response.status_code in [401, 403]
+
+    def test_GET_snapshot_returns_full_domain(self, api_client: APIClient):
+        # Run request
+        response = self._get_snapshot(api_client)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        snapshot = json.loads(response.content)
+        assert [a["name"] for a in snapshot["areas"]] == ["alpha", "beta"]
+        assert len(snapshot["agencies"]) == Agency.objects.count()
+        snapshot_programs = {
+            s_program["name"]: s_program
+            for s_area in snapshot["areas"]
+            for s_group in s_area["groups"]
+            for s_program in s_group["programs"]
+        }
+        assert set(snapshot_programs) == set(
+            Program.objects.values_list("name", flat=True)
+        )
+        a_program = Program.objects.get(name="a")
+        a_questions = snapshot_programs["a"]["questions"]
+        assert set(snapshot_programs["a"]["agencies"]) == set(
+            a_program.agencies.values_list("pk", flat=True)
+        )
+        for q_name, q_type in [
+            ("nationalframework", NationalFrameworkQuestion),
+            ("keyagencyactions", KeyAgencyActionsQuestion),
+            ("evolution", EvolutionQuestion),
+            ("linkages", LinkagesQuestion),
+        ]:
+            # Same questions as their `program/{pk}/question-*` endpoint.
+            q_response = api_client.get(
+                f"/api/program/{a_program.pk}/question-{q_name}/"
+            )
+            assert a_questions[q_name] == json.loads(q_response.content)
+            assert (
+                len(a_questions[q_name])
+                == q_type.objects.filter(program=a_program).count()
+            )
+        assert snapshot_programs["e"]["questions"]["evolution"] == []
+
+    def test_GET_snapshot_has_constant_queries(self, api_client: APIClient):
+        # Define test data.
+        with CaptureQueriesContext(connection) as initial_queries:
+            self._get_snapshot(api_client)
+        n_initial_queries = len(initial_queries)
+        _extend_domain()
+
+        # Run test
+        with CaptureQueriesContext(connection) as extended_queries:
+            response = self._get_snapshot(api_client)
+        n_extended_queries = len(extended_queries)
+
+        # Verify final expectations.
+        assert response["X-Domain-Cache"] == "MISS"
+        assert n_extended_queries == n_initial_queries
+
+    def test_GET_snapshot_revalidates_with_etag(self, api_client: APIClient):
+        # Define test data.
+        first_response = self._get_snapshot(api_client)
+        snapshot_etag = first_response["ETag"]
+
+        # Run test
+        not_modified_response = self._get_snapshot(
+            api_client, HTTP_IF_NONE_MATCH=snapshot_etag
+        )
+        # Importers renew the domain version once done.
+        EpicDataVersion.renew(EpicDataVersionName.DOMAIN)
+        modified_response = self._get_snapshot(
+            api_client, HTTP_IF_NONE_MATCH=snapshot_etag
+        )
+
+        # Verify final expectations.
+        assert first_response.status_code == 200
+        assert not snapshot_etag.startswith("W/")
+        assert not_modified_response.status_code == 304
+        assert not_modified_response["ETag"] == snapshot_etag
+        assert not not_modified_response.content
+        assert modified_response.status_code == 200
+        assert modified_response["ETag"] != snapshot_etag
+        assert json.loads(modified_response.content) == json.loads(
+            first_response.content
+        )
+
 
 @django_postgresql_db
 class TestQuestionViewSet:
@@ -729,6 +1343,93 @@ class TestQuestionViewSet:
         # As many answers as users there are
         assert len(response.data) == len(EpicUser.objects.all())
 
+    def _get_answers_queries(self, api_client: APIClient, full_url: str) -> int:
+        with CaptureQueriesContext(connection) as answers_queries:
+            response = api_client.get(full_url)
+        assert response.status_code == 200
+        assert len(response.data) == EpicUser.objects.count()
+        return len(answers_queries)
+
+    @pytest.mark.parametrize("q_type", q_subtypes)
+    def test_RETRIEVE_answers_for_superuser_has_constant_queries(
+        self, q_type: Type[Question], api_client: APIClient
+    ):
+        # Define test data.
+        q_pk = q_type.objects.all().first().pk
+        full_url = self.url_root + str(q_pk) + "/answers/"
+        set_user_auth_token(api_client, "admin")
+        Answer.objects.all().delete()
+        initial_queries = self._get_answers_queries(api_client, full_url)
+
+        # Extend the database with new users without answers.
+        EpicOrganization.objects.first().generate_users(5)
+
+        # Run test
+        assert self._get_answers_queries(api_client, full_url) == initial_queries
+
+    def test_RETRIEVE_answers_created_concurrently(
+        self, api_client: APIClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Define test data, an answer created by another request after it was read as missing.
+        question = NationalFrameworkQuestion.objects.first()
+        full_url = self.url_root + str(question.pk) + "/answers/"
+        epic_user = EpicUser.objects.get(username="Palpatine")
+        AgreementAnswer.objects.filter(question=question).delete()
+        concurrent_answer = AgreementAnswer.objects.create(
+            user=epic_user, question=question
+        )
+        bulk_create_answers = views.bulk_create_submodel_instances
+        bulk_create_calls = []
+
+        def bulk_create_after_stale_read(a_type, instances):
+            bulk_create_calls.append(a_type)
+            if len(bulk_create_calls) == 1:
+                instances = [a_type(question_id=question.pk, user_id=epic_user.pk)]
+            return bulk_create_answers(a_type, instances)
+
+        monkeypatch.setattr(
+            views, "bulk_create_submodel_instances", bulk_create_after_stale_read
+        )
+
+        # Run test
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert len(bulk_create_calls) == 2
+        assert [a_data["id"] for a_data in response.data] == [concurrent_answer.pk]
+
+    def test_RETRIEVE_answers_for_superuser_reuses_existing_answers(
+        self, api_client: APIClient
+    ):
+        # Define test data.
+        question = NationalFrameworkQuestion.objects.first()
+        full_url = self.url_root + str(question.pk) + "/answers/"
+        set_user_auth_token(api_client, "admin")
+        existing_answers = dict(
+            AgreementAnswer.objects.filter(question=question).values_list(
+                "user_id", "pk"
+            )
+        )
+
+        # Run test
+        response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert [a_data["user"] for a_data in response.data] == list(
+            EpicUser.objects.values_list("pk", flat=True)
+        )
+        assert all(
+            a_data["id"] == existing_answers[a_data["user"]]
+            for a_data in response.data
+            if a_data["user"] in existing_answers
+        )
+        assert AgreementAnswer.objects.filter(question=question).count() == len(
+            response.data
+        )
+
 
 @django_postgresql_db
 class TestAnswerViewSet:
@@ -859,11 +1560,29 @@ class TestAnswerViewSet:
 
         # Verify final expectations.
         assert response.status_code == 200
+        assert response.data["next"] is None
         if not username == self.anakin.username:
-            assert len(response.data) == 0
+            assert len(response.data["results"]) == 0
             return
-        assert len(response.data) == 3
-        assert json.dumps(response.data) == json.dumps(expected_values)
+        assert len(response.data["results"]) == 3
+        assert json.dumps(response.data["results"]) == json.dumps(expected_values)
+
+    def test_GET_answer_is_paginated_by_cursor(
+        self, api_client: APIClient, _answers_fixture: dict
+    ):
+        # Define test data
+        expected_ids = [a_f["id"] for a_f in _answers_fixture.values()]
+        set_user_auth_token(api_client, "Anakin")
+
+        # Run test
+        first_page = api_client.get(self.url_root + "?page_size=2")
+        second_page = api_client.get(first_page.data["next"])
+
+        # Verify final expectations.
+        assert [a["id"] for a in first_page.data["results"]] == expected_ids[:2]
+        assert [a["id"] for a in second_page.data["results"]] == expected_ids[2:]
+        assert second_page.data["next"] is None
+        assert second_page.data["previous"]
 
     @pytest.mark.parametrize("username", answer_fixture_users)
     @pytest.mark.parametrize("answer_type", get_submodel_type_list(Answer))
@@ -1015,6 +1734,166 @@ class TestAnswerViewSet:
         assert changed_answer is not None
         self._compare_answer_fields(changed_answer, json_data, lambda x, y: x == y)
 
+    def test_POST_bulk_answers_upserts_mixed_subtypes(
+        self, api_client: APIClient, _answers_fixture: dict
+    ):
+        # Define test data, questions 1, 3 and 5 are already answered.
+        json_data = [
+            dict(question=1, selected_choice=str(AgreementAnswerType.DIS)),
+            dict(question=2, selected_choice=str(AgreementAnswerType.SAGR)),
+            dict(
+                question=6,
+                selected_choice=str(AgreementAnswerType.NAND),
+                justify_answer="Deserunt et velit ad occaecat qui.",
+            ),
+            dict(question=3, justify_answer="Not so effective after all."),
+            dict(question=4, selected_choice=str(EvolutionChoiceType.NASCENT)),
+            dict(question=5, selected_programs=[1, 3, 3]),
+        ]
+        set_user_auth_token(api_client, "Anakin")
+
+        # Run test
+        response = api_client.post(self.url_root + "bulk/", json_data, format="json")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert [a["question"] for a in response.data] == [1, 2, 6, 3, 4, 5]
+        assert [a["id"] for a in response.data if a["question"] in [1, 3, 5]] == [
+            self.yna.pk,
+            self.sca.pk,
+            self.mca.pk,
+        ]
+        assert Answer.objects.filter(user=self.anakin).count() == 6
+        assert AgreementAnswer.objects.get(pk=self.yna.pk).selected_choice == str(
+            AgreementAnswerType.DIS
+        )
+        updated_sca = EvolutionAnswer.objects.get(pk=self.sca.pk)
+        # Fields not submitted are kept.
+        assert updated_sca.selected_choice == str(EvolutionChoiceType.EFFECTIVE)
+        assert updated_sca.justify_answer == "Not so effective after all."
+        assert AgreementAnswer.objects.get(
+            user=self.anakin, question_id=6
+        ).justify_answer == ("Deserunt et velit ad occaecat qui.")
+        assert sorted(response.data[-1]["selected_programs"]) == [1, 3]
+        assert sorted(self.mca.selected_programs.values_list("pk", flat=True)) == [1, 3]
+
+    def test_POST_bulk_answers_updates_tallies(
+        self, api_client: APIClient, _answers_fixture: dict
+    ):
+        # Define test data, questions 1, 3 and 5 are already answered.
+        json_data = [
+            dict(question=1, selected_choice=str(AgreementAnswerType.DIS)),
+            dict(question=2, selected_choice=str(AgreementAnswerType.SAGR)),
+            dict(question=4, selected_choice=str(EvolutionChoiceType.NASCENT)),
+            dict(question=5, selected_programs=[2, 4]),
+        ]
+        set_user_auth_token(api_client, "Anakin")
+
+        def get_tallies() -> List[tuple]:
+            return sorted(
+                AnswerTally.objects.filter(n_answers__gt=0).values_list(
+                    "question_id",
+                    "organization_id",
+                    "n_answers",
+                    "n_invalid",
+                    "choice_counts",
+                    "program_counts",
+                )
+            )
+
+        # Run test
+        response = api_client.post(self.url_root + "bulk/", json_data, format="json")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        bulk_tallies = get_tallies()
+        AnswerTally.rebuild()
+        assert bulk_tallies == get_tallies()
+
+    def test_POST_bulk_answers_has_constant_queries(self, api_client: APIClient):
+        # Define test data
+        def get_bulk_queries(username: str, questions: List[Question]) -> int:
+            set_user_auth_token(api_client, username)
+            json_data = [
+                dict(question=q.pk, justify_answer="Lorem ipsum", selected_programs=[1])
+                for q in questions
+            ]
+            with CaptureQueriesContext(connection) as bulk_queries:
+                response = api_client.post(
+                    self.url_root + "bulk/", json_data, format="json"
+                )
+            n_queries = len(bulk_queries)
+            assert response.status_code == 200
+            return n_queries
+
+        # Run test
+        single_queries = get_bulk_queries(
+            "Anakin",
+            [
+                NationalFrameworkQuestion.objects.first(),
+                EvolutionQuestion.objects.first(),
+                LinkagesQuestion.objects.first(),
+            ],
+        )
+        all_queries = get_bulk_queries("Palpatine", Question.objects.all())
+        updated_queries = get_bulk_queries("Palpatine", Question.objects.all())
+
+        # Verify final expectations.
+        assert all_queries == single_queries
+        assert Answer.objects.filter(user__username="Palpatine").count() == (
+            Question.objects.count()
+        )
+        # Updating also takes one bulk query per answer subtype.
+        assert updated_queries <= all_queries
+
+    @pytest.mark.parametrize(
+        "invalid_answer, error_field",
+        [
+            pytest.param(dict(question=42), "question", id="Unknown question"),
+            pytest.param(dict(question=1), "question", id="Repeated question"),
+            pytest.param(
+                dict(question=3, selected_choice=str(AgreementAnswerType.AGR)),
+                "selected_choice",
+                id="Choice of another answer type",
+            ),
+            pytest.param(
+                dict(question=5, selected_programs=[42]),
+                "selected_programs",
+                id="Unknown program",
+            ),
+            pytest.param(dict(selected_choice=""), "question", id="Missing question"),
+        ],
+    )
+    def test_POST_bulk_answers_invalid_stores_nothing(
+        self, invalid_answer: dict, error_field: str, api_client: APIClient
+    ):
+        # Define test data
+        json_data = [
+            dict(question=1, selected_choice=str(AgreementAnswerType.AGR)),
+            invalid_answer,
+        ]
+        set_user_auth_token(api_client, "Anakin")
+
+        # Run test
+        response = api_client.post(self.url_root + "bulk/", json_data, format="json")
+
+        # Verify final expectations.
+        assert response.status_code == 400
+        assert response.data[0] == {}
+        assert error_field in response.data[1]
+        assert not Answer.objects.exists()
+
+    def test_POST_bulk_answers_as_admin_is_forbidden(self, api_client: APIClient):
+        # Run test
+        set_user_auth_token(api_client, "admin")
+        response = api_client.post(
+            self.url_root + "bulk/", [dict(question=1)], format="json"
+        )
+
+        # Verify final expectations.
+        assert response.status_code == 403
+        assert not Answer.objects.exists()
+
 
 @django_postgresql_db
 class TestApiDocumentation:
@@ -0,0 +1,171 @@
+from typing import Type
+
+import pytest
+
+from epic_app.models.epic_answers import (
+    AgreementAnswer,
+    AgreementAnswerType,
+    Answer,
+    EvolutionAnswer,
+    MultipleChoiceAnswer,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+    Question,
+)
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.tests.epic_db_fixture import epic_test_db
+from epic_app.utils import (
+    bulk_create_submodel_instances,
+    get_instance_as_submodel_type,
+    get_instances_as_submodel_type,
+    get_submodel_type,
+    get_submodel_type_list,
+    get_submodel_types,
+)
+
+
+@pytest.fixture(autouse=True)
+def utils_fixture(epic_test_db: pytest.fixture):
+    """
+    Dummy fixture to load a default db with answers of all subtypes.
+
+    Args:
+        epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+    """
+    anakin = EpicUser.objects.get(username="Anakin")
+    AgreementAnswer.objects.create(
+        user=anakin,
+        question=NationalFrameworkQuestion.objects.first(),
+        selected_choice=AgreementAnswerType.AGR,
+    )
+    EvolutionAnswer.objects.create(
+        user=anakin,
+        question=EvolutionQuestion.objects.first(),
+        selected_choice=EvolutionChoiceType.NASCENT,
+    )
+    MultipleChoiceAnswer.objects.create(
+        user=anakin, question=LinkagesQuestion.objects.first()
+    )
+
+
+@pytest.mark.django_db
+class TestSubmodelTypes:
+    @pytest.mark.parametrize("model_type", [Question, Answer])
+    def test_get_submodel_types_runs_one_query(
+        self, model_type: Type, django_assert_num_queries: pytest.fixture
+    ):
+        # Define test data
+        expected_types = {
+            st_instance.pk: st_type
+            for st_type in get_submodel_type_list(model_type)
+            for st_instance in st_type.objects.all()
+        }
+
+        # Run test
+        with django_assert_num_queries(1):
+            submodel_types = get_submodel_types(
+                model_type, model_type.objects.values_list("pk", flat=True)
+            )
+
+        # Verify final expectations
+        assert submodel_types == expected_types
+
+    @pytest.mark.parametrize(
+        "question_type",
+        [
+            NationalFrameworkQuestion,
+            KeyAgencyActionsQuestion,
+            EvolutionQuestion,
+            LinkagesQuestion,
+        ],
+    )
+    def test_get_submodel_type(self, question_type: Type[Question]):
+        q_pk = str(question_type.objects.first().pk)
+        assert get_submodel_type(Question, q_pk) is question_type
+
+    def test_get_submodel_type_unknown_pk_returns_none(self):
+        assert get_submodel_type(Question, "42") is None
+
+    def test_get_instances_as_submodel_type(
+        self, django_assert_num_queries: pytest.fixture
+    ):
+        # Define test data
+        questions = list(Question.objects.all())
+
+        # Run test (one query to find the types, one per question subtype).
+        with django_assert_num_queries(1 + len(get_submodel_type_list(Question))):
+            st_questions = get_instances_as_submodel_type(questions)
+
+        # Verify final expectations
+        assert [q.pk for q in st_questions] == [q.pk for q in questions]
+        assert all(
+            type(st_q) is get_submodel_type(Question, st_q.pk) for st_q in st_questions
+        )
+
+    def test_get_instance_as_submodel_type(self):
+        answer = Answer.objects.get(pk=EvolutionAnswer.objects.first().pk)
+        st_answer = get_instance_as_submodel_type(answer)
+        assert isinstance(st_answer, EvolutionAnswer)
+        assert st_answer.selected_choice == EvolutionChoiceType.NASCENT
+
+    def test_get_instance_as_submodel_type_already_submodel(self):
+        st_answer = EvolutionAnswer.objects.first()
+        assert get_instance_as_submodel_type(st_answer) == st_answer
+
+
+@pytest.mark.django_db
+class TestBulkCreateSubmodelInstances:
+    def test_bulk_create_submodel_instances(self):
+        # Define test data
+        question = NationalFrameworkQuestion.objects.first()
+        users = list(EpicUser.objects.exclude(user_answers__question=question))
+        answers = [
+            AgreementAnswer(
+                user=e_user, question=question, selected_choice=AgreementAnswerType.DIS
+            )
+            for e_user in users
+        ]
+
+        # Run test
+        created_answers = bulk_create_submodel_instances(
+            AgreementAnswer, answers, batch_size=2
+        )
+
+        # Verify final expectations
+        assert created_answers == answers
+        assert all(a.pk is not None for a in created_answers)
+        db_answers = AgreementAnswer.objects.in_bulk([a.pk for a in created_answers])
+        assert len(db_answers) == len(users)
+        assert all(
+            db_answers[a.pk].user_id == a.user_id
+            and db_answers[a.pk].selected_choice == AgreementAnswerType.DIS
+            for a in created_answers
+        )
+        assert get_submodel_types(Answer, db_answers.keys()) == {
+            a_pk: AgreementAnswer for a_pk in db_answers
+        }
+
+    def test_bulk_create_submodel_instances_empty_list(
+        self, django_assert_num_queries: pytest.fixture
+    ):
+        with django_assert_num_queries(0):
+            assert bulk_create_submodel_instances(EvolutionAnswer, []) == []
+
+    def test_bulk_create_submodel_instances_users(self):
+        # Define test data
+        organization = EpicOrganization.objects.first()
+        users = [
+            EpicUser(username=f"bulk_user_{n}", organization=organization)
+            for n in range(3)
+        ]
+
+        # Run test
+        bulk_create_submodel_instances(EpicUser, users)
+
+        # Verify final expectations
+        assert EpicUser.objects.filter(username__startswith="bulk_user_").count() == 3
@@ -12,12 +12,14 @@ router = routers.DefaultRouter()
 # User url's
 router.register(r"epicorganization", views.EpicOrganizationViewSet)
 router.register(r"epicuser", views.EpicUserViewSet)
+router.register(r"reportjob", views.ReportJobViewSet)
 
 # Readonly Epic Domain
 router.register(r"area", views.AreaViewSet)
 router.register(r"agency", views.AgencyViewSet)
 router.register(r"group", views.GroupViewSet)
 router.register(r"program", views.ProgramViewSet)
+router.register(r"domain", views.DomainViewSet, basename="domain")
 
 # Question / answer endpoints
 router.register(r"question", views.QuestionViewSet)
@@ -1,7 +1,7 @@
 import itertools
-from typing import List, Type
+from typing import Any, Dict, Iterable, List, Optional, Type
 
-from django.db import models
+from django.db import connections, models, router, transaction
 
 
 def get_submodel_type_list(model: Type[models.Model]) -> List[Type[models.Model]]:
@@ -23,18 +23,154 @@ def get_submodel_type_list(model: Type[models.Model]) -> List[Type[models.Model]
     return list(itertools.chain(*subtypes))
 
 
-def get_submodel_type(model_type: Type[models.Model], pk: str) -> Type[models.Model]:
+def _get_submodel_lookup(
+    model_type: Type[models.Model], submodel_type: Type[models.Model]
+) -> str:
+    """
+    Gets the query lookup that joins a base model with one of its (multi-table inherited) submodels.
+    """
+    lookups = []
+    current_type = submodel_type
+    while current_type is not model_type:
+        parent_type = next(
+            p_type
+            for p_type in current_type._meta.parents
+            if issubclass(p_type, model_type)
+        )
+        parent_link = current_type._meta.parents[parent_type]
+        lookups.insert(0, parent_link.related_query_name())
+        current_type = parent_type
+    return "__".join(lookups)
+
+
+def get_submodel_types(
+    model_type: Type[models.Model], pks: Iterable[Any]
+) -> Dict[Any, Optional[Type[models.Model]]]:
+    """
+    Gets the submodel type of each of the provided primary keys with a single query joining all the submodel tables.
+
+    Args:
+        model_type (Type[models.Model]): Base model Type containing submodels.
+        pks (Iterable[Any]): Primary keys of the base model instances.
+
+    Returns:
+        Dict[Any, Optional[Type[models.Model]]]: Submodel type per found primary key, `None` when it has no submodel.
+    """
     l_subtypes = get_submodel_type_list(model_type)
-    sm_type = next(
-        (q_t for q_t in l_subtypes if q_t.objects.filter(pk=pk).exists()),
-        None,
+    subtype_lookups = [
+        f"{_get_submodel_lookup(model_type, q_t)}__pk" for q_t in l_subtypes
+    ]
+    submodel_types = {}
+    for pk, *subtype_pks in model_type.objects.filter(pk__in=pks).values_list(
+        "pk", *subtype_lookups
+    ):
+        submodel_types[pk] = next(
+            (q_t for q_t, st_pk in zip(l_subtypes, subtype_pks) if st_pk is not None),
+            None,
+        )
+    return submodel_types
+
+
+def get_submodel_type(model_type: Type[models.Model], pk: str) -> Type[models.Model]:
+    return next(iter(get_submodel_types(model_type, [pk]).values()), None)
+
+
+def get_instances_as_submodel_type(
+    model_instances: Iterable[models.Model],
+) -> List[models.Model]:
+    """
+    Gets the equivalent of all instances as their submodels. It requires one query to resolve the types plus one per found submodel type.
+    Instances without submodel are returned as they are.
+
+    Args:
+        model_instances (Iterable[models.Model]): Instances of the same base model.
+
+    Returns:
+        List[models.Model]: Submodel instances in the same order as the provided ones.
+    """
+    model_instances = list(model_instances)
+    if not model_instances:
+        return []
+    submodel_types = get_submodel_types(
+        type(model_instances[0]), [mi.pk for mi in model_instances]
     )
-    return sm_type
+    submodel_pks: Dict[Type[models.Model], List[Any]] = {}
+    for pk, submodel_type in submodel_types.items():
+        if submodel_type:
+            submodel_pks.setdefault(submodel_type, []).append(pk)
+    submodel_instances = {}
+    for submodel_type, sm_pks in submodel_pks.items():
+        submodel_instances.update(submodel_type.objects.in_bulk(sm_pks))
+    return [submodel_instances.get(mi.pk, mi) for mi in model_instances]
 
 
 def get_instance_as_submodel_type(model_instance: models.Model) -> models.Model:
     """
     Gets the instance equivalent as a submodel. This model is done to avoid using the polymorphic library for django.
     """
-    submodel_type = get_submodel_type(type(model_instance), model_instance.pk)
-    return submodel_type.objects.get(pk=model_instance.pk)
+    return get_instances_as_submodel_type([model_instance])[0]
+
+
+def bulk_create_submodel_instances(
+    submodel_type: Type[models.Model],
+    instances: Iterable[models.Model],
+    batch_size: Optional[int] = None,
+) -> List[models.Model]:
+    """
+    Creates instances of a (multi-table inherited) submodel in bulk, as Django's `bulk_create` does not support them.
+    The parent rows are bulk created first and then the submodel rows are inserted with their parent link, all in one transaction.
+    Note that overriden `save` methods are not invoked.
+
+    Args:
+        submodel_type (Type[models.Model]): Submodel type with a single concrete parent.
+        instances (Iterable[models.Model]): Unsaved instances of the submodel.
+        batch_size (Optional[int], optional): Maximum number of rows per insert. Defaults to None (as many as the database allows).
+
+    Raises:
+        ValueError: When the submodel type has more than one level of concrete parents.
+
+    Returns:
+        List[models.Model]: The created instances with their primary key set.
+    """
+    instances = list(instances)
+    if not instances:
+        return instances
+    submodel_parents = submodel_type._meta.parents
+    parent_type, parent_link = next(iter(submodel_parents.items()))
+    if len(submodel_parents) != 1 or parent_type._meta.parents:
+        raise ValueError(
+            f"Only single level inheritance is supported, got {submodel_type.__name__}."
+        )
+
+    db_alias = router.db_for_write(submodel_type)
+    local_fields = submodel_type._meta.local_concrete_fields
+    if not batch_size:
+        batch_size = max(
+            connections[db_alias].ops.bulk_batch_size(local_fields, instances), 1
+        )
+    parent_instances = [
+        parent_type(
+            **{
+                p_field.attname: getattr(sm_instance, p_field.attname)
+                for p_field in parent_type._meta.concrete_fields
+            }
+        )
+        for sm_instance in instances
+    ]
+    with transaction.atomic(using=db_alias, savepoint=False):
+        parent_type.objects.using(db_alias).bulk_create(
+            parent_instances, batch_size=batch_size
+        )
+        for sm_instance, p_instance in zip(instances, parent_instances):
+            setattr(sm_instance, parent_type._meta.pk.attname, p_instance.pk)
+            setattr(sm_instance, parent_link.attname, p_instance.pk)
+        for n_first in range(0, len(instances), batch_size):
+            submodel_type._base_manager._insert(
+                instances[n_first : n_first + batch_size],
+                fields=local_fields,
+                using=db_alias,
+            )
+    for sm_instance in instances:
+        sm_instance._state.adding = False
+        sm_instance._state.db = db_alias
+    return instances
@@ -1,17 +1,22 @@
 # Create your views here.
 import io
-from typing import List, Type, Union
+from typing import Dict, List, Type, Union
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.http import FileResponse, HttpResponseForbidden
-from rest_framework import permissions, serializers, viewsets
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework import mixins, permissions, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from epic_app import epic_permissions
 from epic_app import serializers as epic_serializer
+from epic_app.domain_cache import DomainCache
+from epic_app.models.answer_tally import AnswerTallyChanges
+from epic_app.models.data_version import EpicDataVersion, EpicDataVersionName
 from epic_app.models.epic_answers import Answer
 from epic_app.models.epic_questions import (
     EvolutionQuestion,
@@ -22,8 +27,21 @@ from epic_app.models.epic_questions import (
 )
 from epic_app.models.epic_user import EpicOrganization, EpicUser
 from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.models.report_job import ReportJob
+from epic_app.pagination import AnswerCursorPagination, EpicUserCursorPagination
+from epic_app.report_cache import ReportCache
+from epic_app.serializers.domain_snapshot_serializer import get_domain_snapshot
 from epic_app.serializers.report_pdf import EpicPdfReport
-from epic_app.utils import get_submodel_type, get_submodel_type_list
+from epic_app.serializers.report_serializer import (
+    get_report_data,
+    get_report_organization_names,
+    get_report_summary,
+)
+from epic_app.utils import (
+    bulk_create_submodel_instances,
+    get_submodel_type,
+    get_submodel_type_list,
+)
 
 
 class EpicUserViewSet(viewsets.ReadOnlyModelViewSet):
@@ -34,6 +52,7 @@ class EpicUserViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = EpicUser.objects.all()
     serializer_class = epic_serializer.EpicUserSerializer
     permission_classes = [permissions.IsAdminUser]
+    pagination_class = EpicUserCursorPagination
 
     @action(
         methods=["put"],
@@ -61,6 +80,10 @@ class EpicUserViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(data=serializer.data)
 
 
+def _get_report_cache_headers(cache_hit: bool) -> Dict[str, str]:
+    return {"X-Report-Cache": "HIT" if cache_hit else "MISS"}
+
+
 class EpicOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `EpicOrganization` table.
@@ -80,23 +103,25 @@ class EpicOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
         """
         RETRIEVES all the `Answers` for each of the `Questions` filled by the `EpicUsers` of the requested `EpicOrganization`.
         """
-
-        def _filter_queryset() -> Union[models.QuerySet, List[EpicUser]]:
-            if bool(request.user.is_staff or request.user.is_superuser):
-                return EpicUser.objects.all()
-            else:
-                epic_org = request.user.epicuser.organization
-                return epic_org.organization_users
-
-        r_serializer = epic_serializer.ProgramReportSerializer(
-            Program.objects.all(),
-            many=True,
-            context={
-                "request": request,
-                "users": _filter_queryset(),
-            },
+        report_cache = ReportCache(request.user)
+        report_data, cache_hit = report_cache.get_or_set(
+            report_cache.get_key("json", request.build_absolute_uri("/")),
+            lambda: list(get_report_data(request.user, request)),
         )
-        return Response(r_serializer.data)
+        return Response(report_data, headers=_get_report_cache_headers(cache_hit))
+
+    @action(
+        detail=False,
+        url_path="report-summary",
+        url_name="report-summary",
+        permission_classes=[epic_permissions.IsAdminOrEpicAdvisor],
+    )
+    def get_answers_report_summary(self, request: Request) -> Response:
+        """
+        RETRIEVES the summary (without justifications) of the `Answers` to each of the `Questions` filled by the `EpicUsers` of the requested `EpicOrganization`.
+        Unlike the full report it is read from the answer tallies, so it does not depend on the number of users.
+        """
+        return Response(get_report_summary(request.user))
 
     @action(
         detail=False,
@@ -107,61 +132,133 @@ class EpicOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
     def get_answers_pdf_report(
         self, request: Request, pk: str = None
     ) -> models.QuerySet:
-        answer_report = self.get_answers_report(request, pk)
-
-        def get_organization() -> List[str]:
-            if bool(request.user.is_staff or request.user.is_superuser):
-                return [eo.name for eo in EpicOrganization.objects.all()]
-            return [request.user.epicuser.organization.name]
-
-        # Create a file-like buffer to receive PDF data.
-        buffer = io.BytesIO()
-        pdf_report = EpicPdfReport()
-        pdf_report.report_subtitle = "EPIC report for {}".format(
-            (", ").join(get_organization())
+        """
+        RETRIEVES the answers report as a PDF rendered within the request. For large reports prefer queueing a `ReportJob` (`/api/reportjob/`).
+        """
+
+        def generate_pdf_report() -> bytes:
+            # Create a file-like buffer to receive PDF data.
+            buffer = io.BytesIO()
+            pdf_report = EpicPdfReport()
+            pdf_report.report_subtitle = "EPIC report for {}".format(
+                (", ").join(get_report_organization_names(request.user))
+            )
+            pdf_report.report_author = request.user.username
+            pdf_report.generate_report(buffer, get_report_data(request.user))
+            return buffer.getvalue()
+
+        report_cache = ReportCache(request.user)
+        pdf_content, cache_hit = report_cache.get_or_set(
+            # The author is part of the report.
+            report_cache.get_key("pdf", request.user.pk),
+            generate_pdf_report,
+        )
+        pdf_response = FileResponse(
+            io.BytesIO(pdf_content), as_attachment=True, filename="answers_report.pdf"
+        )
+        for header, value in _get_report_cache_headers(cache_hit).items():
+            pdf_response[header] = value
+        return pdf_response
+
+    @action(detail=False, url_path="report-cache", url_name="report-cache")
+    def get_report_cache_stats(self, request: Request) -> Response:
+        """
+        RETRIEVES the number of reports served from (`hits`) and generated into (`misses`) the report cache, when counted (`enabled`).
+        """
+        return Response(ReportCache.get_stats())
+
+
+class ReportJobViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Acess point to queue PDF reports (`ReportJob`), follow their progress and download them once rendered by the `process_report_jobs` worker.
+    """
+
+    queryset = ReportJob.objects.all()
+    serializer_class = epic_serializer.ReportJobSerializer
+    permission_classes = [epic_permissions.IsAdminOrEpicAdvisor]
+
+    def get_queryset(self) -> models.QuerySet:
+        """
+        Only admins can retrieve the jobs queued by other users.
+        """
+        if self.request.user.is_staff or self.request.user.is_superuser:
+            return ReportJob.objects.all()
+        return ReportJob.objects.filter(user=self.request.user)
+
+    def perform_create(self, serializer: epic_serializer.ReportJobSerializer):
+        serializer.save(user=self.request.user)
+
+    @action(detail=True, url_path="download", url_name="download")
+    def download_report(self, request: Request, pk: str = None):
+        """
+        RETRIEVES the rendered PDF report of a `ReportJob`.
+        """
+        report_job: ReportJob = self.get_object()
+        report_path = report_job.get_report_path()
+        if not report_path:
+            return Response(
+                {"detail": f"Report not available, job status: {report_job.status}."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return FileResponse(
+            report_path.open("rb"), as_attachment=True, filename="answers_report.pdf"
         )
-        pdf_report.report_author = request.user.username
-        pdf_report.generate_report(buffer, answer_report.data)
-        buffer.seek(0)
-        return FileResponse(buffer, as_attachment=True, filename="answers_report.pdf")
 
 
-class AreaViewSet(viewsets.ReadOnlyModelViewSet):
+class _DomainCacheListMixin:
+    """
+    Lists the (read-only) domain entities from the `DomainCache`, as they only change on import.
+    """
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        domain_cache = DomainCache()
+        domain_data, cache_hit = domain_cache.get_or_set(
+            domain_cache.get_key(self.basename, request.build_absolute_uri()),
+            lambda: list(
+                super(_DomainCacheListMixin, self).list(request, *args, **kwargs).data
+            ),
+        )
+        return Response(
+            domain_data, headers={"X-Domain-Cache": "HIT" if cache_hit else "MISS"}
+        )
+
+
+class AreaViewSet(_DomainCacheListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Area` table.
     """
 
-    queryset = Area.objects.all().order_by("name")
+    queryset = Area.objects.prefetch_related("groups__programs").order_by("name")
     serializer_class = epic_serializer.AreaSerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
 
-class AgencyViewSet(viewsets.ReadOnlyModelViewSet):
+class AgencyViewSet(_DomainCacheListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Agency` table.
     """
 
-    queryset = Agency.objects.all().order_by("name")
+    queryset = Agency.objects.prefetch_related("programs").order_by("name")
     serializer_class = epic_serializer.AgencySerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
 
-class GroupViewSet(viewsets.ReadOnlyModelViewSet):
+class GroupViewSet(_DomainCacheListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Group` table.
     """
 
-    queryset = Group.objects.all().order_by("name")
+    queryset = Group.objects.prefetch_related("programs").order_by("name")
     serializer_class = epic_serializer.GroupSerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
 
-class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
+class ProgramViewSet(_DomainCacheListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Program` table.
     """
 
-    queryset = Program.objects.all()
+    queryset = Program.objects.prefetch_related("agencies", "questions")
     serializer_class = epic_serializer.ProgramSerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
@@ -184,6 +281,31 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
         )
         return Response(serializer.data)
 
+    @action(detail=False, url_path="progress", url_name="progress_list")
+    def get_progress_list(self, request: Request) -> Response:
+        """
+        Gets the percentage of answered questions of all `Program` for the `EpicUser` currently logged in.
+        The programs can be narrowed down with one or many `program` query parameters (`?program=1&program=2`).
+
+        Args:
+            request (Request): API Request.
+
+        Returns:
+            Response: Result of the serialised request to `ProgressSerializer` for each `Program`.
+        """
+        programs = Program.objects.prefetch_related("questions").order_by("pk")
+        program_ids = request.query_params.getlist("program")
+        if not all(p_id.isdigit() for p_id in program_ids):
+            raise serializers.ValidationError(
+                {"program": "Program ids should be integer values."}
+            )
+        if program_ids:
+            programs = programs.filter(pk__in=program_ids)
+        serializer = epic_serializer.ProgressSerializer(
+            programs, many=True, context={"request": request}
+        )
+        return Response(serializer.data)
+
     def _get_question(
         self, request: Request, question_type: Question, pk: str = None
     ) -> Response:
@@ -272,10 +394,50 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
         return self._get_question(request, LinkagesQuestion, pk)
 
 
+class DomainViewSet(viewsets.ViewSet):
+    """
+    Acess point to the whole (read-only) EPIC domain at once.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    # Part of the snapshot ETag, to be increased whenever the snapshot format changes.
+    snapshot_format = 1
+
+    @action(detail=False, url_path="snapshot", url_name="snapshot")
+    def get_snapshot(self, request: Request) -> Response:
+        """
+        RETRIEVES the full domain (areas, groups, programs with their questions by type, and agencies) in a single response.
+        The strong `ETag` changes with the domain version, so clients can revalidate with `If-None-Match` and get a `304` when nothing changed.
+        """
+        domain_cache = DomainCache()
+        snapshot_etag = quote_etag(
+            f"{self.snapshot_format}-{domain_cache.get_version()}"
+        )
+        snapshot_headers = {"ETag": snapshot_etag, "Cache-Control": "private, no-cache"}
+        not_modified_response = get_conditional_response(request, etag=snapshot_etag)
+        if not_modified_response is not None:
+            for header, value in snapshot_headers.items():
+                not_modified_response[header] = value
+            return not_modified_response
+        snapshot_data, cache_hit = domain_cache.get_or_set(
+            domain_cache.get_key("snapshot", self.snapshot_format),
+            get_domain_snapshot,
+        )
+        return Response(
+            snapshot_data,
+            headers={
+                **snapshot_headers,
+                "X-Domain-Cache": "HIT" if cache_hit else "MISS",
+            },
+        )
+
+
 class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Question.objects.all()
     serializer_class = epic_serializer.QuestionSerializer
     permissiion_classes = [permissions.DjangoModelPermissions]
+    # Times to try creating the missing answers while concurrent requests also create them.
+    _create_answers_attempts: int = 3
 
     @staticmethod
     def _get_related_answer_type(question_pk: str) -> Type[Answer]:
@@ -305,6 +467,78 @@ class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
             return EpicUser.objects.all()
         return EpicUser.objects.filter(pk=request.user.pk)
 
+    @staticmethod
+    def _create_missing_answers(
+        a_type: Type[Answer],
+        question_pk: str,
+        e_users: models.QuerySet,
+        e_user_organizations: Dict[int, int],
+    ):
+        question_answers = a_type.objects.filter(question_id=question_pk)
+        with transaction.atomic():
+            answered_user_ids = set(
+                question_answers.filter(user__in=e_users).values_list(
+                    "user_id", flat=True
+                )
+            )
+            created_answers = bulk_create_submodel_instances(
+                a_type,
+                [
+                    a_type(question_id=int(question_pk), user_id=e_user_id)
+                    for e_user_id in e_user_organizations
+                    if e_user_id not in answered_user_ids
+                ],
+            )
+            if created_answers:
+                # Bulk inserts do not send the `post_save` signal.
+                tally_changes = AnswerTallyChanges()
+                for answer in created_answers:
+                    tally_changes.add_answer(
+                        answer, e_user_organizations[answer.user_id]
+                    )
+                tally_changes.apply()
+                EpicDataVersion.renew(
+                    EpicDataVersionName.ANSWERS,
+                    {e_user_organizations[a.user_id] for a in created_answers},
+                )
+
+    @classmethod
+    def _get_or_create_users_answers(
+        cls, a_type: Type[Answer], question_pk: str, e_users: models.QuerySet
+    ) -> List[Answer]:
+        """
+        Gets the `Answer` of each of the given users to a question, creating the missing ones (empty) in bulk.
+        The number of queries does not depend on the number of users.
+
+        Args:
+            a_type (Type[Answer]): `Answer` subtype related to the question.
+            question_pk (str): Id of the `Question`.
+            e_users (models.QuerySet): `EpicUser` whose answers are requested.
+
+        Returns:
+            List[Answer]: One `Answer` per user, in the same order as `e_users`.
+        """
+        e_user_organizations = dict(e_users.values_list("pk", "organization_id"))
+        e_user_ids = list(e_user_organizations)
+        question_answers = a_type.objects.filter(question_id=question_pk)
+        for n_attempt in range(1, cls._create_answers_attempts + 1):
+            try:
+                cls._create_missing_answers(
+                    a_type, question_pk, e_users, e_user_organizations
+                )
+                break
+            except IntegrityError:
+                # Some answers were created by a concurrent request, read them again.
+                if n_attempt == cls._create_answers_attempts:
+                    raise
+        users_answers = {
+            answer.user_id: answer
+            for answer in question_answers.filter(user__in=e_users).prefetch_related(
+                *(m2m.name for m2m in a_type._meta.many_to_many)
+            )
+        }
+        return [users_answers[e_user_id] for e_user_id in e_user_ids]
+
     def retrieve(self, request, pk: str, *args, **kwargs):
         """
         Retrieves a `Question` serialized as its subtype definition.
@@ -332,18 +566,12 @@ class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
             pk (str, optional): `Answer` id. Defaults to None.
         """
 
-        def get_user_answer(epic_user: EpicUser) -> Answer:
-            a_instance, _ = a_type.objects.get_or_create(
-                question=Question.objects.get(pk=pk), user=epic_user
-            )
-            return a_instance
-
         e_users = self._get_epic_users_queryset(request)
         a_type = self._get_related_answer_type(question_pk=pk)
         a_serializer_type = epic_serializer.AnswerSerializer.get_concrete_serializer(
             a_type
         )
-        a_instances = [get_user_answer(e_user) for e_user in e_users]
+        a_instances = self._get_or_create_users_answers(a_type, pk, e_users)
         a_serializer = a_serializer_type(
             a_instances, many=True, context={"request": request}
         )
@@ -353,6 +581,7 @@ class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
 class AnswerViewSet(viewsets.ModelViewSet):
     queryset = Answer.objects.all()
     serializer_class = epic_serializer.AnswerSerializer
+    pagination_class = AnswerCursorPagination
 
     def get_permissions(self):
         """
@@ -361,8 +590,10 @@ class AnswerViewSet(viewsets.ModelViewSet):
         Returns:
             List[permissions.BasePermission]: List of permissions for the request being done.
         """
-        if not self.request.data.get("user", None) and getattr(
-            self.request.user, "epicuser", False
+        if (
+            isinstance(self.request.data, dict)
+            and not self.request.data.get("user", None)
+            and getattr(self.request.user, "epicuser", False)
         ):
             self.request.data["user"] = self.request.user.epicuser.id
         if self.request.method in ["DELETE", "PUT", "PATCH"]:
@@ -445,3 +676,25 @@ class AnswerViewSet(viewsets.ModelViewSet):
             epic_serializer.AnswerSerializer.get_concrete_serializer(a_subtype)
         )
         return super().create(request, *args, **kwargs)
+
+    @action(detail=False, methods=["post"], url_path="bulk", url_name="bulk")
+    def bulk_upsert(self, request: Request) -> Response:
+        """
+        CREATES or UPDATES at once a list of `Answer` (of any subtype) of the `EpicUser` doing the request, identified by their `question`.
+        All answers are validated and saved together, so either all of them or none are stored.
+        """
+        epic_user = getattr(request.user, "epicuser", None)
+        if not epic_user:
+            return HttpResponseForbidden()
+        bulk_serializer = epic_serializer.BulkAnswerSerializer(
+            data=request.data, many=True, context={"user": epic_user}
+        )
+        bulk_serializer.is_valid(raise_exception=True)
+        return Response(
+            [
+                epic_serializer.AnswerSerializer.get_concrete_serializer(type(answer))(
+                    answer, context={"request": request}
+                ).data
+                for answer in bulk_serializer.save()
+            ]
+        )
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.0/ref/settings/
 """
 
 import os
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -68,6 +69,7 @@ REST_FRAMEWORK = {
 # endregion
 
 MIDDLEWARE = [
+    "epic_app.request_instrumentation.RequestInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -171,3 +173,57 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+def _get_environ_flag(flag_name: str) -> bool:
+    # Only explicit values enable a flag, so that e.g. "0" or "false" keep it disabled.
+    return os.environ.get(flag_name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+# Directory where the queued PDF reports (`ReportJob`) are rendered by the `process_report_jobs` worker.
+EPIC_REPORTS_DIR = Path(
+    os.environ.get(
+        "EPIC_REPORTS_DIR", Path(tempfile.gettempdir()).joinpath("epic_reports")
+    )
+)
+# Seconds the finished report jobs (and their reports) are kept, one week by default.
+EPIC_REPORTS_RETENTION = float(
+    os.environ.get("EPIC_REPORTS_RETENTION", 7 * 24 * 60 * 60)
+)
+
+# Generated reports are cached in disk so they can be shared between workers.
+EPIC_REPORTS_CACHE = "reports"
+# Opt-in counting of the report cache hits and misses, it turns every cached read into a database write.
+EPIC_REPORTS_CACHE_STATS = _get_environ_flag("EPIC_REPORTS_CACHE_STATS")
+# Serialized domain trees are small and cheap to rebuild, so each worker keeps its own copy.
+EPIC_DOMAIN_CACHE = "default"
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    EPIC_REPORTS_CACHE: {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": EPIC_REPORTS_DIR.joinpath("cache"),
+        "TIMEOUT": 60 * 60 * 24,
+    },
+}
+
+
+# Opt-in instrumentation of the requests (`Server-Timing` headers and one log line per request).
+EPIC_REQUEST_INSTRUMENTATION = _get_environ_flag("EPIC_REQUEST_INSTRUMENTATION")
+# Requests slower than the threshold (seconds) also log their most repeated SQL statements.
+EPIC_SLOW_REQUEST_THRESHOLD = float(os.environ.get("EPIC_SLOW_REQUEST_THRESHOLD", 1.0))
+EPIC_SLOW_REQUEST_TOP_QUERIES = 5
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "epic_app.request_instrumentation": {
+            "handlers": ["console"],
+            "level": "INFO",
+        },
+    },
+}
@@ -5,5 +5,7 @@ git pull
 poetry install
 poetry run python3 manage.py makemigrations
 poetry run python3 manage.py migrate
+poetry run python3 manage.py fill_linkages_programs
+poetry run python3 manage.py rebuild_answer_tallies
 poetry run python3 manage.py collectstatic --noinput
 poetry run gunicorn epic_core.wsgi &
\ No newline at end of file